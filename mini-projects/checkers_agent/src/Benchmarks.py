@@ -0,0 +1,689 @@
+import argparse
+import json
+import multiprocessing
+import platform
+import sys
+import time
+
+from SearchToolBox import *
+from GameBoard import *
+
+# Fixed test positions, black (bot) to move. Rows top to bottom:
+# b/w = black/white man, B/W = black/white king, . = empty.
+STANDARD_POSITIONS = {
+    "opening": [
+        ".b.b.b.b",
+        "b.b.b.b.",
+        ".b.b.b.b",
+        "........",
+        "........",
+        "w.w.w.w.",
+        ".w.w.w.w",
+        "w.w.w.w.",
+    ],
+    "middlegame": [
+        ".b.b.b.b",
+        "b.b...b.",
+        ".b...b..",
+        "..b.b...",
+        "...w.w..",
+        "w.....w.",
+        ".w.w.w.w",
+        "w.w...w.",
+    ],
+    "endgame": [
+        "........",
+        "..b.....",
+        "...B....",
+        "........",
+        ".....W..",
+        "..w.....",
+        ".......w",
+        "........",
+    ],
+}
+
+PIECE_SYMBOLS = {".": 0, "w": 1, "W": 2, "b": -1, "B": -2}
+
+# Fixed search depth per strategy in the benchmark suite
+SUITE_DEPTHS = {"minimax": 5, "alphabeta": 7, "alphabeta_ordering": 8, "parallel": 8}
+
+# Perft depth of the benchmark suite
+SUITE_PERFT_DEPTH = 7
+
+# Relative nodes/second loss tolerated by CompareResults
+REGRESSION_TOLERANCE = 0.2
+
+# Entries faster than this are too noisy to compare
+MIN_COMPARE_SECONDS = 0.1
+
+# Strategies whose suite timings are mostly process pool startup and IPC:
+# CompareResults checks their node counts but not their speed
+SPEED_UNCOMPARED_STRATEGIES = ("parallel",)
+
+# Fewest suite repeats (best run kept) for --compare to be meaningful
+MIN_COMPARE_REPEATS = 3
+
+
+def CalibrationSpeed(repeats=3):
+    """
+    Speed of the machine on a fixed pure-Python workload (loops/second).
+
+    Rates are divided by it before comparing two suite results, so a
+    slower or busier machine does not read as a regression.
+    """
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        board = [[(row + col) % 5 - 2 for col in range(8)] for row in range(8)]
+        total = 0
+        for _ in range(20000):
+            for row in board:
+                for piece in row:
+                    if piece * 2 > 0:
+                        total += piece
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return 20000 / best
+
+
+def ParsePosition(rows):
+    """Builds a GameBoard from eight row strings using PIECE_SYMBOLS."""
+    return GameBoard([[PIECE_SYMBOLS[symbol] for symbol in row] for row in rows])
+
+
+def Perft(board, depth, player=1):
+    """Counts the move sequences of the given length from board, player to move."""
+    if depth == 0:
+        return 1
+    moves = board.GetAllPossibleMoves(player)
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        undo = board.MakeMove(move)
+        nodes += Perft(board, depth - 1, -player)
+        board.UnmakeMove(undo)
+    return nodes
+
+
+def CompareResults(current, baseline, tolerance=REGRESSION_TOLERANCE):
+    """
+    Compares two RunSuite results and returns the list of regressions.
+
+    - A perft or search entry is a regression when its nodes/second,
+      scaled by the machine calibration speed of each run, fell by more
+      than tolerance (a share, 0.2 = 20%)
+    - Entries shorter than MIN_COMPARE_SECONDS, and the searches of
+      SPEED_UNCOMPARED_STRATEGIES, are only checked for node counts
+    - Different node counts are reported too: perft counts must never
+      change, and a search that explores a different tree is not comparable
+    """
+    scale = baseline["machine"]["calibration"] / current["machine"]["calibration"]
+    regressions = []
+    for section in ("perft", "searches"):
+        for key, entry in baseline.get(section, {}).items():
+            result = current.get(section, {}).get(key)
+            if result is None:
+                continue
+            if result["nodes"] != entry["nodes"]:
+                regressions.append(f"{section} {key}: {result['nodes']:,} nodes, was {entry['nodes']:,}")
+                continue
+            if min(result["seconds"], entry["seconds"]) < MIN_COMPARE_SECONDS:
+                continue
+            if section == "searches" and key.split("/")[0] in SPEED_UNCOMPARED_STRATEGIES:
+                continue
+            speed = result["nodes_per_second"] * scale
+            if speed < entry["nodes_per_second"] * (1 - tolerance):
+                regressions.append(f"{section} {key}: {speed:,.0f} n/s (calibrated), "
+                                   f"was {entry['nodes_per_second']:,.0f} n/s")
+    return regressions
+
+
+class Benchmarks:
+    """
+    Headless speed measurements for GameBoard and SearchToolBox.
+
+    Searches run to a fixed depth with an unreachable time limit so that
+    every configuration explores the same tree, and the toolboxes get a
+    NullSink so no telemetry or console I/O skews the timings.
+    """
+    def __init__(self, depth=5, positions=None):
+        self.depth = depth
+        self.positions = positions or STANDARD_POSITIONS
+
+    def RunSearch(self, board, strategy, depth, time_limit=10 ** 6, **toolbox_options):
+        """
+        Runs one ChooseMove and returns its statistics.
+
+        The search is fixed-depth unless a time_limit is given.
+        toolbox_options are SearchToolBox attributes (use_make_unmake,
+        use_pvs, workers, ...) set on a fresh toolbox before searching.
+        """
+        toolbox = SearchToolBox(time_limit=time_limit, max_depth=depth)
+        toolbox.telemetry = NullSink()
+        for name, value in toolbox_options.items():
+            setattr(toolbox, name, value)
+        start = time.perf_counter()
+        move, score = toolbox.ChooseMove(board, strategy)
+        seconds = time.perf_counter() - start
+        toolbox.Close()
+        return {
+            "move": move,
+            "score": score,
+            "nodes": toolbox.nodes_expanded,
+            "pruning": toolbox.pruning_count,
+            "seconds": seconds,
+            "nodes_per_second": toolbox.nodes_expanded / seconds if seconds > 0 else 0.0,
+            "quiescence_nodes": toolbox.quiescence_nodes,
+            "moves_generated": toolbox.moves_generated,
+            "playouts": toolbox.playouts,
+            "evaluation_cache_hits": toolbox.evaluation_cache_hits,
+            "evaluation_cache_misses": toolbox.evaluation_cache_misses,
+            "playouts_per_second": toolbox.playouts_per_second,
+            "depth_statistics": toolbox.depth_statistics,
+            "depth_reached": toolbox.depth_statistics[-1]["depth"] if toolbox.depth_statistics else 0,
+        }
+
+    def PerftBenchmark(self, max_depth=None):
+        """
+        Move-generation node counts and speed from the initial position.
+
+        Perft counts every legal move sequence of depth 1..max_depth (white
+        moves first) with GameBoard and BitBoard; the counts must agree and
+        are the reference for any change to move generation.
+        """
+        max_depth = max_depth or self.depth
+        results = {}
+        print(f"Perft benchmark: initial position, depth 1-{max_depth}")
+        for depth in range(1, max_depth + 1):
+            results[depth] = {}
+            for board_class in (GameBoard, BitBoard):
+                board = board_class.FromGameBoard(GameBoard()) if board_class is BitBoard else GameBoard()
+                start = time.perf_counter()
+                nodes = Perft(board, depth)
+                seconds = time.perf_counter() - start
+                results[depth][board_class.__name__] = {"nodes": nodes, "seconds": seconds}
+            game_board, bit_board = results[depth]["GameBoard"], results[depth]["BitBoard"]
+            print(f"  depth {depth:>2} {game_board['nodes']:>12,} nodes | "
+                  f"GameBoard {game_board['nodes'] / max(game_board['seconds'], 1e-9):>11,.0f} n/s | "
+                  f"BitBoard {bit_board['nodes'] / max(bit_board['seconds'], 1e-9):>11,.0f} n/s")
+            if game_board["nodes"] != bit_board["nodes"]:
+                print(f"  WARNING: BitBoard counted {bit_board['nodes']:,} nodes at depth {depth}")
+        return results
+
+    def MakeUnmakeBenchmark(self, strategy="alphabeta"):
+        """
+        Compares cloning every node (ApplyMove) against in-place MakeMove/UnmakeMove.
+
+        Both modes must pick the same move with the same node count; only
+        the nodes/second rate should change.
+        """
+        results = {}
+        print(f"Make/unmake benchmark: {strategy}, depth {self.depth}")
+        for name, rows in self.positions.items():
+            board = ParsePosition(rows)
+            before = self.RunSearch(board, strategy, self.depth, use_make_unmake=False)
+            after = self.RunSearch(board, strategy, self.depth, use_make_unmake=True)
+            speedup = after["nodes_per_second"] / before["nodes_per_second"] if before["nodes_per_second"] else 0.0
+            results[name] = {"apply_move": before, "make_unmake": after, "speedup": speedup}
+            print(f"  {name:<11} {before['nodes']:>8,} nodes | "
+                  f"ApplyMove {before['nodes_per_second']:>9,.0f} n/s | "
+                  f"MakeMove {after['nodes_per_second']:>9,.0f} n/s | x{speedup:.2f}")
+            if before["move"] != after["move"] or before["nodes"] != after["nodes"]:
+                print(f"  WARNING: {name} searched differently with make/unmake")
+        return results
+
+    def IterativeDeepeningBenchmark(self, strategy="alphabeta_ordering"):
+        """
+        Time-to-depth with and without reuse between iterations.
+
+        "baseline" turns off principal variation search, aspiration windows
+        and PV/root-ranking reuse; the next three rows turn on one of them
+        each, and "all" is the default configuration. Cumulative nodes and
+        elapsed time are listed for every depth.
+
+        Only alphabeta_ordering has these features; other strategies raise
+        ValueError. The result is mixed: PVS saves nodes on the larger
+        opening tree, but on small trees its re-searches and failed
+        aspiration windows cost slightly more than they save, and PV reuse
+        adds nothing over the hash move.
+        """
+        if strategy != "alphabeta_ordering":
+            raise ValueError(f"{strategy} has no PVS, aspiration windows or PV reuse; use alphabeta_ordering")
+        baseline = {"use_pvs": False, "use_aspiration": False, "reuse_pv": False}
+        configurations = {
+            "baseline": baseline,
+            "pvs": dict(baseline, use_pvs=True),
+            "aspiration": dict(baseline, use_aspiration=True),
+            "pv reuse": dict(baseline, reuse_pv=True),
+            "all": {},
+        }
+        results = {}
+        print(f"Iterative deepening benchmark: {strategy}, depth {self.depth}")
+        for name, rows in self.positions.items():
+            results[name] = {}
+            for label, options in configurations.items():
+                run = self.RunSearch(ParsePosition(rows), strategy, self.depth, **options)
+                results[name][label] = run
+                total = 0
+                steps = []
+                for entry in run["depth_statistics"]:
+                    total += entry["nodes"]
+                    steps.append(f"d{entry['depth']}:{total:,}/{entry['elapsed']:.2f}s")
+                print(f"  {name:<11} {label:<10} " + "  ".join(steps))
+        return results
+
+    def QuiescenceBenchmark(self, strategy="alphabeta_ordering"):
+        """
+        Cost and effect of the quiescence extension at a fixed depth.
+
+        Lists nodes, quiescence nodes, time and the chosen move with and
+        without quiescence, next to a search two plies deeper without it
+        as a reference for the tactically better move.
+        """
+        results = {}
+        print(f"Quiescence benchmark: {strategy}, depth {self.depth}")
+        for name, rows in self.positions.items():
+            board = ParsePosition(rows)
+            runs = {
+                "off": self.RunSearch(board, strategy, self.depth, use_quiescence=False),
+                "on": self.RunSearch(board, strategy, self.depth, use_quiescence=True),
+                f"off d{self.depth + 2}": self.RunSearch(board, strategy, self.depth + 2, use_quiescence=False),
+            }
+            results[name] = runs
+            for label, run in runs.items():
+                print(f"  {name:<11} {label:<7} {run['nodes']:>9,} nodes {run['quiescence_nodes']:>8,} q-nodes "
+                      f"{run['seconds']:>7.2f}s  move {FormatMove(run['move'])} score {run['score']:.2f}")
+        return results
+
+    def StagedMovesBenchmark(self, strategy="alphabeta_ordering"):
+        """
+        Move generation saved by the staged move picker at a fixed depth.
+
+        Lists nodes, moves generated (full lists versus stages), the share
+        of generation saved and time, with use_staged_moves off and on.
+        Move ordering only differs in the order of the two killer moves,
+        so scores are equal and node counts close.
+        """
+        results = {}
+        print(f"Staged move generation benchmark: {strategy}, depth {self.depth}")
+        for name, rows in self.positions.items():
+            board = ParsePosition(rows)
+            runs = {label: self.RunSearch(board, strategy, self.depth, use_staged_moves=staged)
+                    for label, staged in (("lists", False), ("staged", True))}
+            saved = 1 - runs["staged"]["moves_generated"] / max(runs["lists"]["moves_generated"], 1)
+            results[name] = {label: {"nodes": run["nodes"], "moves_generated": run["moves_generated"],
+                                     "seconds": run["seconds"], "score": run["score"]}
+                             for label, run in runs.items()}
+            results[name]["saved"] = saved
+            for label, run in runs.items():
+                print(f"  {name:<11} {label:<7} {run['nodes']:>9,} nodes {run['moves_generated']:>10,} moves generated "
+                      f"{run['seconds']:>7.2f}s  score {run['score']:.2f}")
+            print(f"  {name:<11} saved   {saved:.1%} of move generation, "
+                  f"x{runs['lists']['seconds'] / max(runs['staged']['seconds'], 1e-9):.2f} time")
+        return results
+
+    def SelectiveSearchBenchmark(self, strategy="alphabeta_ordering", time_limit=2):
+        """
+        Effect of late move reductions, futility pruning and razoring.
+
+        Each configuration adds one part of the selective search. Lists
+        nodes, time and score at the fixed depth, and the depth completed
+        within time_limit seconds (the effective depth gained at equal
+        time).
+        """
+        configurations = {
+            "off": {},
+            "lmr": {"use_late_move_reductions": True},
+            "futility": {"use_futility_pruning": True},
+            "razoring": {"use_razoring": True},
+            "all": {"use_late_move_reductions": True, "use_futility_pruning": True, "use_razoring": True},
+        }
+        results = {}
+        print(f"Selective search benchmark: {strategy}, depth {self.depth}, {time_limit}s for depth reached")
+        for name, rows in self.positions.items():
+            board = ParsePosition(rows)
+            results[name] = {}
+            for label, options in configurations.items():
+                fixed = self.RunSearch(board, strategy, self.depth, **options)
+                timed = self.RunSearch(board, strategy, MAX_PLY, time_limit, **options)
+                results[name][label] = {"nodes": fixed["nodes"], "seconds": fixed["seconds"], "score": fixed["score"],
+                                        "depth_reached": timed["depth_reached"]}
+                print(f"  {name:<11} {label:<9} {fixed['nodes']:>9,} nodes {fixed['seconds']:>7.2f}s "
+                      f"score {fixed['score']:>7.2f} | depth {timed['depth_reached']:>2} in {time_limit}s")
+        return results
+
+    def MonteCarloBenchmark(self, time_limit=2, worker_counts=None):
+        """
+        Throughput of the Monte Carlo search next to alpha-beta at equal time.
+
+        For every position, alpha-beta with ordering runs for time_limit
+        seconds, then MCTS with each worker count (default 1 and all
+        cores). nodes/second counts tree nodes plus playout plies for MCTS,
+        so it compares with the alpha-beta node rate; playouts/second and
+        the moves chosen are listed too.
+        """
+        worker_counts = worker_counts or sorted({1, multiprocessing.cpu_count()})
+        results = {}
+        print(f"Monte Carlo benchmark: {time_limit}s per search, workers {worker_counts}")
+        for name, rows in self.positions.items():
+            board = ParsePosition(rows)
+            runs = {"alphabeta_ordering": self.RunSearch(board, "alphabeta_ordering", MAX_PLY, time_limit)}
+            for workers in worker_counts:
+                runs[f"mcts x{workers}"] = self.RunSearch(board, "mcts", MAX_PLY, time_limit, workers=workers)
+            results[name] = {label: {"nodes": run["nodes"], "nodes_per_second": run["nodes_per_second"],
+                                     "playouts": run["playouts"], "playouts_per_second": run["playouts_per_second"],
+                                     "move": run["move"], "score": run["score"]}
+                             for label, run in runs.items()}
+            for label, run in runs.items():
+                playouts = f"{run['playouts_per_second']:>7,.0f} playouts/s" if run["playouts"] else f"depth {run['depth_reached']:>2}"
+                print(f"  {name:<11} {label:<18} {run['nodes_per_second']:>9,.0f} n/s  {playouts:<18} "
+                      f"move {FormatMove(run['move'])} score {run['score']:.2f}")
+        return results
+
+    def EvaluationCacheBenchmark(self, strategy="alphabeta_ordering", plies=12):
+        """
+        Effect of the evaluation cache, per position and over a game.
+
+        Every position is searched to the fixed depth with the cache off
+        and on, for the full and the incremental evaluation: nodes and
+        scores must be equal, time and hit rate are listed. Then one
+        toolbox plays `plies` moves of self-play from the start position,
+        so the cache also serves positions searched for earlier moves.
+        """
+        results = {"positions": {}, "game": {}}
+        print(f"Evaluation cache benchmark: {strategy}, depth {self.depth}")
+        for name, rows in self.positions.items():
+            results["positions"][name] = {}
+            for evaluation in ("full", "incremental"):
+                runs = {label: self.RunSearch(ParsePosition(rows), strategy, self.depth, evaluation=evaluation,
+                                              use_evaluation_cache=cached)
+                        for label, cached in (("off", False), ("on", True))}
+                on = runs["on"]
+                probes = on["evaluation_cache_hits"] + on["evaluation_cache_misses"]
+                hit_rate = 100.0 * on["evaluation_cache_hits"] / probes if probes else 0.0
+                results["positions"][name][evaluation] = {
+                    label: {"nodes": run["nodes"], "seconds": run["seconds"], "score": run["score"]}
+                    for label, run in runs.items()}
+                results["positions"][name][evaluation]["hit_rate"] = hit_rate
+                print(f"  {name:<11} {evaluation:<11} {on['nodes']:>9,} nodes | off {runs['off']['seconds']:>7.3f}s | "
+                      f"on {on['seconds']:>7.3f}s | {hit_rate:5.1f}% hits")
+                if runs["off"]["nodes"] != on["nodes"] or runs["off"]["score"] != on["score"]:
+                    print(f"  WARNING: {name} searched differently with the evaluation cache")
+        for evaluation in ("full", "incremental"):
+            results["game"][evaluation] = {}
+            for label, cached in (("off", False), ("on", True)):
+                toolbox = SearchToolBox(time_limit=10 ** 6, max_depth=self.depth, evaluation=evaluation)
+                toolbox.telemetry = NullSink()
+                toolbox.use_evaluation_cache = cached
+                board, player = GameBoard(), 1
+                seconds, hits, misses = 0.0, 0, 0
+                for _ in range(plies):
+                    start = time.perf_counter()
+                    move, _ = toolbox.ChooseMove(board, strategy, player)
+                    seconds += time.perf_counter() - start
+                    hits += toolbox.evaluation_cache_hits
+                    misses += toolbox.evaluation_cache_misses
+                    if move is None:
+                        break
+                    board, player = board.ApplyMove(move), -player
+                hit_rate = 100.0 * hits / (hits + misses) if hits + misses else 0.0
+                results["game"][evaluation][label] = {"seconds": seconds, "hit_rate": hit_rate}
+            game = results["game"][evaluation]
+            print(f"  {plies}-ply game {evaluation:<11} off {game['off']['seconds']:>7.2f}s | "
+                  f"on {game['on']['seconds']:>7.2f}s | {game['on']['hit_rate']:5.1f}% hits")
+        return results
+
+    def ParallelScalingBenchmark(self, worker_counts=None, time_limit=2):
+        """
+        Speedup and depth reached by the parallel search per worker count.
+
+        - speedup: time to finish self.depth with the sequential
+          alpha-beta with ordering search, divided by the parallel time
+        - depth: deepest depth completed by all workers within time_limit
+        Worker counts above the number of cores only add process overhead.
+        """
+        worker_counts = worker_counts or sorted({1, 2, 4, multiprocessing.cpu_count()})
+        results = {}
+        print(f"Parallel scaling benchmark: depth {self.depth}, {time_limit}s for depth reached, "
+              f"{multiprocessing.cpu_count()} cores")
+        for name, rows in self.positions.items():
+            board = ParsePosition(rows)
+            sequential = self.RunSearch(board, "alphabeta_ordering", self.depth)
+            timed = self.RunSearch(board, "alphabeta_ordering", MAX_PLY, time_limit=time_limit)
+            results[name] = {"sequential": {"fixed_depth": sequential, "timed": timed}}
+            print(f"  {name:<11} sequential {sequential['seconds']:>7.2f}s | depth {timed['depth_reached']:>2}")
+            for workers in worker_counts:
+                parallel = self.RunSearch(board, "parallel", self.depth, workers=workers)
+                timed = self.RunSearch(board, "parallel", MAX_PLY, time_limit=time_limit, workers=workers)
+                speedup = sequential["seconds"] / parallel["seconds"] if parallel["seconds"] else 0.0
+                results[name][workers] = {"fixed_depth": parallel, "timed": timed, "speedup": speedup}
+                print(f"  {name:<11} {workers:>2} workers {parallel['seconds']:>7.2f}s | "
+                      f"depth {timed['depth_reached']:>2} | x{speedup:.2f}")
+                if parallel["move"] != sequential["move"]:
+                    print(f"  NOTE: {name} picked a different move with {workers} workers")
+        return results
+
+    def RunSuite(self, strategies=None, repeats=MIN_COMPARE_REPEATS):
+        """
+        Machine-readable benchmark of move generation and every strategy.
+
+        Returns a JSON-serialisable dictionary with:
+        - perft: GameBoard and BitBoard node counts and nodes/second at
+          SUITE_PERFT_DEPTH from the initial position
+        - searches: for each "strategy/position", a fixed-depth search
+          (SUITE_DEPTHS) with nodes, nodes/second, time to each depth,
+          effective branching factor (nodes ** (1 / depth) of the last
+          iteration) and pruning ratio (cutoffs per expanded node)
+        Timings are the best of `repeats` runs to damp machine noise (the
+        count is recorded under "machine").
+        """
+        strategies = strategies or list(SUITE_DEPTHS)
+        results = {
+            "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                        "cores": multiprocessing.cpu_count(), "repeats": repeats},
+            "perft": {},
+            "searches": {},
+        }
+        calibration = CalibrationSpeed()
+        for board_class in (GameBoard, BitBoard):
+            best = None
+            for _ in range(repeats):
+                board = board_class.FromGameBoard(GameBoard()) if board_class is BitBoard else GameBoard()
+                start = time.perf_counter()
+                nodes = Perft(board, SUITE_PERFT_DEPTH)
+                seconds = time.perf_counter() - start
+                best = seconds if best is None else min(best, seconds)
+            results["perft"][f"{board_class.__name__}/{SUITE_PERFT_DEPTH}"] = {
+                "nodes": nodes, "seconds": best, "nodes_per_second": nodes / best if best > 0 else 0.0}
+
+        for strategy in strategies:
+            depth = SUITE_DEPTHS.get(strategy, self.depth)
+            for name, rows in self.positions.items():
+                runs = [self.RunSearch(ParsePosition(rows), strategy, depth) for _ in range(repeats)]
+                run = min(runs, key=lambda result: result["seconds"])
+                last_nodes = run["depth_statistics"][-1]["nodes"] if run["depth_statistics"] else 0
+                results["searches"][f"{strategy}/{name}"] = {
+                    "depth": depth,
+                    "move": run["move"],
+                    "score": run["score"],
+                    "nodes": run["nodes"],
+                    "quiescence_nodes": run["quiescence_nodes"],
+                    "moves_generated": run["moves_generated"],
+                    "seconds": run["seconds"],
+                    "nodes_per_second": run["nodes_per_second"],
+                    "time_to_depth": {entry["depth"]: entry["elapsed"] for entry in run["depth_statistics"]},
+                    "branching_factor": last_nodes ** (1.0 / depth) if last_nodes else 0.0,
+                    "pruning_ratio": run["pruning"] / run["nodes"] if run["nodes"] else 0.0,
+                }
+        # Calibrate before and after so drift during the run averages out
+        results["machine"]["calibration"] = (calibration + CalibrationSpeed()) / 2
+        return results
+
+    def CollectLeaves(self, board, plies, player=-1):
+        """Returns every position reached from board after the given number of plies."""
+        if plies == 0 or board.IsGoalState():
+            return [board]
+        leaves = []
+        for move in board.GetAllPossibleMoves(player):
+            leaves.extend(self.CollectLeaves(board.ApplyMove(move), plies - 1, -player))
+        return leaves
+
+    def LeafEvaluationBenchmark(self, plies=3, repeats=3):
+        """
+        Per-leaf cost of EvaluateBoard versus EvaluateBoardIncremental.
+
+        Leaves are all positions `plies` moves below each standard position;
+        each evaluator is timed over the whole set and the best of several
+        repeats is kept.
+        """
+        leaves = []
+        for rows in self.positions.values():
+            leaves.extend(self.CollectLeaves(ParsePosition(rows), plies))
+
+        timings = {}
+        for name in ("EvaluateBoard", "EvaluateBoardIncremental"):
+            best = None
+            for _ in range(repeats):
+                start = time.perf_counter()
+                for leaf in leaves:
+                    getattr(leaf, name)()
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            timings[name] = best / len(leaves) * 1e6
+
+        speedup = timings["EvaluateBoard"] / timings["EvaluateBoardIncremental"]
+        print(f"Leaf evaluation benchmark: {len(leaves):,} leaves")
+        print(f"  EvaluateBoard             {timings['EvaluateBoard']:8.2f} us/leaf")
+        print(f"  EvaluateBoardIncremental  {timings['EvaluateBoardIncremental']:8.2f} us/leaf | x{speedup:.2f}")
+        return {"leaves": len(leaves), "us_per_leaf": timings, "speedup": speedup}
+
+    def BatchEvaluationBenchmark(self, plies=2, repeats=3):
+        """
+        Per-leaf cost of scalar versus batched (NumPy) evaluation.
+
+        The sibling sets are the children of every position `plies` moves
+        below each standard position, i.e. what a depth 1 node scores in
+        the search, grouped by size (the branching factor). The batched
+        cost includes building the (N, 64) tensor and the mobility terms.
+        Then each standard position is searched with evaluation
+        "incremental" and "batch".
+        """
+        if not NUMPY_AVAILABLE:
+            print("Batch evaluation benchmark: NumPy is not installed")
+            return None
+        buckets = {}
+        for rows in self.positions.values():
+            for node in self.CollectLeaves(ParsePosition(rows), plies):
+                if node.IsGoalState():
+                    continue
+                siblings = [node.ApplyMove(move) for move in node.GetAllPossibleMoves(-1)]
+                if siblings:
+                    size = next(limit for limit in (4, 8, 16, 32, 10 ** 6) if len(siblings) <= limit)
+                    buckets.setdefault(size, []).append(siblings)
+
+        evaluators = {
+            "EvaluateBoard": lambda siblings: [board.EvaluateBoard() for board in siblings],
+            "EvaluateBoardIncremental": lambda siblings: [board.EvaluateBoardIncremental() for board in siblings],
+            "EvaluateBoards": GameBoard.EvaluateBoards,
+        }
+        results = {}
+        print(f"Batch evaluation benchmark: sibling sets {plies} plies below each position (us/leaf)")
+        print(f"  {'siblings':>9} {'sets':>6} {'EvaluateBoard':>14} {'Incremental':>12} {'Batched':>9}")
+        for size in sorted(buckets):
+            sets = buckets[size]
+            leaves = sum(len(siblings) for siblings in sets)
+            timings = {}
+            for name, evaluate in evaluators.items():
+                best = None
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    for siblings in sets:
+                        evaluate(siblings)
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+                timings[name] = best / leaves * 1e6
+            label = f"<= {size}" if size < 10 ** 6 else "> 32"
+            results[label] = {"sets": len(sets), "average_siblings": leaves / len(sets), "us_per_leaf": timings}
+            print(f"  {label:>9} {len(sets):>6} {timings['EvaluateBoard']:>14.2f} "
+                  f"{timings['EvaluateBoardIncremental']:>12.2f} {timings['EvaluateBoards']:>9.2f}")
+
+        print(f"Search with batched frontier evaluation: alphabeta_ordering, depth {self.depth}")
+        results["search"] = {}
+        for name, rows in self.positions.items():
+            board = ParsePosition(rows)
+            runs = {evaluation: self.RunSearch(board, "alphabeta_ordering", self.depth, evaluation=evaluation)
+                    for evaluation in ("incremental", "batch")}
+            results["search"][name] = {evaluation: {"nodes": run["nodes"], "seconds": run["seconds"], "score": run["score"]}
+                                       for evaluation, run in runs.items()}
+            # Equal scores can still pick different moves among equally scored ones
+            print(f"  {name:<12} incremental {runs['incremental']['seconds']:7.3f}s | "
+                  f"batch {runs['batch']['seconds']:7.3f}s | same score: "
+                  f"{runs['incremental']['score'] == runs['batch']['score']}")
+        return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Checkers agent benchmarks")
+    parser.add_argument("benchmark", choices=["suite", "perft", "makeunmake", "leafeval", "deepening", "parallel", "quiescence", "batcheval", "stagedmoves",
+                                              "selective", "mcts", "evalcache"])
+    parser.add_argument("--depth", type=int, default=5)
+    parser.add_argument("--strategy", help="search strategy (default: each benchmark's own)")
+    parser.add_argument("--workers", type=int, nargs="+")
+    parser.add_argument("--repeats", type=int, default=MIN_COMPARE_REPEATS,
+                        help=f"suite: runs per measurement (best is kept); at least {MIN_COMPARE_REPEATS} with --compare")
+    parser.add_argument("--json", help="suite: write the results to this file instead of stdout")
+    parser.add_argument("--compare", help="suite: baseline JSON file; exit with status 1 on a regression")
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE)
+    args = parser.parse_args()
+
+    if args.compare and args.repeats < MIN_COMPARE_REPEATS:
+        parser.error(f"--compare needs --repeats {MIN_COMPARE_REPEATS} or more: single runs are too noisy to compare")
+
+    benchmarks = Benchmarks(depth=args.depth)
+    strategy = {"strategy": args.strategy} if args.strategy else {}
+    if args.benchmark == "suite":
+        if args.compare:
+            with open(args.compare) as baseline_file:
+                baseline = json.load(baseline_file)
+            if baseline["machine"].get("repeats", MIN_COMPARE_REPEATS) < MIN_COMPARE_REPEATS:
+                parser.error(f"{args.compare} was written with --repeats {baseline['machine']['repeats']}; "
+                             f"a baseline needs {MIN_COMPARE_REPEATS} or more")
+        results = benchmarks.RunSuite(repeats=args.repeats)
+        if args.json:
+            with open(args.json, "w") as output:
+                json.dump(results, output, indent=2)
+        else:
+            print(json.dumps(results, indent=2))
+        if args.compare:
+            regressions = CompareResults(results, baseline, args.tolerance)
+            for regression in regressions:
+                print(f"REGRESSION {regression}", file=sys.stderr)
+            print(f"{len(regressions)} regressions against {args.compare}", file=sys.stderr)
+            sys.exit(1 if regressions else 0)
+    elif args.benchmark == "perft":
+        benchmarks.PerftBenchmark()
+    elif args.benchmark == "makeunmake":
+        benchmarks.MakeUnmakeBenchmark(**strategy)
+    elif args.benchmark == "leafeval":
+        benchmarks.LeafEvaluationBenchmark()
+    elif args.benchmark == "deepening":
+        try:
+            benchmarks.IterativeDeepeningBenchmark(**strategy)
+        except ValueError as error:
+            parser.error(str(error))
+    elif args.benchmark == "parallel":
+        benchmarks.ParallelScalingBenchmark(args.workers)
+    elif args.benchmark == "quiescence":
+        benchmarks.QuiescenceBenchmark(**strategy)
+    elif args.benchmark == "batcheval":
+        benchmarks.BatchEvaluationBenchmark()
+    elif args.benchmark == "stagedmoves":
+        benchmarks.StagedMovesBenchmark(**strategy)
+    elif args.benchmark == "selective":
+        benchmarks.SelectiveSearchBenchmark(**strategy)
+    elif args.benchmark == "mcts":
+        benchmarks.MonteCarloBenchmark(worker_counts=args.workers)
+    elif args.benchmark == "evalcache":
+        benchmarks.EvaluationCacheBenchmark()
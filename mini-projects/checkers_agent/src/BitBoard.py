@@ -0,0 +1,413 @@
+from GameBoard import *
+
+# Squares are numbered as in MoveEncoding (SQUARE_TO_CELL), so bit s of
+# every mask is square s and packed moves need no translation.
+
+# Diagonal directions in the same order GameBoard scans them.
+DIRECTIONS = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+WHITE_MAN_DIRECTIONS = (0, 1)
+BLACK_MAN_DIRECTIONS = (2, 3)
+KING_DIRECTIONS = (0, 1, 2, 3)
+
+# RAYS[sq][d] lists the squares met walking from sq along direction d.
+RAYS = []
+for _row, _col in SQUARE_TO_CELL:
+    _square_rays = []
+    for _dr, _dc in DIRECTIONS:
+        _ray = []
+        _r, _c = _row + _dr, _col + _dc
+        while 0 <= _r < 8 and 0 <= _c < 8:
+            _ray.append(CELL_TO_SQUARE[(_r, _c)])
+            _r, _c = _r + _dr, _c + _dc
+        _square_rays.append(_ray)
+    RAYS.append(_square_rays)
+
+WHITE_START = sum(1 << sq for sq in range(20, 32))
+BLACK_START = sum(1 << sq for sq in range(12))
+
+
+# GameBoard's signed feature tables, indexed [piece + 2][sq]
+SQUARE_MAN_CENTER_UNITS = [[MAN_CENTER_UNITS[index][row][col] for row, col in SQUARE_TO_CELL] for index in range(5)]
+SQUARE_BACK_ROW_MEN = [[BACK_ROW_MEN[index][row][col] for row, col in SQUARE_TO_CELL] for index in range(5)]
+SQUARE_KING_CENTER_UNITS = [[KING_CENTER_UNITS[index][row][col] for row, col in SQUARE_TO_CELL] for index in range(5)]
+
+# SQUARE_KEYS[sq] are GameBoard's Zobrist keys for square sq, so both
+# representations hash the same position to the same value.
+SQUARE_KEYS = [ZOBRIST_KEYS[row][col] for row, col in SQUARE_TO_CELL]
+
+
+def _PieceCode(white, black, kings, sq):
+    """Returns the GameBoard piece code on square sq of the given masks."""
+    bit = 1 << sq
+    if white & bit:
+        return 2 if kings & bit else 1
+    if black & bit:
+        return -2 if kings & bit else -1
+    return 0
+
+
+def _Squares(mask):
+    """Yields the indexes of the set bits of mask in ascending order."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class BitBoard:
+    """
+    Bitboard-backed Checkers position with the same contract as GameBoard.
+
+    The position is held in three 32-bit masks over the playable squares:
+      white: squares holding a white piece (human player)
+      black: squares holding a black piece (bot player)
+      kings: squares holding a king of either colour
+    Empty squares are ~(white | black). self.hash is the same Zobrist
+    hash GameBoard keeps for the position.
+
+    GetAllPossibleMoves, ApplyMove, EvaluateBoard and IsGoalState return
+    exactly what GameBoard returns for the same position (same packed
+    moves in the same order), so SearchToolBox can run on either representation.
+    It is an alternative backend, not a faster one: GameBoard keeps its
+    evaluation terms incrementally and is at least as fast (see the perft
+    and suite benchmarks).
+    """
+    def __init__(self, white=WHITE_START, black=BLACK_START, kings=0, zobrist_hash=None):
+        self.white = white
+        self.black = black
+        self.kings = kings
+        self.hash = zobrist_hash if zobrist_hash is not None else self.ComputeHash()
+
+    @classmethod
+    def FromGameBoard(cls, game_board):
+        """Builds a BitBoard holding the same position as a GameBoard."""
+        white = black = kings = 0
+        for sq, (row, col) in enumerate(SQUARE_TO_CELL):
+            piece = game_board.board[row][col]
+            if piece > 0:
+                white |= 1 << sq
+            elif piece < 0:
+                black |= 1 << sq
+            if abs(piece) == 2:
+                kings |= 1 << sq
+        return cls(white, black, kings)
+
+    def ToGameBoard(self):
+        """Returns the equivalent list-based GameBoard."""
+        return GameBoard(self.board)
+
+    @property
+    def board(self):
+        """8x8 list view of the position, using GameBoard's piece codes."""
+        board = [[0 for _ in range(8)] for _ in range(8)]
+        for sq, (row, col) in enumerate(SQUARE_TO_CELL):
+            board[row][col] = self.PieceAt(sq)
+        return board
+
+    def PieceAt(self, sq):
+        """Returns the GameBoard piece code standing on square sq."""
+        return _PieceCode(self.white, self.black, self.kings, sq)
+
+    def ComputeHash(self):
+        """Computes the Zobrist hash of the position from scratch."""
+        zobrist_hash = 0
+        for sq in _Squares(self.white | self.black):
+            zobrist_hash ^= SQUARE_KEYS[sq][self.PieceAt(sq) + 2]
+        return zobrist_hash
+
+    def HashAfter(self, white, black, kings):
+        """Updates self.hash for the squares that differ in the given masks."""
+        zobrist_hash = self.hash
+        changed = (self.white ^ white) | (self.black ^ black) | (self.kings ^ kings)
+        for sq in _Squares(changed):
+            keys = SQUARE_KEYS[sq]
+            zobrist_hash ^= keys[self.PieceAt(sq) + 2] ^ keys[_PieceCode(white, black, kings, sq) + 2]
+        return zobrist_hash
+
+    def CloneBoard(self):
+        """Creates a copy of the current board state."""
+        return BitBoard(self.white, self.black, self.kings, self.hash)
+
+    def IsGoalState(self):
+        """Tests if the current state is a goal state (one player has no pieces)."""
+        return not (self.white and self.black)
+
+    def PieceCount(self):
+        """Number of pieces of both colours on the board."""
+        return bin(self.white | self.black).count("1")
+
+    def HasPieces(self, player):
+        """Tests if player (1 white, -1 black) has any piece left."""
+        return bool(self.white if player == 1 else self.black)
+
+    def IsReversibleMove(self, move):
+        """A king move without capture, like GameBoard.IsReversibleMove."""
+        return not move >> MOVE_CAPTURE_SHIFT and bool(self.kings >> (move & SQUARE_INDEX_MASK) & 1)
+
+    def EvaluationTerms(self):
+        """
+        GameBoard's evaluation features and piece counts for this position.
+
+        The masks are cheap to rescan, so the terms are summed from the
+        feature tables instead of being carried along.
+        """
+        material = man_center = back_row = king_center = 0
+        for sq in _Squares(self.white | self.black):
+            index = self.PieceAt(sq) + 2
+            material += MATERIAL_VALUES[index]
+            man_center += SQUARE_MAN_CENTER_UNITS[index][sq]
+            back_row += SQUARE_BACK_ROW_MEN[index][sq]
+            king_center += SQUARE_KING_CENTER_UNITS[index][sq]
+        return (material, man_center, back_row, king_center,
+                bin(self.white).count("1"), bin(self.black).count("1"))
+
+    def EvaluateBoard(self, weights=DEFAULT_EVALUATION_WEIGHTS):
+        """
+        Evaluates the position exactly as GameBoard.EvaluateBoard does.
+
+        Returns: Positive score favors black (bot), negative favors white (human)
+        """
+        white_mobility = len(self.GetAllPossibleMoves(1))
+        black_mobility = len(self.GetAllPossibleMoves(-1))
+        material, man_center, back_row, king_center, _, _ = self.EvaluationTerms()
+        score = FeatureScore(material, black_mobility - white_mobility, man_center, back_row, king_center, weights)
+        if self.IsEndgame():
+            score = self.EvaluateEndgame(score, weights)
+        return score
+
+    def EvaluateBoardIncremental(self, weights=DEFAULT_EVALUATION_WEIGHTS):
+        """Same value as GameBoard.EvaluateBoardIncremental (features rescanned, moves counted)."""
+        material, man_center, back_row, king_center, _, _ = self.EvaluationTerms()
+        score = FeatureScore(material, self.CountMobility(-1) - self.CountMobility(1),
+                             man_center, back_row, king_center, weights)
+        if self.IsEndgame():
+            score = self.EvaluateEndgame(score, weights)
+        return score
+
+    def SquareVector(self):
+        """The 64 piece codes in row-major order, like GameBoard.SquareVector."""
+        squares = [0] * 64
+        for sq in _Squares(self.white | self.black):
+            row, col = SQUARE_TO_CELL[sq]
+            squares[row * 8 + col] = self.PieceAt(sq)
+        return squares
+
+    def CountMobility(self, player):
+        """Counts moves like GameBoard.CountMobility, walking the ray tables."""
+        own = self.white if player == 1 else self.black
+        enemy = self.black if player == 1 else self.white
+        occupied = self.white | self.black
+        man_directions = WHITE_MAN_DIRECTIONS if player == 1 else BLACK_MAN_DIRECTIONS
+        quiet = 0
+        jumps = 0
+        for sq in _Squares(own):
+            if self.kings >> sq & 1:
+                for d in KING_DIRECTIONS:
+                    ray = RAYS[sq][d]
+                    step = 0
+                    while step < len(ray) and not occupied >> ray[step] & 1:
+                        step += 1
+                    quiet += step
+                    if step < len(ray) and enemy >> ray[step] & 1:
+                        for landing in ray[step + 1:]:
+                            if occupied >> landing & 1:
+                                break
+                            jumps += 1
+            else:
+                for d in man_directions:
+                    ray = RAYS[sq][d]
+                    if not ray:
+                        continue
+                    if not occupied >> ray[0] & 1:
+                        quiet += 1
+                    elif enemy >> ray[0] & 1 and len(ray) > 1 and not occupied >> ray[1] & 1:
+                        jumps += 1
+        return jumps if jumps else quiet
+
+    def GetPositionalValue(self, row, col, piece, weights=DEFAULT_EVALUATION_WEIGHTS):
+        """GameBoard's positional value for a piece on (row, col)."""
+        return GameBoard.GetPositionalValue(self, row, col, piece, weights)
+
+    def IsEndgame(self):
+        """Determines if the game is in an endgame phase."""
+        return bin(self.white).count("1") <= 3 or bin(self.black).count("1") <= 3
+
+    def EvaluateEndgame(self, current_score, weights=DEFAULT_EVALUATION_WEIGHTS):
+        """Amplifies the score in the endgame, as GameBoard does."""
+        return current_score * weights[5]
+
+    def GetAllPossibleMoves(self, player):
+        """
+        Returns all legal moves for the given player.
+
+        Moves are GameBoard's packed ints (see MoveEncoding) and come out in
+        the same order: captures only if any exist (mandatory capture),
+        otherwise quiet moves.
+        """
+        return self.GetCaptureMoves(player) or self.GetQuietMoves(player)
+
+    def GetCaptureMoves(self, player):
+        """All capturing moves of player, like GameBoard.GetCaptureMoves."""
+        own = self.white if player == 1 else self.black
+        enemy = self.black if player == 1 else self.white
+        occupied = self.white | self.black
+        man_directions = WHITE_MAN_DIRECTIONS if player == 1 else BLACK_MAN_DIRECTIONS
+
+        moves = []
+        for sq in _Squares(own):
+            is_king = self.kings >> sq & 1
+            directions = KING_DIRECTIONS if is_king else man_directions
+            for final_sq, captured in self.FindCaptures(sq, is_king, directions, enemy, occupied):
+                moves.append(sq | final_sq << MOVE_TARGET_SHIFT | captured << MOVE_CAPTURE_SHIFT)
+        return moves
+
+    def GetQuietMoves(self, player):
+        """All non-capturing moves of player, like GameBoard.GetQuietMoves."""
+        own = self.white if player == 1 else self.black
+        occupied = self.white | self.black
+        man_directions = WHITE_MAN_DIRECTIONS if player == 1 else BLACK_MAN_DIRECTIONS
+
+        moves = []
+        for sq in _Squares(own):
+            if self.kings >> sq & 1:
+                for d in KING_DIRECTIONS:
+                    for target in RAYS[sq][d]:
+                        if occupied >> target & 1:
+                            break
+                        moves.append(sq | target << MOVE_TARGET_SHIFT)
+            else:
+                for d in man_directions:
+                    ray = RAYS[sq][d]
+                    if ray and not occupied >> ray[0] & 1:
+                        moves.append(sq | ray[0] << MOVE_TARGET_SHIFT)
+        return moves
+
+    def HasQuietMove(self, player):
+        """Tests if player has a non-capturing move, stopping at the first one."""
+        own = self.white if player == 1 else self.black
+        occupied = self.white | self.black
+        man_directions = WHITE_MAN_DIRECTIONS if player == 1 else BLACK_MAN_DIRECTIONS
+        for sq in _Squares(own):
+            for d in KING_DIRECTIONS if self.kings >> sq & 1 else man_directions:
+                ray = RAYS[sq][d]
+                if ray and not occupied >> ray[0] & 1:
+                    return True
+        return False
+
+    def IsLegalCapture(self, move, player):
+        """Tests a capturing move by generating the captures of its piece only."""
+        sq = move & SQUARE_INDEX_MASK
+        own = self.white if player == 1 else self.black
+        if not own >> sq & 1:
+            return False
+        is_king = self.kings >> sq & 1
+        enemy = self.black if player == 1 else self.white
+        directions = KING_DIRECTIONS if is_king else (WHITE_MAN_DIRECTIONS if player == 1 else BLACK_MAN_DIRECTIONS)
+        capture = (move >> MOVE_TARGET_SHIFT & SQUARE_INDEX_MASK, move >> MOVE_CAPTURE_SHIFT)
+        return capture in self.FindCaptures(sq, is_king, directions, enemy, self.white | self.black)
+
+    def IsLegalQuietMove(self, move, player):
+        """Tests a non-capturing move without generating any, like GameBoard.IsLegalQuietMove."""
+        sq = move & SQUARE_INDEX_MASK
+        target = move >> MOVE_TARGET_SHIFT & SQUARE_INDEX_MASK
+        own = self.white if player == 1 else self.black
+        if move >> MOVE_CAPTURE_SHIFT or not own >> sq & 1:
+            return False
+        occupied = self.white | self.black
+        if self.kings >> sq & 1:
+            for d in KING_DIRECTIONS:
+                for cell in RAYS[sq][d]:
+                    if occupied >> cell & 1:
+                        break
+                    if cell == target:
+                        return True
+            return False
+        return any(RAYS[sq][d][:1] == [target] and not occupied >> target & 1
+                   for d in (WHITE_MAN_DIRECTIONS if player == 1 else BLACK_MAN_DIRECTIONS))
+
+    def FindCaptures(self, sq, is_king, directions, enemy, occupied):
+        """
+        Recursive multi-capture search over the masks.
+
+        Mirrors GameBoard.FindCaptures: the mover leaves its square, each
+        captured piece is removed before the next jump and a man keeps
+        capturing as a man. Returns a list of (final_square, captured_mask).
+        """
+        moves = []
+        occupied &= ~(1 << sq)
+        for d in directions:
+            ray = RAYS[sq][d]
+            if is_king:
+                step = 0
+                while step < len(ray) and not occupied >> ray[step] & 1:
+                    step += 1
+                if step >= len(ray) or not enemy >> ray[step] & 1:
+                    continue
+                victim = ray[step]
+                landings = []
+                for landing in ray[step + 1:]:
+                    if occupied >> landing & 1:
+                        break
+                    landings.append(landing)
+            else:
+                if len(ray) < 2 or not enemy >> ray[0] & 1 or occupied >> ray[1] & 1:
+                    continue
+                victim = ray[0]
+                landings = [ray[1]]
+
+            victim_bit = 1 << victim
+            for landing in landings:
+                subsequent = self.FindCaptures(landing, is_king, directions,
+                                               enemy & ~victim_bit,
+                                               (occupied & ~victim_bit) | (1 << landing))
+                if subsequent:
+                    for final_sq, captured in subsequent:
+                        moves.append((final_sq, captured | victim_bit))
+                else:
+                    moves.append((landing, victim_bit))
+        return moves
+
+    def ApplyMove(self, move):
+        """Applies a packed move and returns the resulting BitBoard."""
+        white, black, kings = self.MovedMasks(move)
+        return BitBoard(white, black, kings, self.HashAfter(white, black, kings))
+
+    def MovedMasks(self, move):
+        """Returns the (white, black, kings) masks after playing move."""
+        target = move >> MOVE_TARGET_SHIFT & SQUARE_INDEX_MASK
+        start_bit = 1 << (move & SQUARE_INDEX_MASK)
+        target_bit = 1 << target
+        captured_mask = move >> MOVE_CAPTURE_SHIFT
+
+        white, black, kings = self.white, self.black, self.kings
+        is_king = kings & start_bit
+        if white & start_bit:
+            white = (white & ~start_bit) | target_bit
+            promoted = target < 4
+        else:
+            black = (black & ~start_bit) | target_bit
+            promoted = target >= 28
+        kings &= ~start_bit
+        if is_king or promoted:
+            kings |= target_bit
+        # Captured squares are cleared last, like GameBoard.ApplyMove does,
+        # so a king finishing a circular capture on a victim's square is
+        # removed as well.
+        keep = ~captured_mask
+        return white & keep, black & keep, kings & keep
+
+    def MakeMove(self, move):
+        """Applies a move in place and returns the previous masks as undo record."""
+        undo = (self.white, self.black, self.kings, self.hash)
+        white, black, kings = self.MovedMasks(move)
+        self.hash = self.HashAfter(white, black, kings)
+        self.white, self.black, self.kings = white, black, kings
+        return undo
+
+    def UnmakeMove(self, undo):
+        """Restores the masks and hash saved by MakeMove."""
+        self.white, self.black, self.kings, self.hash = undo
+
+    def DisplayBoard(self):
+        """Displays the current board state in the terminal."""
+        self.ToGameBoard().DisplayBoard()
@@ -0,0 +1,137 @@
+import random
+import sys
+
+from GameBoard import *
+from BitBoard import *
+
+
+class ConformanceCheck:
+    """
+    Cross-checks alternative board representations against GameBoard.
+
+    GameBoard is the reference implementation of the rules. Every position
+    in a seeded corpus of random positions is loaded into both boards and
+    the move lists, resulting positions, Zobrist hashes, evaluations (full
+    and incremental) and goal tests are compared, and every move is also played with MakeMove/UnmakeMove on
+    both boards. Any difference is recorded as a mismatch.
+    """
+    def __init__(self, seed=2024, positions=500):
+        self.seed = seed
+        self.positions = positions
+        self.mismatches = []
+
+    def RandomPosition(self, rng):
+        """Scatters a random number of men and kings over the dark squares."""
+        board = [[0 for _ in range(8)] for _ in range(8)]
+        squares = [(row, col) for row in range(8) for col in range(8) if (row + col) % 2 == 1]
+        rng.shuffle(squares)
+        for row, col in squares[:rng.randint(2, 24)]:
+            board[row][col] = rng.choice([1, 1, 1, 2, -1, -1, -1, -2])
+        return GameBoard(board)
+
+    def RandomGamePosition(self, rng):
+        """Plays random legal moves from the start position."""
+        board = GameBoard()
+        player = 1
+        for _ in range(rng.randint(0, 80)):
+            moves = board.GetAllPossibleMoves(player)
+            if not moves or board.IsGoalState():
+                break
+            board = board.ApplyMove(rng.choice(moves))
+            player = -player
+        return board
+
+    def GenerateCorpus(self):
+        """Returns the seeded corpus: half scattered, half reached by play."""
+        rng = random.Random(self.seed)
+        corpus = [GameBoard()]
+        for index in range(self.positions):
+            if index % 2 == 0:
+                corpus.append(self.RandomPosition(rng))
+            else:
+                corpus.append(self.RandomGamePosition(rng))
+        return corpus
+
+    def Compare(self, reference, candidate):
+        """Compares one position in both representations."""
+        if candidate.hash != reference.hash:
+            self.mismatches.append(("hash", reference.board))
+        if candidate.IsGoalState() != reference.IsGoalState():
+            self.mismatches.append(("IsGoalState", reference.board))
+        if candidate.EvaluateBoard() != reference.EvaluateBoard():
+            self.mismatches.append(("EvaluateBoard", reference.board))
+        if candidate.EvaluateBoardIncremental() != reference.EvaluateBoardIncremental():
+            self.mismatches.append(("EvaluateBoardIncremental", reference.board))
+        for player in (1, -1):
+            expected = reference.GetAllPossibleMoves(player)
+            actual = candidate.GetAllPossibleMoves(player)
+            if actual != expected:
+                self.mismatches.append(("GetAllPossibleMoves", reference.board, player))
+                continue
+            self.CompareStages(reference, player)
+            self.CompareStages(candidate, player)
+            for move in expected:
+                expected_child = reference.ApplyMove(move)
+                actual_child = candidate.ApplyMove(move)
+                if actual_child.board != expected_child.board:
+                    self.mismatches.append(("ApplyMove", reference.board, move))
+                if (actual_child.hash != expected_child.hash
+                        or not self.IncrementalStateConsistent(expected_child)):
+                    self.mismatches.append(("hash", reference.board, move))
+                self.CompareMakeUnmake(reference, move)
+                self.CompareMakeUnmake(candidate, move)
+
+    def CompareStages(self, board, player):
+        """
+        Checks the staged generation against GetAllPossibleMoves: the two
+        stages, HasQuietMove, and the legality tests for every capture and
+        every start/target pair of player's pieces.
+        """
+        captures = board.GetCaptureMoves(player)
+        quiet = board.GetQuietMoves(player)
+        if (captures or quiet) != board.GetAllPossibleMoves(player) or board.HasQuietMove(player) != bool(quiet):
+            self.mismatches.append(("GetCaptureMoves/GetQuietMoves", board.board, player))
+        if not all(board.IsLegalCapture(move, player) for move in captures):
+            self.mismatches.append(("IsLegalCapture", board.board, player))
+        cells = board.board
+        for sq, (row, col) in enumerate(DARK_SQUARES):
+            if cells[row][col] * player <= 0:
+                continue
+            for target in range(len(DARK_SQUARES)):
+                move = sq | target << MOVE_TARGET_SHIFT
+                if board.IsLegalQuietMove(move, player) != (move in quiet):
+                    self.mismatches.append(("IsLegalQuietMove", board.board, move))
+
+    def CompareMakeUnmake(self, board, move):
+        """Checks MakeMove matches ApplyMove and UnmakeMove restores the board."""
+        before = [row[:] for row in board.board]
+        after = board.ApplyMove(move).board
+        undo = board.MakeMove(move)
+        if board.board != after or not self.IncrementalStateConsistent(board):
+            self.mismatches.append(("MakeMove", before, move))
+        board.UnmakeMove(undo)
+        if board.board != before or not self.IncrementalStateConsistent(board):
+            self.mismatches.append(("UnmakeMove", before, move))
+
+    def IncrementalStateConsistent(self, board):
+        """Checks the hash and any incremental evaluation terms against a rescan."""
+        if board.hash != board.ComputeHash():
+            return False
+        if hasattr(board, "ComputeEvaluationTerms"):
+            return board.EvaluationTerms() == board.ComputeEvaluationTerms()
+        return True
+
+    def Run(self, board_class=BitBoard):
+        """Runs the whole corpus through board_class and reports the result."""
+        self.mismatches = []
+        corpus = self.GenerateCorpus()
+        for reference in corpus:
+            self.Compare(reference, board_class.FromGameBoard(reference))
+        print(f"{board_class.__name__}: {len(corpus)} positions, {len(self.mismatches)} mismatches")
+        for mismatch in self.mismatches[:10]:
+            print(f"  {mismatch[0]} differs: {mismatch[1:]}")
+        return not self.mismatches
+
+
+if __name__ == "__main__":
+    sys.exit(0 if ConformanceCheck().Run() else 1)
@@ -0,0 +1,62 @@
+import collections
+
+# Default number of cached evaluations; an entry (hash, float and the
+# OrderedDict link) takes roughly 100 bytes, so this is about 6 MB
+EVALUATION_CACHE_ENTRIES = 1 << 16
+
+
+class EvaluationCache:
+    """
+    Bounded cache of static evaluations keyed by Zobrist hash.
+
+    The static evaluation does not depend on the side to move, so the
+    position hash alone is the key. Entries are evicted least recently
+    used first once the cache holds `entries` positions. The caller owns
+    the validity of the scores: a cache belongs to one evaluation (mode
+    and weight vector) and must be cleared when that changes.
+
+    Statistics:
+    - hits: the position was cached
+    - misses: it was not (and is normally stored next)
+    - evictions: entries dropped to make room
+    """
+    def __init__(self, entries=EVALUATION_CACHE_ENTRIES):
+        self.entries = max(1, entries)
+        self.scores = collections.OrderedDict()
+        self.ResetStatistics()
+
+    def ResetStatistics(self):
+        """Clears the probe counters."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def Clear(self):
+        """Removes every entry."""
+        self.scores.clear()
+
+    def Probe(self, key):
+        """Returns the score cached for key (marking it recently used), or None."""
+        score = self.scores.get(key)
+        if score is None:
+            self.misses += 1
+            return None
+        self.scores.move_to_end(key)
+        self.hits += 1
+        return score
+
+    def Store(self, key, score):
+        """Caches score for key, evicting the least recently used entry when full."""
+        scores = self.scores
+        scores[key] = score
+        if len(scores) > self.entries:
+            scores.popitem(last=False)
+            self.evictions += 1
+
+    def HitRate(self):
+        """Share of probes that hit, in percent."""
+        probes = self.hits + self.misses
+        return 100.0 * self.hits / probes if probes else 0.0
+
+    def __len__(self):
+        return len(self.scores)
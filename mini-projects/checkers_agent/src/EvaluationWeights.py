@@ -0,0 +1,43 @@
+import json
+import os
+
+# The evaluation is a weighted sum of integer features (black minus white),
+# multiplied by the endgame factor when either side has three pieces or
+# fewer:
+# - material: men count 1, kings 2
+# - mobility: legal moves
+# - man_center: 7 - Manhattan distance of every man to the board centre
+# - back_row: men still on their own back row
+# - king_center: 7 - Manhattan distance of every king to the board centre
+EVALUATION_WEIGHT_NAMES = ("material", "mobility", "man_center", "back_row", "king_center", "endgame")
+
+# The original hand-picked weights
+DEFAULT_EVALUATION_WEIGHTS = (10.0, 0.1, 0.05, 0.1, 0.1, 1.5)
+
+# Tuned weights written by Tuner.py, used by the game when present
+DEFAULT_WEIGHTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "weights.json")
+
+
+def CheckEvaluationWeights(weights):
+    """Returns weights as a tuple of floats, raising ValueError if it has the wrong length."""
+    weights = tuple(float(weight) for weight in weights)
+    if len(weights) != len(EVALUATION_WEIGHT_NAMES):
+        raise ValueError(f"Expected {len(EVALUATION_WEIGHT_NAMES)} evaluation weights "
+                         f"({', '.join(EVALUATION_WEIGHT_NAMES)}), got {len(weights)}")
+    return weights
+
+
+def LoadEvaluationWeights(path):
+    """Reads a weight vector written by SaveEvaluationWeights (a JSON object name -> weight)."""
+    with open(path) as weights_file:
+        named = json.load(weights_file)
+    missing = [name for name in EVALUATION_WEIGHT_NAMES if name not in named]
+    if missing:
+        raise ValueError(f"{path} has no weight for {', '.join(missing)}")
+    return CheckEvaluationWeights(named[name] for name in EVALUATION_WEIGHT_NAMES)
+
+
+def SaveEvaluationWeights(path, weights):
+    """Writes a weight vector as a JSON object name -> weight."""
+    with open(path, "w") as weights_file:
+        json.dump(dict(zip(EVALUATION_WEIGHT_NAMES, CheckEvaluationWeights(weights))), weights_file, indent=2)
@@ -1,4 +1,86 @@
 import copy
+import itertools
+import random
+
+from EvaluationWeights import *
+from MoveEncoding import *
+
+# NumPy is optional: it only backs the batch evaluation (EvaluatePositions)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Zobrist keys: ZOBRIST_KEYS[row][col][piece + 2] is a random 64-bit key for
+# piece standing on (row, col); the empty-square entry is 0 so it drops out
+# of the XOR. The fixed seed keeps hashes stable across runs (opening books,
+# stored tables).
+_zobrist_rng = random.Random(20240601)
+ZOBRIST_KEYS = [[[0 if piece == 0 else _zobrist_rng.getrandbits(64) for piece in range(-2, 3)]
+                 for _ in range(8)] for _ in range(8)]
+# XORed into a position hash when black (the bot) is to move.
+ZOBRIST_BLACK_TO_MOVE = _zobrist_rng.getrandbits(64)
+
+
+def ZobristKey(zobrist_hash, player):
+    """Key of a position with player to move (transposition table, tablebase, book)."""
+    return zobrist_hash ^ ZOBRIST_BLACK_TO_MOVE if player == -1 else zobrist_hash
+
+
+# Playable squares, row-major: DARK_SQUARES[sq] is (row, col) of square sq
+DARK_SQUARES = SQUARE_TO_CELL
+
+# Material per piece code (index piece + 2), positive for black like the score
+MATERIAL_VALUES = (2, 1, 0, -1, -2)
+
+# Evaluation feature tables, indexed [piece + 2][row][col] and signed so
+# that sums favour black like the score (see EvaluationWeights):
+# - MAN_CENTER_UNITS: 7 - distance to the centre, for men
+# - BACK_ROW_MEN: 1 for a man on its own back row
+# - KING_CENTER_UNITS: 7 - distance to the centre, for kings
+def _CenterUnits(row, col):
+    return 7 - round(abs(3.5 - row) + abs(3.5 - col))
+
+
+MAN_CENTER_UNITS = [[[(1 if piece < 0 else -1) * _CenterUnits(row, col) if abs(piece) == 1 else 0
+                      for col in range(8)] for row in range(8)] for piece in range(-2, 3)]
+BACK_ROW_MEN = [[[(1 if piece < 0 else -1) if (piece, row) in ((1, 7), (-1, 0)) else 0
+                  for col in range(8)] for row in range(8)] for piece in range(-2, 3)]
+KING_CENTER_UNITS = [[[(1 if piece < 0 else -1) * _CenterUnits(row, col) if abs(piece) == 2 else 0
+                       for col in range(8)] for row in range(8)] for piece in range(-2, 3)]
+
+
+def FeatureScore(material, mobility, man_center, back_row, king_center, weights=DEFAULT_EVALUATION_WEIGHTS):
+    """Weighted sum of the evaluation features, before the endgame factor."""
+    score = man_center * weights[2] + back_row * weights[3] + king_center * weights[4]
+    score += mobility * weights[1]
+    score += material * weights[0]
+    return score
+
+
+# Diagonal directions in move generation order. Men move and capture along
+# the first two (white, upward) or the last two (black, downward).
+DIAGONALS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+MAN_DIRECTIONS = {1: (0, 1), -1: (2, 3)}
+
+# Move tables built once, indexed [square][direction], with entries
+# (row, col, square) so moves can be packed without a lookup:
+# - SQUARE_RAYS: squares from the square to the edge of the board
+# - SQUARE_STEPS: the neighbouring square, or None at the edge
+# - SQUARE_JUMPS: (jumped square, landing square), or None near the edge
+SQUARE_RAYS = [tuple(tuple((row + dr * step, col + dc * step, CELL_TO_SQUARE[(row + dr * step, col + dc * step)])
+                           for step in range(1, 8) if 0 <= row + dr * step < 8 and 0 <= col + dc * step < 8)
+                     for dr, dc in DIAGONALS)
+               for row, col in DARK_SQUARES]
+SQUARE_STEPS = [tuple(ray[0] if ray else None for ray in rays) for rays in SQUARE_RAYS]
+SQUARE_JUMPS = [tuple(ray[:2] if len(ray) >= 2 else None for ray in rays) for rays in SQUARE_RAYS]
+# The same rays and steps with the packed quiet move to each square,
+# (row, col, move), so quiet generation appends a prebuilt move
+QUIET_RAYS = [tuple(tuple((row, col, sq | target << MOVE_TARGET_SHIFT) for row, col, target in ray) for ray in rays)
+              for sq, rays in enumerate(SQUARE_RAYS)]
+QUIET_STEPS = [tuple(ray[0] if ray else None for ray in rays) for rays in QUIET_RAYS]
+
 
 class GameBoard:
     """
@@ -22,12 +104,20 @@ class GameBoard:
     - Mobility assessment (available moves for each player)
     - Material counting with king bonus
     - Strategic position evaluation
+    - Incremental Zobrist hash of the position (self.hash)
+    - Incremental evaluation terms (material, positional features, piece counts)
+    - Evaluation weights passed in as a parameter vector (EvaluationWeights)
     """
-    def __init__(self, board=None):
+    def __init__(self, board=None, zobrist_hash=None, eval_terms=None):
         if board is not None:
             self.board = board
         else:
             self.board = self.InitializeBoard()
+        self.hash = zobrist_hash if zobrist_hash is not None else self.ComputeHash()
+        if eval_terms is None:
+            eval_terms = self.ComputeEvaluationTerms()
+        (self.material, self.man_center, self.back_row, self.king_center,
+         self.white_count, self.black_count) = eval_terms
 
     def InitializeBoard(self):
         """Initializes the checkers board with pieces in starting positions."""
@@ -44,17 +134,67 @@ class GameBoard:
                     board[row][col] = 1
         return board
 
+    def ComputeHash(self):
+        """Computes the Zobrist hash of the position from scratch."""
+        zobrist_hash = 0
+        for row in range(8):
+            for col in range(8):
+                zobrist_hash ^= ZOBRIST_KEYS[row][col][self.board[row][col] + 2]
+        return zobrist_hash
+
+    def ComputeEvaluationTerms(self):
+        """
+        Computes the incrementally maintained terms from scratch.
+
+        Returns (material, man_center, back_row, king_center, white_count,
+        black_count): the integer evaluation features, favouring black, and
+        the piece counts. Being integers, they stay exact however they are
+        updated.
+        """
+        material = man_center = back_row = king_center = white_count = black_count = 0
+        for row, col in DARK_SQUARES:
+            piece = self.board[row][col]
+            if piece:
+                index = piece + 2
+                material += MATERIAL_VALUES[index]
+                man_center += MAN_CENTER_UNITS[index][row][col]
+                back_row += BACK_ROW_MEN[index][row][col]
+                king_center += KING_CENTER_UNITS[index][row][col]
+                if piece > 0:
+                    white_count += 1
+                else:
+                    black_count += 1
+        return material, man_center, back_row, king_center, white_count, black_count
+
+    def EvaluationTerms(self):
+        """The incrementally maintained terms, in ComputeEvaluationTerms order."""
+        return (self.material, self.man_center, self.back_row, self.king_center,
+                self.white_count, self.black_count)
+
     def CloneBoard(self):
         """Creates a deep copy of the current board state."""
-        return GameBoard(copy.deepcopy(self.board))
+        return GameBoard(copy.deepcopy(self.board), self.hash, self.EvaluationTerms())
 
     def IsGoalState(self):
         """Tests if the current state is a goal state (one player has no pieces)."""
-        white_exists = any(cell in [1, 2] for row in self.board for cell in row)
-        black_exists = any(cell in [-1, -2] for row in self.board for cell in row)
-        return not (white_exists and black_exists)
+        return self.white_count == 0 or self.black_count == 0
+
+    def PieceCount(self):
+        """Number of pieces of both colours on the board."""
+        return self.white_count + self.black_count
+
+    def HasPieces(self, player):
+        """Tests if player (1 white, -1 black) has any piece left."""
+        return (self.white_count if player == 1 else self.black_count) > 0
+
+    def IsReversibleMove(self, move):
+        """A king move without capture: the only kind that can lead back to an earlier position."""
+        if move >> MOVE_CAPTURE_SHIFT:
+            return False
+        row, col = DARK_SQUARES[move & SQUARE_INDEX_MASK]
+        return abs(self.board[row][col]) == 2
 
-    def EvaluateBoard(self):
+    def EvaluateBoard(self, weights=DEFAULT_EVALUATION_WEIGHTS):
         """
         Advanced board evaluation function that considers multiple strategic factors.
         
@@ -63,46 +203,25 @@ class GameBoard:
         2. Positional advantage (center control, king safety)
         3. Mobility advantage (number of available moves)
         4. Strategic positioning (back row protection, king development)
+
+        Every feature is rescanned from the board and mobility counts the
+        generated moves. weights is the parameter vector of
+        EvaluationWeights (the hand-picked weights by default).
         
         Returns: Positive score favors black (bot), negative favors white (human)
         """
-        score = 0
-        
-        # Material evaluation with king bonus
-        material_score = 0
         white_mobility = len(self.GetAllPossibleMoves(1))
         black_mobility = len(self.GetAllPossibleMoves(-1))
-        
-        for row in range(8):
-            for col in range(8):
-                piece = self.board[row][col]
-                if piece == 1:    # white man
-                    material_score -= 1
-                    score -= self.GetPositionalValue(row, col, piece)
-                elif piece == 2:  # white king
-                    material_score -= 2
-                    score -= self.GetPositionalValue(row, col, piece)
-                elif piece == -1: # black man
-                    material_score += 1
-                    score += self.GetPositionalValue(row, col, piece)
-                elif piece == -2: # black king
-                    material_score += 2
-                    score += self.GetPositionalValue(row, col, piece)
-        
-        # Mobility advantage (having more moves is good)
-        mobility_bonus = (black_mobility - white_mobility) * 0.1
-        score += mobility_bonus
-        
-        # Material is the primary factor
-        score += material_score * 10
-        
+        material, man_center, back_row, king_center, _, _ = self.ComputeEvaluationTerms()
+        score = FeatureScore(material, black_mobility - white_mobility, man_center, back_row, king_center, weights)
+
         # Endgame considerations
         if self.IsEndgame():
-            score = self.EvaluateEndgame(score)
+            score = self.EvaluateEndgame(score, weights)
         
         return score
 
-    def GetPositionalValue(self, row, col, piece):
+    def GetPositionalValue(self, row, col, piece, weights=DEFAULT_EVALUATION_WEIGHTS):
         """
         Calculates positional value for a piece based on its location.
         
@@ -112,34 +231,96 @@ class GameBoard:
         - Kings are more valuable in the center
         - Edge pieces are less valuable
         """
-        if abs(piece) == 1:  # Regular pieces
-            # Center control bonus
-            center_distance = abs(3.5 - row) + abs(3.5 - col)
-            center_bonus = (7 - center_distance) * 0.05
-            
-            # Back row protection bonus
-            if piece == 1 and row == 7:  # White back row
-                back_row_bonus = 0.1
-            elif piece == -1 and row == 0:  # Black back row
-                back_row_bonus = 0.1
-            else:
-                back_row_bonus = 0
-            
-            return center_bonus + back_row_bonus
-        
-        else:  # Kings
-            # Kings are more valuable in the center
-            center_distance = abs(3.5 - row) + abs(3.5 - col)
-            center_bonus = (7 - center_distance) * 0.1
-            return center_bonus
+        index = piece + 2
+        value = FeatureScore(0, 0, MAN_CENTER_UNITS[index][row][col], BACK_ROW_MEN[index][row][col],
+                             KING_CENTER_UNITS[index][row][col], weights)
+        return value if piece < 0 else -value
 
     def IsEndgame(self):
         """Determines if the game is in an endgame phase."""
-        white_pieces = sum(1 for row in self.board for cell in row if cell in [1, 2])
-        black_pieces = sum(1 for row in self.board for cell in row if cell in [-1, -2])
-        return white_pieces <= 3 or black_pieces <= 3
+        return self.white_count <= 3 or self.black_count <= 3
+
+    def EvaluateBoardIncremental(self, weights=DEFAULT_EVALUATION_WEIGHTS):
+        """
+        Fast evaluation built from the incrementally maintained terms.
+
+        Same features and weights as EvaluateBoard, but material and
+        positional features are kept up to date by MakeMove (precomputed
+        piece-square tables) and mobility comes from CountMobility, which
+        counts moves without building them. Multi-jump captures therefore
+        count once per first jump, so the mobility term can differ slightly
+        from EvaluateBoard.
+
+        Returns: Positive score favors black (bot), negative favors white (human)
+        """
+        score = FeatureScore(self.material, self.CountMobility(-1) - self.CountMobility(1),
+                             self.man_center, self.back_row, self.king_center, weights)
+        if self.white_count <= 3 or self.black_count <= 3:
+            score = self.EvaluateEndgame(score, weights)
+        return score
+
+    def SquareVector(self):
+        """The 64 piece codes in row-major order (one row of a batch tensor)."""
+        return [piece for row in self.board for piece in row]
+
+    @staticmethod
+    def EvaluateBoards(boards, weights=DEFAULT_EVALUATION_WEIGHTS):
+        """
+        Evaluates a list of positions at once (see EvaluatePositions).
+
+        Returns the EvaluateBoardIncremental value of every board, as a
+        list. Requires NumPy.
+        """
+        return EvaluatePositions([board.SquareVector() for board in boards],
+                                 [board.CountMobility(-1) - board.CountMobility(1) for board in boards],
+                                 weights).tolist()
+
+    def CountMobility(self, player):
+        """
+        Counts the moves available to player without generating them.
+
+        If any capture exists only captures count (mandatory capture): one
+        per first jump of a man, one per landing square of a king. Otherwise
+        quiet moves are counted. Nothing is allocated and no capture chain
+        is followed.
+        """
+        board = self.board
+        forward = -1 if player == 1 else 1
+        quiet = 0
+        jumps = 0
+        for row, col in DARK_SQUARES:
+            piece = board[row][col]
+            if piece != player and piece != player * 2:
+                continue
+            if piece == player:
+                new_row = row + forward
+                if not 0 <= new_row < 8:
+                    continue
+                for dc in (-1, 1):
+                    new_col = col + dc
+                    if not 0 <= new_col < 8:
+                        continue
+                    target = board[new_row][new_col]
+                    if target == 0:
+                        quiet += 1
+                    elif target * player < 0:
+                        land_row, land_col = new_row + forward, new_col + dc
+                        if 0 <= land_row < 8 and 0 <= land_col < 8 and board[land_row][land_col] == 0:
+                            jumps += 1
+            else:
+                for dr, dc in ((-1, -1), (-1, 1), (1, -1), (1, 1)):
+                    new_row, new_col = row + dr, col + dc
+                    while 0 <= new_row < 8 and 0 <= new_col < 8 and board[new_row][new_col] == 0:
+                        quiet += 1
+                        new_row, new_col = new_row + dr, new_col + dc
+                    if 0 <= new_row < 8 and 0 <= new_col < 8 and board[new_row][new_col] * player < 0:
+                        new_row, new_col = new_row + dr, new_col + dc
+                        while 0 <= new_row < 8 and 0 <= new_col < 8 and board[new_row][new_col] == 0:
+                            jumps += 1
+                            new_row, new_col = new_row + dr, new_col + dc
+        return jumps if jumps else quiet
 
-    def EvaluateEndgame(self, current_score):
+    def EvaluateEndgame(self, current_score, weights=DEFAULT_EVALUATION_WEIGHTS):
         """
         Special evaluation for endgame situations.
         
@@ -149,7 +330,7 @@ class GameBoard:
         - Material advantage is amplified
         """
         # Amplify material advantage in endgame
-        return current_score * 1.5
+        return current_score * weights[5]
 
     def GetAllPossibleMoves(self, player):
         """
@@ -160,138 +341,168 @@ class GameBoard:
         - Multi-capture chain generation
         - Efficient move filtering
         - Move ordering for AI optimization
-        """
-        moves = []
-        capturing_moves_exist = False
 
-        # First, try to generate capturing moves for every piece.
-        for i in range(8):
-            for j in range(8):
-                piece = self.board[i][j]
-                if piece == player or piece == player * 2:
-                    # Try to find multi-captures from (i, j) using a recursive helper.
-                    capture_moves = self.FindCaptures(i, j, piece, [], self.board)
-                    if capture_moves:
-                        capturing_moves_exist = True
-                        for final_pos, captured_list in capture_moves:
-                            moves.append((i, j, final_pos[0], final_pos[1], captured_list))
-        
+        Moves are packed ints (see MoveEncoding; UnpackMove gives the
+        (start_row, start_col, target_row, target_col, captured) form).
+        The two generation stages are also available on their own
+        (GetCaptureMoves, GetQuietMoves), for a search that generates moves
+        lazily.
+        """
         # If any capturing moves exist, return them only (mandatory capture rule).
-        if capturing_moves_exist:
-            return moves
+        return self.GetCaptureMoves(player) or self.GetQuietMoves(player)
 
-        # Otherwise, generate non-capturing moves.
-        for i in range(8):
-            for j in range(8):
-                piece = self.board[i][j]
-                if piece == player or piece == player * 2:
-                    if abs(piece) == 1:
-                        # For man pieces, white moves upward, black moves downward.
-                        normal_direction = -1 if piece == 1 else 1
-                        directions = [(normal_direction, -1), (normal_direction, 1)]
-                        for d in directions:
-                            new_i, new_j = i + d[0], j + d[1]
-                            if 0 <= new_i < 8 and 0 <= new_j < 8 and self.board[new_i][new_j] == 0:
-                                moves.append((i, j, new_i, new_j, []))
-                    else:
-                        # For kings, allow multi-step moves along any diagonal.
-                        directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-                        for d in directions:
-                            step = 1
-                            while True:
-                                new_i = i + d[0] * step
-                                new_j = j + d[1] * step
-                                if not (0 <= new_i < 8 and 0 <= new_j < 8):
-                                    break
-                                if self.board[new_i][new_j] == 0:
-                                    moves.append((i, j, new_i, new_j, []))
-                                    step += 1
-                                else:
-                                    break
+    def GetCaptureMoves(self, player):
+        """All capturing moves of player, with their complete capture chains."""
+        board = self.board
+        king = player * 2
+        moves = []
+        for sq, (i, j) in enumerate(DARK_SQUARES):
+            piece = board[i][j]
+            if piece == player or piece == king:
+                for final_sq, captured in self.FindCaptures(sq, piece, board):
+                    moves.append(sq | final_sq << MOVE_TARGET_SHIFT | captured << MOVE_CAPTURE_SHIFT)
+        return moves
+
+    def GetQuietMoves(self, player):
+        """All non-capturing moves of player (legal only when there is no capture)."""
+        board = self.board
+        king = player * 2
+        moves = []
+        for sq, (i, j) in enumerate(DARK_SQUARES):
+            piece = board[i][j]
+            if piece == player:
+                # Men step forward: white moves upward, black moves downward.
+                steps = QUIET_STEPS[sq]
+                for d in MAN_DIRECTIONS[player]:
+                    target = steps[d]
+                    if target is not None and board[target[0]][target[1]] == 0:
+                        moves.append(target[2])
+            elif piece == king:
+                # Kings slide along any diagonal until blocked.
+                for ray in QUIET_RAYS[sq]:
+                    for new_i, new_j, move in ray:
+                        if board[new_i][new_j] != 0:
+                            break
+                        moves.append(move)
         return moves
 
-    def FindCaptures(self, i, j, piece, captured_so_far, board):
+    def HasQuietMove(self, player):
+        """Tests if player has a non-capturing move, stopping at the first one."""
+        board = self.board
+        king = player * 2
+        for sq, (i, j) in enumerate(DARK_SQUARES):
+            piece = board[i][j]
+            if piece == player:
+                steps = SQUARE_STEPS[sq]
+                for d in MAN_DIRECTIONS[player]:
+                    target = steps[d]
+                    if target is not None and board[target[0]][target[1]] == 0:
+                        return True
+            elif piece == king:
+                for target in SQUARE_STEPS[sq]:
+                    if target is not None and board[target[0]][target[1]] == 0:
+                        return True
+        return False
+
+    def IsLegalCapture(self, move, player):
+        """Tests a capturing move (e.g. a hash move) by generating the captures of its piece only."""
+        sq = move & SQUARE_INDEX_MASK
+        start_row, start_col = DARK_SQUARES[sq]
+        piece = self.board[start_row][start_col]
+        if piece != player and piece != player * 2:
+            return False
+        capture = (move >> MOVE_TARGET_SHIFT & SQUARE_INDEX_MASK, move >> MOVE_CAPTURE_SHIFT)
+        return capture in self.FindCaptures(sq, piece, self.board)
+
+    def IsLegalQuietMove(self, move, player):
+        """
+        Tests a non-capturing move (e.g. a hash or killer move) without
+        generating any move. The move is only legal if the position has no
+        capture, which the caller checks.
+        """
+        sq = move & SQUARE_INDEX_MASK
+        target_sq = move >> MOVE_TARGET_SHIFT & SQUARE_INDEX_MASK
+        start_row, start_col = DARK_SQUARES[sq]
+        piece = self.board[start_row][start_col]
+        if move >> MOVE_CAPTURE_SHIFT or (piece != player and piece != player * 2):
+            return False
+        if piece == player:
+            steps = SQUARE_STEPS[sq]
+            return any(steps[d] is not None and steps[d][2] == target_sq and self.board[steps[d][0]][steps[d][1]] == 0
+                       for d in MAN_DIRECTIONS[player])
+        for ray in SQUARE_RAYS[sq]:
+            for row, col, ray_sq in ray:
+                if self.board[row][col] != 0:
+                    break
+                if ray_sq == target_sq:
+                    return True
+        return False
+
+    def FindCaptures(self, sq, piece, board):
         """
         Advanced recursive capture detection with optimization.
         
         This method implements sophisticated multi-capture detection:
-        - Prevents infinite loops with captured piece tracking
+        - Prevents infinite loops: captured pieces are removed from the
+          board while the rest of the chain is searched
         - Optimizes for maximum capture sequences
         - Handles complex king capture patterns
         - Maintains move legality throughout the search
+
+        Returns a list of (final_square, captured_mask) for the piece on
+        square sq, the mask holding one bit per captured square. The board
+        is modified in place while searching (the mover's square and
+        captured pieces are emptied) and restored before returning.
         """
         moves = []
-        any_capture = False
+        i, j = DARK_SQUARES[sq]
+        origin = board[i][j]
+        board[i][j] = 0  # The mover has left its square for the rest of the chain
 
-        # Determine allowed directions based on piece type
-        if abs(piece) == 1:
+        if piece == 1 or piece == -1:
             # For man: capture moves are in the forward direction only.
-            directions = [(-1, -1), (-1, 1)] if piece == 1 else [(1, -1), (1, 1)]
+            jumps = SQUARE_JUMPS[sq]
+            for d in MAN_DIRECTIONS[piece]:
+                jump = jumps[d]
+                if jump is None:
+                    continue
+                (enemy_i, enemy_j, enemy_sq), (landing_i, landing_j, landing_sq) = jump
+                enemy = board[enemy_i][enemy_j]
+                if enemy * piece < 0 and board[landing_i][landing_j] == 0:
+                    board[enemy_i][enemy_j] = 0
+                    subsequent = self.FindCaptures(landing_sq, piece, board)
+                    board[enemy_i][enemy_j] = enemy
+                    enemy_bit = 1 << enemy_sq
+                    if subsequent:
+                        for final_sq, captured in subsequent:
+                            moves.append((final_sq, captured | enemy_bit))
+                    else:
+                        moves.append((landing_sq, enemy_bit))
         else:
-            # For kings: all four diagonal directions.
-            directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-
-        for d in directions:
-            if abs(piece) == 1:
-                # Regular piece capture logic
-                enemy_i = i + d[0]
-                enemy_j = j + d[1]
-                landing_i = i + 2 * d[0]
-                landing_j = j + 2 * d[1]
-                if (0 <= enemy_i < 8 and 0 <= enemy_j < 8 and
-                    0 <= landing_i < 8 and 0 <= landing_j < 8):
-                    if (board[enemy_i][enemy_j] != 0 and board[enemy_i][enemy_j] * piece < 0 and
-                        board[landing_i][landing_j] == 0 and ((enemy_i, enemy_j) not in captured_so_far)):
-                        any_capture = True
-                        new_board = [row[:] for row in board]
-                        new_board[i][j] = 0
-                        new_board[enemy_i][enemy_j] = 0
-                        new_board[landing_i][landing_j] = piece
-                        new_captured = captured_so_far + [(enemy_i, enemy_j)]
-                        subsequent = self.FindCaptures(landing_i, landing_j, piece, new_captured, new_board)
-                        if subsequent:
-                            for final_pos, cap_seq in subsequent:
-                                moves.append((final_pos, [(enemy_i, enemy_j)] + cap_seq))
-                        else:
-                            moves.append(((landing_i, landing_j), [(enemy_i, enemy_j)]))
-            else:
-                # King capture logic with multi-step movement
-                step = 1
-                while True:
-                    enemy_i = i + d[0] * step
-                    enemy_j = j + d[1] * step
-                    if not (0 <= enemy_i < 8 and 0 <= enemy_j < 8):
-                        break
-                    if board[enemy_i][enemy_j] == 0:
-                        step += 1
+            # For kings: fly to the first piece on each diagonal, then land
+            # on any empty square behind it.
+            for ray in SQUARE_RAYS[sq]:
+                for index, (enemy_i, enemy_j, enemy_sq) in enumerate(ray):
+                    enemy = board[enemy_i][enemy_j]
+                    if enemy == 0:
                         continue
-                    if board[enemy_i][enemy_j] * piece < 0 and ((enemy_i, enemy_j) not in captured_so_far):
-                        landing_step = step + 1
-                        while True:
-                            landing_i = i + d[0] * landing_step
-                            landing_j = j + d[1] * landing_step
-                            if not (0 <= landing_i < 8 and 0 <= landing_j < 8):
-                                break
+                    if enemy * piece < 0:
+                        board[enemy_i][enemy_j] = 0
+                        enemy_bit = 1 << enemy_sq
+                        for landing_i, landing_j, landing_sq in ray[index + 1:]:
                             if board[landing_i][landing_j] != 0:
                                 break
-                            any_capture = True
-                            new_board = [row[:] for row in board]
-                            new_board[i][j] = 0
-                            new_board[enemy_i][enemy_j] = 0
-                            new_board[landing_i][landing_j] = piece
-                            new_captured = captured_so_far + [(enemy_i, enemy_j)]
-                            subsequent = self.FindCaptures(landing_i, landing_j, piece, new_captured, new_board)
+                            subsequent = self.FindCaptures(landing_sq, piece, board)
                             if subsequent:
-                                for final_pos, cap_seq in subsequent:
-                                    moves.append((final_pos, [(enemy_i, enemy_j)] + cap_seq))
+                                for final_sq, captured in subsequent:
+                                    moves.append((final_sq, captured | enemy_bit))
                             else:
-                                moves.append(((landing_i, landing_j), [(enemy_i, enemy_j)]))
-                            landing_step += 1
-                        break
-                    else:
-                        break
-                    step += 1
-        return moves if any_capture else []
+                                moves.append((landing_sq, enemy_bit))
+                        board[enemy_i][enemy_j] = enemy
+                    break
+
+        board[i][j] = origin
+        return moves
 
     def ApplyMove(self, move):
         """
@@ -304,24 +515,70 @@ class GameBoard:
         - Returns new board instance for AI search
         """
         new_board = self.CloneBoard()
-        start_row, start_col, target_row, target_col, captured = move
-        piece = new_board.board[start_row][start_col]
-        new_board.board[start_row][start_col] = 0
-        new_board.board[target_row][target_col] = piece
-        
-        # Handle captures
-        for cap in captured:
-            cap_row, cap_col = cap
-            new_board.board[cap_row][cap_col] = 0
-        
-        # Handle king promotions
-        if piece == 1 and target_row == 0:  # White piece reaches top
-            new_board.board[target_row][target_col] = 2
-        if piece == -1 and target_row == 7:  # Black piece reaches bottom
-            new_board.board[target_row][target_col] = -2
-        
+        new_board.MakeMove(move)
         return new_board
 
+    def MakeMove(self, move):
+        """
+        Applies a move to this board in place and returns an undo record.
+
+        Same result as ApplyMove (captures, king promotion) without cloning
+        the board, so a search only keeps one board plus one small undo
+        record per ply. Pass the record to UnmakeMove to restore the board.
+        The Zobrist hash and evaluation terms follow every cell change.
+        """
+        board = self.board
+        start_row, start_col = DARK_SQUARES[move & SQUARE_INDEX_MASK]
+        target_row, target_col = DARK_SQUARES[move >> MOVE_TARGET_SHIFT & SQUARE_INDEX_MASK]
+        piece = board[start_row][start_col]
+        target_piece = board[target_row][target_col]
+        captured_pieces = []
+        captured = move >> MOVE_CAPTURE_SHIFT
+        while captured:
+            low = captured & -captured
+            cap_row, cap_col = DARK_SQUARES[low.bit_length() - 1]
+            captured_pieces.append((cap_row, cap_col, board[cap_row][cap_col]))
+            captured ^= low
+        saved = (self.hash, self.EvaluationTerms())
+
+        self.SetSquare(start_row, start_col, 0)
+        self.SetSquare(target_row, target_col, piece)
+        for cap_row, cap_col, _ in captured_pieces:
+            self.SetSquare(cap_row, cap_col, 0)
+
+        # Handle king promotions
+        if piece == 1 and target_row == 0:
+            self.SetSquare(target_row, target_col, 2)
+        if piece == -1 and target_row == 7:
+            self.SetSquare(target_row, target_col, -2)
+
+        return (start_row, start_col, piece, target_row, target_col, target_piece, captured_pieces, saved)
+
+    def SetSquare(self, row, col, piece):
+        """Writes one cell, updating the hash and evaluation terms to match."""
+        old = self.board[row][col]
+        self.board[row][col] = piece
+        keys = ZOBRIST_KEYS[row][col]
+        self.hash ^= keys[old + 2] ^ keys[piece + 2]
+        self.material += MATERIAL_VALUES[piece + 2] - MATERIAL_VALUES[old + 2]
+        self.man_center += MAN_CENTER_UNITS[piece + 2][row][col] - MAN_CENTER_UNITS[old + 2][row][col]
+        self.back_row += BACK_ROW_MEN[piece + 2][row][col] - BACK_ROW_MEN[old + 2][row][col]
+        self.king_center += KING_CENTER_UNITS[piece + 2][row][col] - KING_CENTER_UNITS[old + 2][row][col]
+        self.white_count += (piece > 0) - (old > 0)
+        self.black_count += (piece < 0) - (old < 0)
+
+    def UnmakeMove(self, undo):
+        """Reverts a move applied by MakeMove using its undo record."""
+        board = self.board
+        start_row, start_col, piece, target_row, target_col, target_piece, captured_pieces, saved = undo
+        self.hash, terms = saved
+        (self.material, self.man_center, self.back_row, self.king_center,
+         self.white_count, self.black_count) = terms
+        board[target_row][target_col] = target_piece
+        for cap_row, cap_col, cap_piece in captured_pieces:
+            board[cap_row][cap_col] = cap_piece
+        board[start_row][start_col] = piece
+
     def DisplayBoard(self):
         """Displays the current board state in the terminal with enhanced formatting."""
         print("\n" + "="*50)
@@ -347,3 +604,61 @@ class GameBoard:
         print("W = White (Human), B = Black (Bot), K = King")
         print("="*50)
 
+
+if NUMPY_AVAILABLE:
+    # Batch feature tables, indexed [feature, piece + 2, row * 8 + col] for
+    # the material, man_center, back_row and king_center features
+    PIECE_SQUARE_FEATURES = np.array([
+        [[value for row in table for value in row] for table in tables]
+        for tables in ([[[MATERIAL_VALUES[index]] * 8] * 8 for index in range(5)],
+                       MAN_CENTER_UNITS, BACK_ROW_MEN, KING_CENTER_UNITS)
+    ], dtype=np.int32)
+    BOARD_SQUARES = np.arange(64)
+
+
+def SquareTensor(squares):
+    """(N, 64) int8 tensor of piece codes from a tensor or from N SquareVector lists."""
+    if isinstance(squares, np.ndarray):
+        return squares.astype(np.int8, copy=False).reshape(-1, 64)
+    return np.fromiter(itertools.chain.from_iterable(squares), dtype=np.int8,
+                       count=len(squares) * 64).reshape(-1, 64)
+
+
+def EvaluationFeatures(squares, mobility):
+    """
+    Feature matrix of a batch of N positions.
+
+    - squares: (N, 64) tensor of piece codes (or N SquareVector lists)
+    - mobility: N values of CountMobility(-1) - CountMobility(1)
+
+    Returns (features, endgame): an (N, 5) int64 matrix with the features
+    in EVALUATION_WEIGHT_NAMES order and a boolean vector marking the
+    positions the endgame factor applies to. Requires NumPy.
+    """
+    tensor = SquareTensor(squares)
+    index = tensor.astype(np.intp) + 2
+    sums = PIECE_SQUARE_FEATURES[:, index, BOARD_SQUARES].sum(axis=2, dtype=np.int64)
+    features = np.empty((len(tensor), 5), dtype=np.int64)
+    features[:, 0] = sums[0]
+    features[:, 1] = mobility
+    features[:, 2:] = sums[1:].T
+    endgame = ((tensor > 0).sum(axis=1) <= 3) | ((tensor < 0).sum(axis=1) <= 3)
+    return features, endgame
+
+
+def EvaluatePositions(squares, mobility, weights=DEFAULT_EVALUATION_WEIGHTS):
+    """
+    Vectorised EvaluateBoardIncremental for a batch of N positions.
+
+    The features of the whole batch are gathered from the weight tables
+    at once (EvaluationFeatures); the arithmetic follows FeatureScore step
+    by step, so the scores are identical. Returns a float64 array of N
+    scores. Requires NumPy.
+    """
+    weights = CheckEvaluationWeights(weights)
+    features, endgame = EvaluationFeatures(squares, mobility)
+    scores = features[:, 2] * weights[2] + features[:, 3] * weights[3] + features[:, 4] * weights[4]
+    scores += features[:, 1] * weights[1]
+    scores += features[:, 0] * weights[0]
+    scores[endgame] *= weights[5]
+    return scores
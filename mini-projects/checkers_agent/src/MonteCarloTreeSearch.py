@@ -0,0 +1,237 @@
+import math
+import random
+
+from GameBoard import *
+from PositionHistory import *
+
+# UCT exploration constant (playout results are in [0, 1]); below the
+# textbook 1.4, which spread too few playouts over too many moves here
+UCT_EXPLORATION = 0.7
+
+# Playouts end after this many plies and are scored from the evaluation:
+# random play rarely finishes a checkers game, and a short playout plus
+# the evaluation is both faster and less noisy (against alpha-beta at
+# 0.3 s a move, 30-ply playouts lost all 12 games, 8 plies did better)
+PLAYOUT_PLIES = 8
+
+# Evaluation (a man is worth 10) at which a cut-off playout counts as a
+# 0.91 expected score for black: 1 / (1 + 10 ** (-evaluation / scale))
+PLAYOUT_EVALUATION_SCALE = 10.0
+
+# Playouts kept in flight per pool worker, so a worker always has the
+# next task queued while the parent backs up the last result
+PLAYOUTS_IN_FLIGHT_PER_WORKER = 2
+
+# Visits a pending playout counts as, all lost (see MonteCarloTree.Select)
+VIRTUAL_LOSS = 1
+
+
+def Playout(board, player, max_plies=PLAYOUT_PLIES, policy="guided", rng=random):
+    """
+    Plays moves from board (modified in place) with player to move.
+
+    - "random" picks uniformly among the legal moves
+    - "guided" also plays the longest capture and promotes a man whenever
+      it can, and otherwise moves at random
+    The side to move loses when it has no piece or no legal move; a line
+    with NO_PROGRESS_PLIES plies without a capture or man move is a draw.
+    After max_plies the evaluation decides (see PLAYOUT_EVALUATION_SCALE).
+
+    Returns (result, plies): result from black's point of view (1 win,
+    0.5 draw, 0 loss, or the expected score of the final evaluation).
+    """
+    quiet_plies = 0
+    for plies in range(max_plies):
+        moves = board.GetAllPossibleMoves(player) if board.HasPieces(player) else []
+        if not moves:
+            return (1.0 if player == 1 else 0.0), plies
+        move = None
+        if policy == "guided":
+            if moves[0] >> MOVE_CAPTURE_SHIFT:
+                most = max(CaptureCount(capture) for capture in moves)
+                moves = [capture for capture in moves if CaptureCount(capture) == most]
+            else:
+                promotion_row = PROMOTION_ROWS[player]
+                # A quiet move is reversible exactly when a king makes it
+                promotions = [step for step in moves
+                              if SQUARE_ROWS[step >> MOVE_TARGET_SHIFT & SQUARE_INDEX_MASK] == promotion_row
+                              and not board.IsReversibleMove(step)]
+                if promotions:
+                    move = rng.choice(promotions)
+        if move is None:
+            move = rng.choice(moves)
+        quiet_plies = quiet_plies + 1 if board.IsReversibleMove(move) else 0
+        board.MakeMove(move)
+        if quiet_plies >= NO_PROGRESS_PLIES:
+            return 0.5, plies + 1
+        player = -player
+    return ExpectedScore(board.EvaluateBoardIncremental()), max_plies
+
+
+def ExpectedScore(evaluation):
+    """Black's expected score for an evaluation (see PLAYOUT_EVALUATION_SCALE)."""
+    return 1 / (1 + 10 ** (-evaluation / PLAYOUT_EVALUATION_SCALE))
+
+
+def EvaluationFromScore(score):
+    """Inverse of ExpectedScore, for reporting a win rate as an evaluation."""
+    score = min(max(score, 1e-3), 1 - 1e-3)
+    return PLAYOUT_EVALUATION_SCALE * math.log10(score / (1 - score))
+
+
+class MonteCarloNode:
+    """
+    One position of the search tree.
+
+    - player is the side to move here, move the move leading here
+    - score is the sum of the playout results through this node from the
+      point of view of the side that played move; visits counts them
+    - in_flight counts playouts through this node still running (virtual
+      loss)
+    - untried holds the legal moves without a child yet (None until the
+      node is first expanded); terminal is black's result when the side to
+      move has lost, otherwise None
+    """
+    def __init__(self, parent, move, player, position_hash):
+        self.parent = parent
+        self.move = move
+        self.player = player
+        self.hash = position_hash
+        self.children = []
+        self.untried = None
+        self.terminal = None
+        self.score = 0.0
+        self.visits = 0
+        self.in_flight = 0
+
+    def Expand(self, state):
+        """Generates the legal moves of state, the position of this node."""
+        moves = state.GetAllPossibleMoves(self.player) if state.HasPieces(self.player) else []
+        self.untried = moves[::-1]  # Popped from the end: generation order
+        if not moves:
+            self.terminal = 1.0 if self.player == 1 else 0.0
+
+    def SelectChild(self, exploration):
+        """
+        The child with the highest UCT value. Pending playouts count as
+        visits that were lost, which steers concurrent selections apart.
+        """
+        parent_visits = self.visits + self.in_flight * VIRTUAL_LOSS
+        log_visits = math.log(max(parent_visits, 1))
+        best, best_value = None, -1.0
+        for child in self.children:
+            visits = child.visits + child.in_flight * VIRTUAL_LOSS
+            value = child.score / visits + exploration * math.sqrt(log_visits / visits)
+            if value > best_value:
+                best, best_value = child, value
+        return best
+
+
+class MonteCarloTree:
+    """
+    UCT search tree over GameBoard (or BitBoard) positions.
+
+    Select walks down from the root by UCT, expanding one new child per
+    call, and marks the path with a virtual loss; Backpropagate adds the
+    playout result along the path and removes the mark. Playouts may run
+    anywhere in between (SearchToolBox.MonteCarloSearch runs several at
+    once in a process pool). Between moves the tree is kept and re-rooted
+    on the position the game reached (Reroot).
+    """
+    def __init__(self, state, player, exploration=UCT_EXPLORATION):
+        self.exploration = exploration
+        self.SetRoot(MonteCarloNode(None, None, player, state.hash), state)
+
+    def SetRoot(self, root, state):
+        """Makes root, the node of state, the root of the tree."""
+        root.parent = None
+        root.move = None
+        self.root = root
+        self.root_state = state.CloneBoard()
+        if root.untried is None:
+            root.Expand(self.root_state)
+        self.depth = 0  # Deepest node selected since the tree was rooted here
+
+    def Reroot(self, state, player, plies=2):
+        """
+        Moves the root to the node of state with player to move, searched
+        within plies moves of the current root (the position after the
+        bot's move and the opponent's reply). Returns False if the tree has
+        no such node; the caller then starts a new tree.
+        """
+        level = [self.root]
+        for _ in range(plies + 1):
+            for node in level:
+                if node.hash == state.hash and node.player == player and node.in_flight == 0:
+                    self.SetRoot(node, state)
+                    return True
+            level = [child for node in level for child in node.children]
+        return False
+
+    def Select(self):
+        """
+        Returns (leaf, state): a newly expanded node (or a terminal one) and
+        its position, a fresh board the caller may keep. Every node on the
+        path gets one playout in flight.
+        """
+        node = self.root
+        state = self.root_state.CloneBoard()
+        depth = 0
+        node.in_flight += 1
+        while node.terminal is None:
+            if node.untried:
+                move = node.untried.pop()
+                state.MakeMove(move)
+                child = MonteCarloNode(node, move, -node.player, state.hash)
+                child.Expand(state)
+                node.children.append(child)
+                node = child
+                node.in_flight += 1
+                depth += 1
+                break
+            node = node.SelectChild(self.exploration)
+            state.MakeMove(node.move)
+            node.in_flight += 1
+            depth += 1
+        self.depth = max(self.depth, depth)
+        return node, state
+
+    def Backpropagate(self, node, result):
+        """Adds result (black's point of view) to node and its ancestors and removes their virtual loss."""
+        while node is not None:
+            node.in_flight -= 1
+            node.visits += 1
+            if node.parent is not None:
+                node.score += result if node.parent.player == -1 else 1.0 - result
+            node = node.parent
+
+    def BestChild(self):
+        """The most visited root child (the move to play), or None without legal moves."""
+        return max(self.root.children, key=lambda child: child.visits, default=None)
+
+    def PrincipalVariation(self, max_length=64):
+        """Moves of the most visited line from the root."""
+        line = []
+        node = self.root
+        while node.children and len(line) < max_length:
+            node = max(node.children, key=lambda child: child.visits)
+            if node.visits == 0:
+                break
+            line.append(node.move)
+        return line
+
+    def Size(self):
+        """Number of nodes in the tree."""
+        count = 0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(node.children)
+        return count
+
+
+def PlayoutTask(task):
+    """Runs one playout in a pool worker (see Playout)."""
+    state, player, max_plies, policy = task
+    return Playout(state, player, max_plies, policy)
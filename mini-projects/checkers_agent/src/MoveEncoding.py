@@ -0,0 +1,84 @@
+# The 32 playable (dark) squares are numbered row by row, so square
+# s sits at row s // 4 and bit s of a square mask is that square.
+SQUARE_TO_CELL = [(row, col) for row in range(8) for col in range(8) if (row + col) % 2 == 1]
+CELL_TO_SQUARE = {cell: sq for sq, cell in enumerate(SQUARE_TO_CELL)}
+SQUARE_ROWS = [row for row, _ in SQUARE_TO_CELL]
+
+# Moves are packed into one int, so generating, comparing, hashing and
+# storing them allocates no tuple or list:
+# - bits 0-4: start square
+# - bits 5-9: target square
+# - bits 10-41: mask of the captured squares (0 for a quiet move)
+# The low MOVE_TARGET_SHIFT * 2 bits (start * 32 + target) index the
+# history table. The captured pieces are a set: capture chains that take
+# the same pieces between the same squares pack to the same int (the
+# generators still list every chain, as they did with capture lists).
+MOVE_TARGET_SHIFT = 5
+MOVE_CAPTURE_SHIFT = 10
+SQUARE_INDEX_MASK = 31
+MOVE_SQUARES_MASK = (1 << MOVE_CAPTURE_SHIFT) - 1
+
+# Row a man of each side (1 white, -1 black) is promoted on
+PROMOTION_ROWS = {1: 0, -1: 7}
+
+
+def PackMove(move):
+    """
+    Packs a move given as (start_row, start_col, target_row, target_col,
+    captured_cells), the format of the GUI and text interface.
+    """
+    start_row, start_col, target_row, target_col, captured = move
+    captured_mask = 0
+    for cell in captured:
+        captured_mask |= 1 << CELL_TO_SQUARE[cell]
+    return (CELL_TO_SQUARE[(start_row, start_col)] | CELL_TO_SQUARE[(target_row, target_col)] << MOVE_TARGET_SHIFT
+            | captured_mask << MOVE_CAPTURE_SHIFT)
+
+
+def UnpackMove(move):
+    """
+    Inverse of PackMove: (start_row, start_col, target_row, target_col,
+    captured_cells), the captured cells in square order.
+    """
+    return MoveStart(move) + MoveTarget(move) + (CapturedCells(move),)
+
+
+def MoveStart(move):
+    """(row, col) the moving piece starts from."""
+    return SQUARE_TO_CELL[move & SQUARE_INDEX_MASK]
+
+
+def MoveTarget(move):
+    """(row, col) the moving piece ends on."""
+    return SQUARE_TO_CELL[move >> MOVE_TARGET_SHIFT & SQUARE_INDEX_MASK]
+
+
+def CapturedSquares(move):
+    """Squares of the pieces the move captures, in ascending order."""
+    squares = []
+    mask = move >> MOVE_CAPTURE_SHIFT
+    while mask:
+        low = mask & -mask
+        squares.append(low.bit_length() - 1)
+        mask ^= low
+    return squares
+
+
+def CapturedCells(move):
+    """(row, col) of the pieces the move captures, in square order."""
+    return [SQUARE_TO_CELL[sq] for sq in CapturedSquares(move)]
+
+
+def CaptureCount(move):
+    """Number of pieces the move captures."""
+    return bin(move >> MOVE_CAPTURE_SHIFT).count("1")
+
+
+def FormatMove(move, arrow="->"):
+    """Human-readable "(row,col) -> (row,col)" of a move, with its captures."""
+    (start_row, start_col), (target_row, target_col) = MoveStart(move), MoveTarget(move)
+    text = f"({start_row},{start_col}) {arrow} ({target_row},{target_col})"
+    captured = CapturedCells(move)
+    if captured:
+        text += " x " + " ".join(f"({row},{col})" for row, col in captured)
+    return text
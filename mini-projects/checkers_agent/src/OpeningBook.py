@@ -0,0 +1,97 @@
+import argparse
+import os
+import time
+
+from SearchToolBox import *
+from RecordFile import *
+
+OPENING_BOOK_MAGIC = b"CKBOOK02"
+OPENING_BOOK_RECORD = "<QQh"  # position key, packed move (see MoveEncoding), score * 100
+
+DEFAULT_OPENING_BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "openingbook.bin")
+
+
+class OpeningBook:
+    """
+    Read-only opening book: the bot's (black's) move for known positions.
+
+    Positions are looked up by Zobrist key in a memory-mapped file sorted
+    by key (binary search). A record stores the full packed move,
+    captured pieces included, so capture chains sharing their start and
+    target squares stay apart; a record matching no legal move (a hash
+    collision) is ignored.
+    """
+    def __init__(self, path=DEFAULT_OPENING_BOOK_PATH):
+        self.path = path
+        self.file = SortedRecordFile(path, OPENING_BOOK_MAGIC, OPENING_BOOK_RECORD)
+        self.plies = self.file.metadata  # Bot moves covered from the start position
+        self.hits = 0
+
+    def GetMove(self, board, player=-1):
+        """Returns (move, score) stored for board with player to move, or None."""
+        record = self.file.Lookup(ZobristKey(board.hash, player))
+        if record is None:
+            return None
+        if record[1] not in board.GetAllPossibleMoves(player):
+            return None
+        self.hits += 1
+        return record[1], record[2] / 100
+
+    def Close(self):
+        """Unmaps the book file."""
+        self.file.Close()
+
+
+class OpeningBookBuilder:
+    """
+    Builds the opening book with deep offline searches.
+
+    Starting from the initial position (white moves first), every white
+    reply is followed, and in every position where black is to move a
+    search of `depth` plies picks the book move. Only that move is
+    followed further, for `moves` bot moves. Transpositions are searched
+    once.
+    """
+    def __init__(self, moves=3, depth=8, strategy="alphabeta_ordering"):
+        self.moves = moves
+        self.depth = depth
+        self.strategy = strategy
+        self.toolbox = SearchToolBox(time_limit=10 ** 6, max_depth=depth)
+        self.toolbox.telemetry = NullSink()
+        self.entries = {}
+
+    def Expand(self, board, moves_left):
+        """Adds the book moves for every black position reachable from board (white to move)."""
+        for white_move in board.GetAllPossibleMoves(1):
+            child = board.ApplyMove(white_move)
+            key = ZobristKey(child.hash, -1)
+            if key not in self.entries:
+                if child.IsGoalState() or not child.GetAllPossibleMoves(-1):
+                    continue
+                move, score = self.toolbox.ChooseMove(child, self.strategy)
+                self.entries[key] = (move, score)
+                print(f"  {len(self.entries):>4} positions: book move {FormatMove(move)} (score {score:.2f})")
+            move, _ = self.entries[key]
+            if moves_left > 1:
+                self.Expand(child.ApplyMove(move), moves_left - 1)
+
+    def Build(self, path=DEFAULT_OPENING_BOOK_PATH):
+        """Runs the searches and writes the book to path."""
+        started = time.time()
+        print(f"Building opening book: {self.moves} bot moves, depth {self.depth}")
+        self.Expand(GameBoard(), self.moves)
+        records = [(key, move, max(-32768, min(32767, round(score * 100))))
+                   for key, (move, score) in self.entries.items()]
+        SortedRecordFile.Write(path, OPENING_BOOK_MAGIC, OPENING_BOOK_RECORD, records, self.moves)
+        print(f"Wrote {len(records):,} positions ({os.path.getsize(path):,} bytes) to {path} "
+              f"in {time.time() - started:.1f}s")
+        return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Builds the opening book")
+    parser.add_argument("--moves", type=int, default=3, help="bot moves covered from the start position")
+    parser.add_argument("--depth", type=int, default=8, help="search depth of every book move")
+    parser.add_argument("--output", default=DEFAULT_OPENING_BOOK_PATH)
+    args = parser.parse_args()
+    OpeningBookBuilder(args.moves, args.depth).Build(args.output)
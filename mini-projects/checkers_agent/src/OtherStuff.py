@@ -1,3 +1,35 @@
+import math
+
+
+class RunningStatistics:
+    """
+    Streaming count, mean, variance, minimum and maximum (Welford's
+    algorithm): O(1) memory and time per value, with no stored samples.
+    """
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared differences from the mean
+        self.minimum = None
+        self.maximum = None
+
+    def Update(self, value):
+        """Adds one value."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    def Variance(self):
+        """Sample variance (0 for fewer than two values)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def StandardDeviation(self):
+        return math.sqrt(self.Variance())
+
+
 class OtherStuff:
     """
     Comprehensive analytics and performance tracking system.
@@ -14,14 +46,37 @@ class OtherStuff:
     - Algorithm efficiency comparison
     - Detailed reporting system
     """
+    # OtherStuff is also a telemetry sink (Telemetry.py): it keeps running
+    # aggregates of the bot's searches without storing the events
+    enabled = True
+
     def __init__(self):
         self.analytics = {
             "human": {"nodes_expanded": 0.0, "pruning": 0.0, "moves": 0.0, "avg_time": 0.0},
-            "bot": {"nodes_expanded": 0.0, "pruning": 0.0, "ordering_gain": 0.0, "moves": 0.0, "avg_time": 0.0}
+            "bot": {"nodes_expanded": 0.0, "pruning": 0.0, "ordering_gain": 0.0, "ordered_moves": 0.0,
+                    "moves": 0.0, "avg_time": 0.0}
         }
-        self.move_times = {"human": [], "bot": []}
+        self.move_times = {"human": RunningStatistics(), "bot": RunningStatistics()}
+        # Bot search aggregates, fed by SearchToolBox "search" telemetry events
+        self.search_statistics = {"depth": RunningStatistics(), "elapsed": RunningStatistics(),
+                                  "nodes_per_second": RunningStatistics()}
+        self.evaluation_cache = {"hits": 0, "misses": 0}
+
+    def Emit(self, event):
+        """Aggregates one SearchToolBox event; only whole-search summaries are kept."""
+        if event["event"] != "search":
+            return
+        self.search_statistics["depth"].Update(event["depth"])
+        self.search_statistics["elapsed"].Update(event["elapsed"])
+        if event["elapsed"] > 0:
+            self.search_statistics["nodes_per_second"].Update(event["nodes"] / event["elapsed"])
+        self.evaluation_cache["hits"] += event["evaluation_cache_hits"]
+        self.evaluation_cache["misses"] += event["evaluation_cache_misses"]
 
-    def LogMove(self, player, nodes, pruning, ordering_gain=0, move_time=0):
+    def Close(self):
+        pass
+
+    def LogMove(self, player, nodes, pruning, ordering_gain=None, move_time=0):
         """
         Advanced move logging with comprehensive statistics.
         
@@ -30,19 +85,23 @@ class OtherStuff:
         - Timing information
         - Move efficiency analysis
         - Algorithm effectiveness
+
+        ordering_gain is None for bot moves that no ordering search chose
+        (book moves, other strategies); they are left out of its average.
         """
         self.analytics[player]["nodes_expanded"] += nodes
         self.analytics[player]["pruning"] += pruning
-        if player == "bot":
+        if player == "bot" and ordering_gain is not None:
             self.analytics[player]["ordering_gain"] += ordering_gain
+            self.analytics[player]["ordered_moves"] += 1
         self.analytics[player]["moves"] += 1
         
         # Track timing for performance analysis
         if move_time > 0:
-            self.move_times[player].append(move_time)
-            self.analytics[player]["avg_time"] = sum(self.move_times[player]) / len(self.move_times[player])
+            self.move_times[player].Update(move_time)
+            self.analytics[player]["avg_time"] = self.move_times[player].mean
 
-    def DisplayMoveAnalytics(self, player, nodes, pruning, ordering_gain=0):
+    def DisplayMoveAnalytics(self, player, nodes, pruning, ordering_gain=None):
         """
         Real-time analytics display for move-by-move analysis.
         
@@ -56,7 +115,8 @@ class OtherStuff:
         print(f"Nodes expanded: {nodes:,}")
         print(f"Pruning performed: {pruning:,}")
         if player == "bot":
-            print(f"Ordering gains: {ordering_gain:,}")
+            if ordering_gain is not None:
+                print(f"First-move cutoff rate: {ordering_gain:.1f}%")
             if pruning > 0:
                 pruning_efficiency = (pruning / (nodes + pruning)) * 100
                 print(f"Pruning efficiency: {pruning_efficiency:.1f}%")
@@ -83,7 +143,9 @@ class OtherStuff:
             report_str += f"\n  Total pruning performed: {self.analytics[player]['pruning']:,}"
             
             if player == "bot":
-                report_str += f"\n  Total ordering gains: {self.analytics[player]['ordering_gain']:,}"
+                if self.analytics[player]['ordered_moves'] > 0:
+                    avg_ordering = self.analytics[player]['ordering_gain'] / self.analytics[player]['ordered_moves']
+                    report_str += f"\n  Average first-move cutoff rate: {avg_ordering:.1f}%"
                 if self.analytics[player]['nodes_expanded'] > 0:
                     total_efficiency = (self.analytics[player]['pruning'] / 
                                       (self.analytics[player]['nodes_expanded'] + self.analytics[player]['pruning'])) * 100
@@ -94,7 +156,9 @@ class OtherStuff:
                 report_str += f"\n  Average nodes per move: {avg_nodes:,.0f}"
             
             if self.analytics[player]['avg_time'] > 0:
-                report_str += f"\n  Average move time: {self.analytics[player]['avg_time']:.3f}s"
+                times = self.move_times[player]
+                report_str += (f"\n  Average move time: {times.mean:.3f}s (sd {times.StandardDeviation():.3f}s, "
+                               f"max {times.maximum:.3f}s)")
             
             report_str += "\n"
         
@@ -104,7 +168,18 @@ class OtherStuff:
             report_str += f"\n  Search efficiency: {self.analytics['bot']['nodes_expanded']:,} total nodes"
             report_str += f"\n  Optimization effectiveness: {self.analytics['bot']['pruning']:,} branches pruned"
             if self.analytics['bot']['ordering_gain'] > 0:
-                report_str += f"\n  Move ordering benefits: {self.analytics['bot']['ordering_gain']:,} additional prunes"
+                avg_ordering = self.analytics['bot']['ordering_gain'] / self.analytics['bot']['ordered_moves']
+                report_str += f"\n  Move ordering quality: {avg_ordering:.1f}% of cutoffs on the first move"
+            depth = self.search_statistics["depth"]
+            if depth.count > 0:
+                speed = self.search_statistics["nodes_per_second"]
+                report_str += (f"\n  Searches: {depth.count}, depth reached {depth.mean:.1f} on average "
+                               f"(min {depth.minimum}, max {depth.maximum})")
+                report_str += f"\n  Search speed: {speed.mean:,.0f} nodes/s (sd {speed.StandardDeviation():,.0f})"
+            probes = self.evaluation_cache["hits"] + self.evaluation_cache["misses"]
+            if probes > 0:
+                report_str += (f"\n  Evaluation cache: {100.0 * self.evaluation_cache['hits'] / probes:.1f}% hits "
+                               f"over {probes:,} static evaluations")
         
         report_str += "\n" + "="*60
         print(report_str)
@@ -1,8 +1,13 @@
 from SearchToolBox import *
 from GameBoard import *
 from OtherStuff import *
+from OpeningBook import *
+from PositionHistory import *
 
 import os
+import threading
+import time
+import traceback
 if not os.environ.get("DISPLAY"):
     os.environ["DISPLAY"] = ":0"
 
@@ -15,6 +20,9 @@ except ImportError:
     GUI_AVAILABLE = False
     print("GUI not available - falling back to text interface")
 
+# How often the GUI checks on the bot's search thread
+BOT_POLL_INTERVAL_MS = 100
+
 
 class PlayingTheGame:
     """
@@ -36,29 +44,36 @@ class PlayingTheGame:
         self.selected_square = None
         self.legal_moves = []
         self.game_over = False
+        self.bot_thread = None  # Searches the bot's move while the GUI stays responsive
+        self.bot_result = None  # (move, score) left by bot_thread
+        self.bot_error = None  # Exception raised in bot_thread, shown by PollBotMove
+        self.bot_started = 0.0
+        self.bot_used_book = False  # Whether the bot's last move came from the opening book
         
         # Advanced AI features
         self.opening_book = self.InitializeOpeningBook()
         self.move_history = []
+        self.position_history = None  # Hashes of the game's positions (draw detection)
         self.game_phase = "opening"  # opening, middlegame, endgame
+        self.use_pondering = True  # Search the expected next position while the human thinks
 
     def InitializeOpeningBook(self):
         """
-        Initialize opening book with common checkers openings.
-        
+        Loads the opening book built by OpeningBook.py, if there is one.
+
         This demonstrates advanced AI concepts:
         - Opening theory and memorized positions
         - Database-driven decision making
-        - Pattern recognition in early game
+        - Positions recognised by Zobrist hash, whatever the move order
         - Real-world AI technique used in chess engines
         """
-        opening_book = {
-            # Common opening moves for black (AI)
-            "3-1": [(2, 1, 3, 0), (2, 1, 3, 2)],  # Black's first move options
-            "3-3": [(2, 3, 3, 2), (2, 3, 3, 4)],  # Alternative first move
-            "3-5": [(2, 5, 3, 4), (2, 5, 3, 6)],  # Another common opening
-        }
-        return opening_book
+        if not os.path.exists(DEFAULT_OPENING_BOOK_PATH):
+            return None
+        try:
+            return OpeningBook(DEFAULT_OPENING_BOOK_PATH)
+        except RecordFileError as error:
+            print(f"Opening book not loaded: {error}")
+            return None
 
     def GetOpeningMove(self):
         """
@@ -67,28 +82,81 @@ class PlayingTheGame:
         This demonstrates:
         - Database-driven AI decision making
         - Pattern recognition and memorization
-        - Efficient early-game play
-        - Real-world AI optimization techniques
+        - Efficient early-game play: a book move costs one lookup
+          instead of a full search
         """
-        if len(self.move_history) < 2:  # Only use opening book for first few moves
-            # Check if current position matches any opening
-            for opening_name, moves in self.opening_book.items():
-                if self.IsOpeningPosition(opening_name):
-                    return moves[0]  # Return first recommended move
-        return None
+        if self.opening_book is None:
+            return None
+        entry = self.opening_book.GetMove(self.game_board)
+        return entry[0] if entry is not None else None
 
-    def IsOpeningPosition(self, opening_name):
+    def IsOpeningPosition(self):
         """
-        Check if current board position matches a known opening.
+        Check if the current board position (bot to move) is in the opening book.
         
         This demonstrates:
-        - Position recognition algorithms
+        - Position recognition by Zobrist hash
         - Pattern matching in AI
-        - Strategic position evaluation
         """
-        # Simplified opening position checking
-        # In a real implementation, this would compare board states
-        return len(self.move_history) == 0  # For simplicity, assume first move
+        return self.opening_book is not None and self.opening_book.GetMove(self.game_board) is not None
+
+    def ChooseBotMove(self):
+        """
+        Picks the bot's move: opening book first, then a finished ponder
+        search of this exact position, then a regular search.
+        """
+        opening_move = self.GetOpeningMove()
+        self.bot_used_book = opening_move is not None
+        if opening_move:
+            print("Bot used opening book move!")
+            return opening_move, self.search_toolbox.StaticEvaluation(self.game_board)
+        ponder_result = self.search_toolbox.TakePonderResult(self.game_board)
+        if ponder_result is not None:
+            print("Bot used its ponder search (you played the expected move)!")
+            return ponder_result
+        # Get bot move using search algorithms
+        return self.search_toolbox.ChooseMove(self.game_board, self.strategy, history=self.position_history)
+
+    def BotOrderingGain(self):
+        """First-move cutoff rate of the search behind the bot's last move, or None without an ordering search."""
+        if self.bot_used_book or self.strategy not in ("alphabeta_ordering", "parallel"):
+            return None
+        return self.search_toolbox.ordering_gain
+
+    def StartPondering(self, bot_move):
+        """Lets the bot search its expected next position while the human thinks."""
+        if self.use_pondering and not self.game_board.IsGoalState():
+            self.search_toolbox.StartPondering(self.game_board, bot_move, self.strategy, self.position_history)
+
+    def ApplyGameMove(self, move):
+        """Plays move on the game board and records it in the move and position histories."""
+        reversible = self.game_board.IsReversibleMove(move)
+        self.move_history.append(move)
+        self.game_board = self.game_board.ApplyMove(move)
+        self.position_history.Push(self.game_board.hash, reversible)
+
+    def GameResult(self, player):
+        """
+        Result of the game with player (1 you, -1 the bot) to move, or None
+        while it goes on.
+
+        - A side without pieces, or to move without a legal move, has lost
+        - A position occurring for the REPETITION_LIMIT-th time, or
+          NO_PROGRESS_PLIES plies without a capture or a man move, is a draw
+        """
+        board = self.game_board
+        winner = None
+        if not board.HasPieces(-player):
+            winner = player
+        elif not board.HasPieces(player) or not board.GetAllPossibleMoves(player):
+            winner = -player
+        if winner is not None:
+            return "Black (Bot) wins!" if winner == -1 else "White (You) win!"
+        if self.position_history.Repetitions() >= REPETITION_LIMIT - 1:
+            return "It's a draw! (threefold repetition)"
+        if self.position_history.NoProgressPlies() >= NO_PROGRESS_PLIES:
+            return f"It's a draw! ({NO_PROGRESS_PLIES // 2} moves each without a capture or man move)"
+        return None
 
     def DetermineGamePhase(self):
         """
@@ -120,6 +188,7 @@ class PlayingTheGame:
         - Dynamic parameter adjustment
         - Phase-specific optimization
         - Real-time strategy adaptation
+        - Phase-dependent soft time budget
         """
         if self.game_phase == "opening":
             # In opening, focus on development and position
@@ -131,6 +200,38 @@ class PlayingTheGame:
             # In endgame, search deeper for tactical opportunities
             self.search_toolbox.max_depth = min(self.max_depth + 1, 10)
 
+        # Soft time limit: how much of the time limit may pass before no new depth is started
+        self.search_toolbox.SetTimeBudget(self.game_phase)
+
+    def AttachTelemetry(self):
+        """
+        Sends the bot's search events to the console and to the game's
+        analytics, which aggregate them for the final report.
+        """
+        self.search_toolbox.telemetry = TelemetryFanout([ConsoleSink(), self.analytics])
+
+    def CreateSearchToolBox(self):
+        """
+        Creates the bot's search toolbox for the chosen time limit and depth.
+
+        The endgame tablebase is attached when it has been generated
+        (python3 TableBase.py); without it the endgame is searched as usual.
+        Tuned evaluation weights (python3 Tuner.py tune) replace the
+        hand-picked ones the same way.
+        """
+        search_toolbox = SearchToolBox(self.time_limit, self.max_depth)
+        if os.path.exists(DEFAULT_WEIGHTS_PATH):
+            try:
+                search_toolbox.weights = LoadEvaluationWeights(DEFAULT_WEIGHTS_PATH)
+            except ValueError as error:
+                print(f"Evaluation weights not loaded: {error}")
+        if os.path.exists(DEFAULT_TABLEBASE_PATH):
+            try:
+                search_toolbox.tablebase = TableBase(DEFAULT_TABLEBASE_PATH)
+            except RecordFileError as error:
+                print(f"Endgame tablebase not loaded: {error}")
+        return search_toolbox
+
     def GetUserParameters(self):
         """Prompts the user to select strategy, time limit, and max depth."""
         print("\n" + "="*60)
@@ -145,9 +246,11 @@ class PlayingTheGame:
         print("1. Minimax")
         print("2. Alpha-Beta Pruning")
         print("3. Alpha-Beta Pruning with Ordering")
+        print("4. Parallel Alpha-Beta (all CPU cores)")
+        print("5. Monte Carlo Tree Search")
         while True:
             try:
-                choice = int(input("Enter your choice (1-3): "))
+                choice = int(input("Enter your choice (1-5): "))
                 if choice == 1:
                     self.strategy = "minimax"
                     break
@@ -157,8 +260,14 @@ class PlayingTheGame:
                 elif choice == 3:
                     self.strategy = "alphabeta_ordering"
                     break
+                elif choice == 4:
+                    self.strategy = "parallel"
+                    break
+                elif choice == 5:
+                    self.strategy = "mcts"
+                    break
                 else:
-                    print("Please enter a number between 1 and 3.")
+                    print("Please enter a number between 1 and 5.")
             except ValueError:
                 print("Please enter a valid number.")
 
@@ -239,6 +348,17 @@ class PlayingTheGame:
         self.analytics_label = tk.Label(self.root, text="", font=("Arial", 10))
         self.analytics_label.pack(pady=5)
 
+        # Search progress and "Move now", active while the bot thinks
+        progress_frame = tk.Frame(self.root)
+        progress_frame.pack(pady=5)
+        self.progress_bar = ttk.Progressbar(progress_frame, length=200, mode="determinate")
+        self.progress_bar.pack(side=tk.LEFT, padx=5)
+        self.progress_label = tk.Label(progress_frame, text="", font=("Arial", 10), width=32, anchor="w")
+        self.progress_label.pack(side=tk.LEFT, padx=5)
+        self.move_now_button = tk.Button(progress_frame, text="Move now", command=self.MoveNow,
+                                         state=tk.DISABLED)
+        self.move_now_button.pack(side=tk.LEFT, padx=5)
+
     def DrawBoard(self):
         """Draws the checkers board and pieces."""
         self.canvas.delete("all")
@@ -298,7 +418,7 @@ class PlayingTheGame:
 
     def OnCanvasClick(self, event):
         """Handles mouse clicks on the canvas."""
-        if self.game_over:
+        if self.game_over or self.bot_thread is not None:
             return
         
         # Convert click coordinates to board position
@@ -328,8 +448,7 @@ class PlayingTheGame:
                 # Find the actual move
                 start_row, start_col = self.selected_square
                 for move in self.game_board.GetAllPossibleMoves(1):
-                    if (move[0] == start_row and move[1] == start_col and 
-                        move[2] == row and move[3] == col):
+                    if MoveStart(move) == (start_row, start_col) and MoveTarget(move) == (row, col):
                         self.MakeMove(move)
                         break
             else:
@@ -345,93 +464,148 @@ class PlayingTheGame:
         moves = self.game_board.GetAllPossibleMoves(1)
         legal_positions = []
         for move in moves:
-            if move[0] == row and move[1] == col:
-                legal_positions.append((move[2], move[3]))
+            if MoveStart(move) == (row, col):
+                legal_positions.append(MoveTarget(move))
         return legal_positions
 
     def MakeMove(self, move):
         """Makes a move and updates the game state with advanced AI features."""
-        # Record move in history
-        self.move_history.append(move)
-        
         # Apply human move
-        self.game_board = self.game_board.ApplyMove(move)
+        self.search_toolbox.StopPondering()
+        self.ApplyGameMove(move)
         self.analytics.LogMove("human", nodes=0, pruning=0)
         
-        self.status_label.config(text=f"Your move: ({move[0]},{move[1]}) → ({move[2]},{move[3]})")
+        self.status_label.config(text=f"Your move: {FormatMove(move, '→')}")
         self.DrawBoard()
         
-        # Check if game is over
-        if self.game_board.IsGoalState():
-            self.EndGame()
+        # Check if game is over (the bot may have no piece or move left, or it is a draw)
+        result = self.GameResult(-1)
+        if result is not None:
+            self.EndGame(result)
             return
         
         # Update game phase and adjust AI parameters
         self.DetermineGamePhase()
         self.AdjustSearchParameters()
         
-        # Bot's turn with advanced AI features
-        self.root.update()
+        # Bot's turn, searched in a thread so the window stays responsive
+        self.StartBotMove()
+
+    def StartBotMove(self):
+        """
+        Starts the bot's move (book, ponder result or search) in a worker
+        thread and polls it with root.after. Tkinter is only used from the
+        GUI thread: the worker just leaves its result in bot_result.
+        """
         self.status_label.config(text=f"Bot is thinking... (Phase: {self.game_phase})")
-        self.root.update()
-        
-        # Check for opening book move first
-        opening_move = self.GetOpeningMove()
-        if opening_move:
-            bot_move = opening_move
-            score = self.game_board.EvaluateBoard()
-            print("Bot used opening book move!")
-        else:
-            # Get bot move using search algorithms
-            bot_move, score = self.search_toolbox.ChooseMove(self.game_board, self.strategy)
-        
+        self.progress_bar.config(maximum=self.search_toolbox.max_depth, value=0)
+        self.move_now_button.config(state=tk.NORMAL)
+        self.bot_result = None
+        self.bot_error = None
+        self.bot_started = time.time()
+        self.bot_thread = threading.Thread(target=self.SearchBotMove, daemon=True)
+        self.bot_thread.start()
+        self.root.after(BOT_POLL_INTERVAL_MS, self.PollBotMove)
+
+    def SearchBotMove(self):
+        """
+        Worker thread body: chooses the bot's move. An exception is kept
+        for PollBotMove, which reports it from the GUI thread.
+        """
+        try:
+            self.bot_result = self.ChooseBotMove()
+        except Exception as error:
+            self.bot_error = error
+
+    def PollBotMove(self):
+        """Shows the search progress, and plays the bot's move once the thread is done."""
+        if self.bot_thread is None:
+            return  # The search was abandoned (new game)
+        if self.bot_thread.is_alive():
+            depth = self.search_toolbox.current_depth
+            elapsed = time.time() - self.bot_started
+            self.progress_bar.config(value=max(depth - 1, 0))  # Depths fully searched
+            if depth > 0:
+                self.progress_label.config(text=f"Depth {depth}/{self.search_toolbox.max_depth}, "
+                                                f"{self.search_toolbox.nodes_expanded:,} nodes, {elapsed:.1f}s")
+            elif self.strategy == "mcts":
+                self.progress_label.config(text=f"{self.search_toolbox.playouts:,} playouts, {elapsed:.1f}s")
+            else:
+                # The parallel search only reports back when its workers finish
+                self.progress_label.config(text=f"Searching... {elapsed:.1f}s")
+            self.root.after(BOT_POLL_INTERVAL_MS, self.PollBotMove)
+            return
+        self.FinishBotSearch()
+        if self.bot_error is not None:
+            self.ReportBotError(self.bot_error)
+            return
+        self.PlayBotMove(self.bot_result[0])
+
+    def FinishBotSearch(self):
+        """Joins the search thread and resets the progress display."""
+        self.bot_thread.join()
+        self.bot_thread = None
+        self.search_toolbox.ClearStop()
+        self.move_now_button.config(state=tk.DISABLED)
+        self.progress_bar.config(value=0)
+        self.progress_label.config(text="")
+
+    def ReportBotError(self, error):
+        """Stops the game after the bot's search failed and shows why."""
+        traceback.print_exception(type(error), error, error.__traceback__)
+        self.game_over = True
+        self.search_toolbox.StopPondering()
+        self.status_label.config(text=f"Bot search failed: {error}. Start a new game.")
+        messagebox.showerror("Bot Error", f"The bot could not choose a move:\n{type(error).__name__}: {error}")
+
+    def MoveNow(self):
+        """Stops the bot's search; it plays the best move found so far."""
+        if self.bot_thread is not None:
+            self.search_toolbox.StopSearch()
+            self.move_now_button.config(state=tk.DISABLED)
+
+    def PlayBotMove(self, bot_move):
+        """Applies the bot's move and updates the board, status and analytics."""
         if bot_move is None:
-            self.status_label.config(text="Bot has no legal moves!")
-            self.EndGame()
+            self.EndGame("White (You) win! The bot has no legal moves.")
             return
         
-        # Record bot move in history
-        self.move_history.append(bot_move)
-        
         # Apply bot move
-        self.game_board = self.game_board.ApplyMove(bot_move)
+        self.ApplyGameMove(bot_move)
         self.analytics.LogMove("bot", 
                              nodes=self.search_toolbox.nodes_expanded,
                              pruning=self.search_toolbox.pruning_count,
-                             ordering_gain=self.search_toolbox.ordering_gain)
+                             ordering_gain=self.BotOrderingGain(),
+                             move_time=time.time() - self.bot_started)
         
         # Update status and analytics
-        self.status_label.config(text=f"Bot's move: ({bot_move[0]},{bot_move[1]}) → ({bot_move[2]},{bot_move[3]})")
+        self.status_label.config(text=f"Bot's move: {FormatMove(bot_move, '→')}")
         
         # Update analytics display with advanced information
         analytics_text = f"Bot Analytics - Nodes: {self.search_toolbox.nodes_expanded:,}, Pruning: {self.search_toolbox.pruning_count:,}"
-        if self.strategy == "alphabeta_ordering":
-            analytics_text += f", Ordering: {self.search_toolbox.ordering_gain:,}"
+        ordering_gain = self.BotOrderingGain()
+        if ordering_gain is not None:
+            analytics_text += f", First-move cutoffs: {ordering_gain:.1f}%"
+        probes = self.search_toolbox.evaluation_cache_hits + self.search_toolbox.evaluation_cache_misses
+        if probes > 0:
+            analytics_text += f", Eval cache hits: {100.0 * self.search_toolbox.evaluation_cache_hits / probes:.1f}%"
         analytics_text += f" | Phase: {self.game_phase}"
         self.analytics_label.config(text=analytics_text)
         
         self.DrawBoard()
         
         # Check if game is over after bot move
-        if self.game_board.IsGoalState():
-            self.EndGame()
+        result = self.GameResult(1)
+        if result is not None:
+            self.EndGame(result)
         else:
             self.status_label.config(text="Your turn! Click a white piece to select it.")
+            self.StartPondering(bot_move)
 
-    def EndGame(self):
-        """Ends the game and shows results."""
+    def EndGame(self, result):
+        """Ends the game and shows results (result is from GameResult)."""
         self.game_over = True
-        
-        # Determine winner
-        white_exists = any(cell in [1, 2] for row in self.game_board.board for cell in row)
-        black_exists = any(cell in [-1, -2] for row in self.game_board.board for cell in row)
-        
-        if not white_exists:
-            result = "Black (Bot) wins!"
-        elif not black_exists:
-            result = "White (You) win!"
-        else:
-            result = "It's a draw!"
+        self.search_toolbox.StopPondering()
         
         self.status_label.config(text=f"Game Over! {result}")
         
@@ -441,8 +615,15 @@ class PlayingTheGame:
 
     def NewGame(self):
         """Starts a new game."""
+        if self.bot_thread is not None:
+            # Abandon the bot's search of the old game
+            self.search_toolbox.StopSearch()
+            self.FinishBotSearch()
+        self.search_toolbox.StopPondering()
         self.game_board = GameBoard()
+        self.position_history = PositionHistory(self.game_board.hash)
         self.analytics = OtherStuff()
+        self.AttachTelemetry()
         self.selected_square = None
         self.legal_moves = []
         self.game_over = False
@@ -460,14 +641,17 @@ class PlayingTheGame:
         """Plays the game using the text interface with advanced AI features."""
         # Initialize game components
         self.game_board = GameBoard()
-        self.search_toolbox = SearchToolBox(self.time_limit, self.max_depth)
+        self.position_history = PositionHistory(self.game_board.hash)
+        self.search_toolbox = self.CreateSearchToolBox()
         self.analytics = OtherStuff()
+        self.AttachTelemetry()
         
         print("\nGame starting! You are White (W), AI is Black (B).")
         print("You move first.")
         print("Advanced AI features enabled: Opening book, Phase detection, Adaptive search")
         
-        while not self.game_board.IsGoalState():
+        result = None
+        while result is None:
             # Display current board
             self.game_board.DisplayBoard()
             
@@ -484,16 +668,15 @@ class PlayingTheGame:
                 print("Invalid move! Please try again.")
                 continue
             
-            # Record move in history
-            self.move_history.append(valid_move)
-            
             # Apply human move
-            self.game_board = self.game_board.ApplyMove(valid_move)
+            self.search_toolbox.StopPondering()
+            self.ApplyGameMove(valid_move)
             self.analytics.LogMove("human", nodes=0, pruning=0)
-            print(f"Your move: ({valid_move[0]},{valid_move[1]}) -> ({valid_move[2]},{valid_move[3]})")
+            print(f"Your move: {FormatMove(valid_move)}")
             
             # Check if game is over after human move
-            if self.game_board.IsGoalState():
+            result = self.GameResult(-1)
+            if result is not None:
                 break
             
             # Update game phase and adjust AI parameters
@@ -504,53 +687,43 @@ class PlayingTheGame:
             print(f"\nBot's turn (Black) - Phase: {self.game_phase}")
             print("Bot is thinking...")
             
-            # Check for opening book move first
-            opening_move = self.GetOpeningMove()
-            if opening_move:
-                bot_move = opening_move
-                score = self.game_board.EvaluateBoard()
-                print("Bot used opening book move!")
-            else:
-                # Get bot move using search algorithms
-                bot_move, score = self.search_toolbox.ChooseMove(self.game_board, self.strategy)
+            # Opening book, ponder result or search
+            bot_started = time.time()
+            bot_move, score = self.ChooseBotMove()
+            bot_time = time.time() - bot_started
             
             if bot_move is None:
-                print("Bot has no legal moves available!")
+                result = "White (You) win! The bot has no legal moves."
                 break
             
-            # Record bot move in history
-            self.move_history.append(bot_move)
-            
             # Apply bot move
-            self.game_board = self.game_board.ApplyMove(bot_move)
+            self.ApplyGameMove(bot_move)
             self.analytics.LogMove("bot", 
                                  nodes=self.search_toolbox.nodes_expanded,
                                  pruning=self.search_toolbox.pruning_count,
-                                 ordering_gain=self.search_toolbox.ordering_gain)
+                                 ordering_gain=self.BotOrderingGain(),
+                                 move_time=bot_time)
             
-            print(f"Bot's move: ({bot_move[0]},{bot_move[1]}) -> ({bot_move[2]},{bot_move[3]})")
+            print(f"Bot's move: {FormatMove(bot_move)}")
             print(f"Bot's evaluation score: {score}")
             
             # Display move analytics
             self.analytics.DisplayMoveAnalytics("bot", 
                                               self.search_toolbox.nodes_expanded,
                                               self.search_toolbox.pruning_count,
-                                              self.search_toolbox.ordering_gain)
+                                              self.BotOrderingGain())
+            
+            # Think on the human's time, unless the game is over
+            result = self.GameResult(1)
+            if result is None:
+                self.StartPondering(bot_move)
         
         # Game over
+        self.search_toolbox.StopPondering()
         self.game_board.DisplayBoard()
         print("\nGame Over!")
         
-        # Determine winner
-        white_exists = any(cell in [1, 2] for row in self.game_board.board for cell in row)
-        black_exists = any(cell in [-1, -2] for row in self.game_board.board for cell in row)
-        
-        if not white_exists:
-            print("Black (Bot) wins!")
-        elif not black_exists:
-            print("White (You) win!")
-        else:
-            print("It's a draw!")
+        print(result)
         
         # Display final analytics
         self.analytics.GenerateReport()
@@ -587,13 +760,17 @@ class PlayingTheGame:
                 print("Please enter valid numbers for all coordinates.")
 
     def ValidateMove(self, move):
-        """Validates if the user's move is legal."""
+        """
+        Validates if the user's move is legal. move is the text form
+        (start_row, start_col, target_row, target_col, captured); the
+        matching legal move is returned packed, as the board plays it.
+        """
         start_row, start_col, target_row, target_col, _ = move
         legal_moves = self.game_board.GetAllPossibleMoves(1)  # White player
         
         for legal_move in legal_moves:
-            if (legal_move[0] == start_row and legal_move[1] == start_col and 
-                legal_move[2] == target_row and legal_move[3] == target_col):
+            if (MoveStart(legal_move) == (start_row, start_col) and
+                MoveTarget(legal_move) == (target_row, target_col)):
                 return legal_move
         
         return None
@@ -604,7 +781,7 @@ class PlayingTheGame:
         self.GetUserParameters()
         
         # Initialize search toolbox
-        self.search_toolbox = SearchToolBox(self.time_limit, self.max_depth)
+        self.search_toolbox = self.CreateSearchToolBox()
         
         # Choose interface
         if GUI_AVAILABLE:
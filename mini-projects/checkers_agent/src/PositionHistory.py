@@ -0,0 +1,70 @@
+# A game is drawn when a position occurs for the REPETITION_LIMIT-th time
+# with the same side to move, or after NO_PROGRESS_PLIES plies (40 moves
+# each) without a capture or a man move
+REPETITION_LIMIT = 3
+NO_PROGRESS_PLIES = 80
+
+
+class PositionHistory:
+    """
+    Hash stack of the positions of a game, oldest first.
+
+    The game loop pushes the position after every move; the search pushes
+    and pops along the line it is searching, so a repetition of a game
+    position or of a position earlier in the line is seen at once.
+
+    - Entries alternate the side to move, so only entries an even distance
+      apart can be the same position
+    - Captures and man moves can never be undone, so a repetition is only
+      looked for back to the last such (irreversible) move; the number of
+      reversible plies since then is the no-progress count
+    """
+    def __init__(self, zobrist_hash=None):
+        self.hashes = []
+        self.reversible_plies = []  # Reversible plies in a row up to each entry
+        if zobrist_hash is not None:
+            self.Push(zobrist_hash, False)
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def Push(self, zobrist_hash, reversible):
+        """Adds the position reached by a move; reversible is False for captures and man moves."""
+        self.reversible_plies.append(self.reversible_plies[-1] + 1 if reversible and self.hashes else 0)
+        self.hashes.append(zobrist_hash)
+
+    def Pop(self):
+        """Removes the last position."""
+        self.hashes.pop()
+        self.reversible_plies.pop()
+
+    def Copy(self):
+        history = PositionHistory()
+        history.hashes = self.hashes[:]
+        history.reversible_plies = self.reversible_plies[:]
+        return history
+
+    def NoProgressPlies(self):
+        """Plies since the last capture or man move."""
+        return self.reversible_plies[-1] if self.hashes else 0
+
+    def Repetitions(self):
+        """How often the last position occurred before, with the same side to move."""
+        last = len(self.hashes) - 1
+        if last < 0:
+            return 0
+        current = self.hashes[last]
+        count = 0
+        for index in range(last - 2, last - self.reversible_plies[last] - 1, -2):
+            if self.hashes[index] == current:
+                count += 1
+        return count
+
+    def IsDraw(self, repetitions=REPETITION_LIMIT - 1, no_progress_plies=NO_PROGRESS_PLIES):
+        """
+        True if the last position is drawn: seen `repetitions` times before,
+        or reached after no_progress_plies reversible plies. The defaults
+        are the game's rules; the search treats a single repetition as a
+        draw.
+        """
+        return self.NoProgressPlies() >= no_progress_plies or self.Repetitions() >= repetitions
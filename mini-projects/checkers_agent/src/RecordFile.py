@@ -0,0 +1,85 @@
+import mmap
+import os
+import struct
+
+# File header: magic, metadata (an integer chosen by the file type), record count
+RECORD_FILE_HEADER = struct.Struct("<8sII")
+
+
+class RecordFileError(Exception):
+    """Raised when a record file is empty, truncated or has the wrong magic."""
+
+
+class SortedRecordFile:
+    """
+    Read-only file of fixed-size records sorted by a 64-bit key.
+
+    Layout:
+    - header: 8-byte magic, uint32 metadata, uint32 record count
+    - records: struct record_format, whose first field is the uint64 key,
+      in increasing key order
+
+    The file is memory-mapped, so opening it costs nothing and only the
+    pages touched by a lookup are read. Lookup is a binary search over
+    the records: O(log n) with no index held in memory.
+    """
+    def __init__(self, path, magic, record_format):
+        self.path = path
+        self.record = struct.Struct(record_format)
+        with open(path, "rb") as file:
+            # mmap cannot map an empty file, so check the size first
+            if os.fstat(file.fileno()).st_size < RECORD_FILE_HEADER.size:
+                raise RecordFileError(f"{path}: truncated header")
+            self.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            file_magic, self.metadata, self.count = RECORD_FILE_HEADER.unpack_from(self.mapping, 0)
+            if file_magic != magic:
+                raise RecordFileError(f"{path}: expected magic {magic!r}, found {file_magic!r}")
+            if len(self.mapping) < RECORD_FILE_HEADER.size + self.count * self.record.size:
+                raise RecordFileError(f"{path}: truncated records")
+        except RecordFileError:
+            self.mapping.close()
+            raise
+
+    def __len__(self):
+        return self.count
+
+    def RecordAt(self, index):
+        """Returns the unpacked record at index."""
+        return self.record.unpack_from(self.mapping, RECORD_FILE_HEADER.size + index * self.record.size)
+
+    def Lookup(self, key):
+        """Returns the record stored for key, or None."""
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            record = self.RecordAt(middle)
+            if record[0] < key:
+                low = middle + 1
+            elif record[0] > key:
+                high = middle
+            else:
+                return record
+        return None
+
+    def Close(self):
+        """Unmaps the file."""
+        self.mapping.close()
+
+    @staticmethod
+    def Write(path, magic, record_format, records, metadata=0):
+        """
+        Writes records (tuples matching record_format) to path.
+
+        Records are sorted by key here; duplicate keys keep the first one.
+        """
+        record = struct.Struct(record_format)
+        unique = []
+        for entry in sorted(records, key=lambda entry: entry[0]):
+            if not unique or unique[-1][0] != entry[0]:
+                unique.append(entry)
+        with open(path, "wb") as file:
+            file.write(RECORD_FILE_HEADER.pack(magic, metadata, len(unique)))
+            for entry in unique:
+                file.write(record.pack(*entry))
+        return len(unique)
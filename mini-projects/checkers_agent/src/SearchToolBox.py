@@ -1,6 +1,77 @@
+import multiprocessing
+import queue
+import threading
 import time
 import sys
 
+from BitBoard import *
+from TranspositionTable import *
+from EvaluationCache import *
+from TableBase import *
+from Telemetry import *
+from PositionHistory import *
+from MonteCarloTreeSearch import *
+
+# Deepest ply the per-ply tables (killer moves, PV) can address
+MAX_PLY = 64
+
+# Width of the null window used by principal variation search. Scores are
+# floats, so "alpha + 1" becomes a tiny epsilon.
+NULL_WINDOW = 1e-6
+
+# Half-width of the aspiration window around the previous iteration's score
+ASPIRATION_WINDOW = 1.0
+
+# Nodes searched between two clock reads
+TIME_CHECK_INTERVAL = 128
+
+# Share of time_limit after which no new iteration is started (soft limit).
+# time_limit itself is the hard limit that aborts a running iteration.
+PHASE_SOFT_TIME_FRACTIONS = {"opening": 0.35, "middlegame": 0.6, "endgame": 0.5}
+
+
+# Scores of finished games, from black's point of view like every score:
+# a win ply plies below the root scores WIN_SCORE - ply (the tablebase uses
+# the same scale), so the search prefers faster wins and slower losses
+WIN_SCORE = TABLEBASE_WIN_SCORE
+DRAW_SCORE = 0.0
+
+# Scores at least this far from 0 are finished games (far above any
+# evaluation). The transposition table stores them counted from the node
+# instead of the root, so an entry read at another ply still gives the
+# right distance to the end (see ScoreToTable)
+WIN_SCORE_THRESHOLD = WIN_SCORE / 2
+
+# Selective search (see SelectiveStaticValue, IsFutileMove, LateMoveReduction).
+# Margins are in evaluation units (a man is worth 10) and indexed by the
+# remaining depth; razoring and futility pruning apply up to the last index.
+# Quiescence only resolves captures, so razoring is limited to depth 1 with
+# a man plus positional slack: at depth 2 it razored away quiet threats one
+# ply deep (a full man of root score, and a forced loss in the endgame).
+RAZOR_MARGINS = (0.0, 12.0)
+FUTILITY_MARGINS = (0.0, 2.0, 5.0)
+# Late move reductions: quiet moves after the first LMR_FULL_DEPTH_MOVES
+# of a node with at least LMR_MIN_DEPTH plies left are searched one ply
+# shallower (two when late in a deep node)
+LMR_MIN_DEPTH = 3
+LMR_FULL_DEPTH_MOVES = 3
+LMR_DEEP_DEPTH = 6
+LMR_DEEP_MOVES = 6
+
+# Time limit of a ponder search: it runs until stopped or max_depth is done
+PONDER_TIME_LIMIT = 3600
+
+# Toolbox attributes copied into the worker processes of the parallel search
+PARALLEL_SETTINGS = ("time_limit", "max_depth", "soft_time_fraction", "evaluation", "weights",
+                     "use_make_unmake", "use_transposition_table", "use_pvs",
+                     "use_aspiration", "reuse_pv", "use_quiescence", "use_draw_detection",
+                     "use_staged_moves", "use_late_move_reductions", "use_futility_pruning",
+                     "use_razoring", "use_evaluation_cache", "evaluation_cache_entries")
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the hard time limit has passed."""
+
 
 class SearchToolBox:
     """
@@ -10,8 +81,22 @@ class SearchToolBox:
     1. Minimax algorithm with depth-limited search
     2. Alpha-Beta pruning for performance optimization
     3. Move ordering for enhanced pruning efficiency
-    4. Time management and iterative deepening
+    4. Time management and iterative deepening (soft/hard time budget,
+       clean abort of an unfinished iteration)
     5. Comprehensive performance analytics
+    6. Transposition table keyed by Zobrist hash (alpha-beta strategies),
+       and an LRU cache of static evaluations by the same hash
+    7. Principal variation search, aspiration windows and PV reuse
+       between iterations (alpha-beta with ordering)
+    8. Root-parallel search over a process pool ("parallel")
+    9. Quiescence search: leaves in the middle of a capture sequence are
+       extended with captures only until the position is quiet
+    10. Endgame tablebase probing: positions with few enough pieces are
+        scored exactly instead of searched
+    11. Pondering: searching the expected next position in a background
+        thread while the opponent thinks
+    12. Monte Carlo tree search ("mcts"): UCT over short playouts, run in
+        a process pool with virtual loss, the tree kept between moves
     
     The implementation shows understanding of:
     - Game tree search algorithms
@@ -19,21 +104,244 @@ class SearchToolBox:
     - Real-time decision making
     - Algorithm complexity analysis
     """
-    def __init__(self, time_limit=4, max_depth=4):
+    def __init__(self, time_limit=4, max_depth=4, use_bitboard=False, use_make_unmake=True,
+                 use_transposition_table=True, tt_memory_mb=16, evaluation="full",
+                 evaluation_cache_entries=EVALUATION_CACHE_ENTRIES):
         self.time_limit = time_limit
         self.max_depth = max_depth
+        self.use_bitboard = use_bitboard  # Search on BitBoard copies of the position
+        self.use_make_unmake = use_make_unmake  # Search one board in place instead of cloning per node
+        # "full" rescans the board, "incremental" uses maintained terms, "batch" is
+        # "incremental" with all children of a depth 1 node evaluated in one NumPy call
+        self.evaluation = evaluation
+        self.weights = DEFAULT_EVALUATION_WEIGHTS  # Evaluation parameter vector (see EvaluationWeights)
+        self.batch_evaluations = 0  # Positions scored by EvaluatePositions
+        # Static evaluations by position hash, kept between moves; cleared
+        # when the evaluation mode or weights change (PrepareEvaluationCache)
+        self.use_evaluation_cache = True
+        self.evaluation_cache_entries = evaluation_cache_entries
+        self.evaluation_cache = EvaluationCache(evaluation_cache_entries)
+        self.evaluation_cache_signature = None
+        self.evaluation_cache_hits = 0
+        self.evaluation_cache_misses = 0
         self.nodes_expanded = 0
         self.pruning_count = 0
-        self.ordering_gain = 0
+        self.ordering_gain = 0  # % of ordering-search cutoffs produced by the first move
         self.start_time = 0
-        self.transposition_table = {}  # For future enhancement
+        self.soft_time_fraction = PHASE_SOFT_TIME_FRACTIONS["middlegame"]
+        self.time_check_countdown = TIME_CHECK_INTERVAL
+        self.root_partial = None  # Best (score, move) among fully searched root moves
+        self.previous_best_move = None  # Best root move of the last completed iteration
+        self.search_aborted = False
+        self.use_transposition_table = use_transposition_table
+        self.tt_memory_mb = tt_memory_mb
+        self.transposition_table = TranspositionTable(tt_memory_mb)
         self.iteration_count = 0
+        # Move ordering state for AlphaBetaOrderingSearch
+        self.killer_moves = [[None, None] for _ in range(MAX_PLY)]
+        self.history_table = {1: [0] * 1024, -1: [0] * 1024}  # [player][move & MOVE_SQUARES_MASK]
+        self.ordering_cutoffs = 0
+        self.first_move_cutoffs = 0
+        # Iterative deepening state carried from one depth to the next
+        self.use_pvs = True
+        self.use_aspiration = True
+        self.reuse_pv = True
+        self.pv_table = [[] for _ in range(MAX_PLY + 1)]  # Triangular PV table of (key, move)
+        self.pv_hints = {}  # Position key -> PV move from the previous iteration
+        self.root_ranking = []  # Root moves, best first, from the previous iteration
+        self.principal_variation = []
+        self.pvs_researches = 0
+        self.aspiration_researches = 0
+        self.depth_statistics = []  # Per-iteration depth, score, move, nodes and elapsed time
+        # Selective search in the alpha-beta searches, each part on its own
+        self.use_late_move_reductions = False
+        self.use_futility_pruning = False
+        self.use_razoring = False
+        self.lmr_reductions = 0  # Moves searched at reduced depth
+        self.lmr_researches = 0  # Reduced moves that beat alpha and were searched again
+        self.futility_pruned = 0  # Moves skipped near the leaves
+        self.razor_cutoffs = 0  # Nodes answered by quiescence search
+        # Staged move generation below the root (StagedMoves) and in quiescence
+        self.use_staged_moves = True
+        self.moves_generated = 0  # Moves built by the ordering and quiescence searches
+        # Quiescence search at the horizon
+        self.use_quiescence = True
+        self.quiescence_nodes = 0  # Positions extended past the horizon (not in nodes_expanded)
+        self.quiescence_cutoffs = 0
+        self.quiescence_depth = 0  # Longest capture sequence searched past the horizon
+        # Endgame tablebase (TableBase), probed below the root when set
+        self.tablebase = None
+        self.tablebase_hits = 0
+        # Draw detection: positions of the game (root_history, passed to
+        # ChooseMove) and of the line being searched (history)
+        self.use_draw_detection = True
+        self.root_history = None
+        self.history = PositionHistory()
+        self.draws_detected = 0  # Lines cut as repetitions or no-progress draws
+        # Search events (Telemetry.py): printed by default, NullSink for none
+        self.telemetry = ConsoleSink()
+        # Pondering (one background thread searching on this toolbox)
+        self.stop_event = threading.Event()  # Set to abort the running search (StopSearch)
+        self.current_depth = 0  # Depth of the iteration in progress, for progress displays
+        self.ponder_thread = None
+        self.ponder_key = None  # Position key the ponder search is working on
+        self.ponder_result = None  # (move, score, depth) once the ponder search ends
+        self.ponder_hits = 0
+        self.ponder_misses = 0
+        # Root-parallel search
+        self.workers = multiprocessing.cpu_count()
+        self.process_pool = None  # Created on first use and kept between moves
+        self.pool_stop_event = None  # Shared with the workers so StopSearch reaches them
+        self.root_moves = None  # Restricts the root of AlphaBetaOrderingSearch to these moves
+        # Monte Carlo tree search (MonteCarloTreeSearch.py); playouts run in
+        # the process pool when workers > 1
+        self.uct_exploration = UCT_EXPLORATION
+        self.playout_plies = PLAYOUT_PLIES
+        self.playout_policy = "guided"  # Or "random" (see Playout)
+        self.reuse_tree = True  # Keep the subtree of the position reached between moves
+        self.mcts_tree = None
+        self.playouts = 0
+        self.playouts_per_second = 0.0
+        self.tree_reused_visits = 0  # Playouts inherited from the previous search
 
     def TimeExceeded(self):
         """Checks if the time limit has been exceeded for real-time play."""
         return time.time() - self.start_time > self.time_limit
 
-    def IterativeDeepeningSearch(self, state, strategy):
+    def SoftTimeExceeded(self):
+        """Checks if too much time has passed to start another iteration."""
+        return time.time() - self.start_time > self.time_limit * self.soft_time_fraction
+
+    def SetTimeBudget(self, game_phase):
+        """Sets the soft time limit for a phase reported by DetermineGamePhase."""
+        self.soft_time_fraction = PHASE_SOFT_TIME_FRACTIONS.get(game_phase, self.soft_time_fraction)
+
+    def CheckTime(self):
+        """
+        Called at every node; reads the clock only every TIME_CHECK_INTERVAL
+        nodes and raises SearchTimeout once the hard limit has passed or a
+        stop was requested through stop_event.
+        """
+        self.time_check_countdown -= 1
+        if self.time_check_countdown <= 0:
+            self.time_check_countdown = TIME_CHECK_INTERVAL
+            if self.stop_event.is_set() or self.TimeExceeded():
+                raise SearchTimeout()
+
+    def PlayMove(self, state, move):
+        """
+        Returns (child_state, undo) for searching move from state.
+
+        With make/unmake the child is the same board modified in place and
+        undo must be passed to TakeBackMove; otherwise the child is a fresh
+        ApplyMove copy and undo is None. The child is pushed on the position
+        history until TakeBackMove.
+        """
+        if self.use_draw_detection:
+            reversible = state.IsReversibleMove(move)
+            child, undo = (state, state.MakeMove(move)) if self.use_make_unmake else (state.ApplyMove(move), None)
+            self.history.Push(child.hash, reversible)
+            return child, undo
+        if self.use_make_unmake:
+            return state, state.MakeMove(move)
+        return state.ApplyMove(move), None
+
+    def TakeBackMove(self, state, undo):
+        """Restores state after searching a child returned by PlayMove."""
+        if self.use_draw_detection:
+            self.history.Pop()
+        if undo is not None:
+            state.UnmakeMove(undo)
+
+    def Evaluate(self, state):
+        """
+        Static evaluation of state using the configured evaluation mode,
+        looked up in the evaluation cache first when use_evaluation_cache
+        is set (transpositions, and positions scored again by quiescence,
+        razoring or a later iteration, are then evaluated once).
+        """
+        if not self.use_evaluation_cache:
+            return self.StaticEvaluation(state)
+        score = self.evaluation_cache.Probe(state.hash)
+        if score is None:
+            score = self.StaticEvaluation(state)
+            self.evaluation_cache.Store(state.hash, score)
+        return score
+
+    def StaticEvaluation(self, state):
+        """Evaluates state with the configured evaluation mode and weights."""
+        if self.evaluation in ("incremental", "batch"):
+            return state.EvaluateBoardIncremental(self.weights)
+        return state.EvaluateBoard(self.weights)
+
+    def PrepareEvaluationCache(self):
+        """
+        Starts a search with the evaluation cache: resizes it to
+        evaluation_cache_entries and clears it if the evaluation mode or
+        weights differ from those its scores were computed with.
+        """
+        cache = self.evaluation_cache
+        if cache.entries != self.evaluation_cache_entries:
+            cache = self.evaluation_cache = EvaluationCache(self.evaluation_cache_entries)
+        signature = (self.evaluation, tuple(self.weights))
+        if signature != self.evaluation_cache_signature:
+            cache.Clear()
+            self.evaluation_cache_signature = signature
+        cache.ResetStatistics()
+
+    def EvaluateMove(self, state, move):
+        """Static evaluation of the position reached by move (used for ordering)."""
+        child, undo = self.PlayMove(state, move)
+        score = self.Evaluate(child)
+        self.TakeBackMove(child, undo)
+        return score
+
+    def PositionKey(self, state, maximizing_player):
+        """Transposition key: the board's Zobrist hash plus the side to move."""
+        return ZobristKey(state.hash, -1 if maximizing_player else 1)
+
+    def ProbeTransposition(self, key, depth, alpha, beta, ply):
+        """
+        Looks up a stored result for the node being searched.
+
+        Returns (result, alpha, beta, hash_move): result is (score, move)
+        when the stored entry settles the node, otherwise None with the
+        window narrowed by any stored bound. hash_move is the best move
+        stored for the position, whatever its depth. The root (ply 0) is
+        never settled by the table so every iteration returns a move.
+        """
+        if not self.use_transposition_table:
+            return None, alpha, beta, None
+        entry = self.transposition_table.Probe(key)
+        if entry is None:
+            return None, alpha, beta, None
+        entry_depth, score, bound, hash_move = entry
+        if entry_depth < depth or ply == 0:
+            return None, alpha, beta, hash_move
+        score = ScoreFromTable(score, ply)
+        if bound == EXACT:
+            return (score, hash_move), alpha, beta, hash_move
+        if bound == LOWER_BOUND:
+            alpha = max(alpha, score)
+        else:
+            beta = min(beta, score)
+        if alpha >= beta:
+            return (score, hash_move), alpha, beta, hash_move
+        return None, alpha, beta, hash_move
+
+    def StoreTransposition(self, key, depth, value, alpha, beta, best_move, ply):
+        """Stores a node result, classifying it against the window it was searched with."""
+        if not self.use_transposition_table:
+            return
+        if value <= alpha:
+            bound = UPPER_BOUND
+        elif value >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        self.transposition_table.Store(key, depth, ScoreToTable(value, ply), bound, best_move)
+
+    def IterativeDeepeningSearch(self, state, strategy, player=-1):
         """
         Iterative deepening implementation for optimal time management.
         
@@ -44,33 +352,113 @@ class SearchToolBox:
         - Maximizes search depth within available time
         
         This is a real-world technique used in professional game engines.
+
+        A new depth is only started before the soft time limit. When the
+        hard limit interrupts a depth, its result is dropped unless at least
+        its first root move was fully searched; then the best fully searched
+        root move is kept. Every strategy searches the previous depth's best
+        move first at the root (see PreviousBestFirst), so a kept move has
+        been compared against it.
+
+        player is the side to move at the root: -1 (black, the bot)
+        maximizes the score, 1 (white) minimizes it.
         """
         best_move = None
-        best_score = -sys.maxsize
+        best_score = -sys.maxsize if player == -1 else sys.maxsize
+        self.previous_best_move = None
         
         # Start with depth 1 and increase until time runs out
         for depth in range(1, self.max_depth + 1):
-            if self.TimeExceeded():
+            if depth > 1 and self.SoftTimeExceeded():
                 break
                 
             self.iteration_count += 1
-            print(f"Searching at depth {depth}...")
-            
-            if strategy == "minimax":
-                score, move = self.MinimaxSearch(state, depth, True)
-            elif strategy == "alphabeta":
-                score, move = self.AlphaBetaSearch(state, depth, -sys.maxsize, sys.maxsize, True)
-            elif strategy == "alphabeta_ordering":
-                score, move = self.AlphaBetaOrderingSearch(state, depth, -sys.maxsize, sys.maxsize, True)
+            self.current_depth = depth
+            nodes_before = self.nodes_expanded
+            self.root_partial = None
+            # An aborted iteration leaves its board mid-search, so search a copy
+            search_state = state.CloneBoard() if self.use_make_unmake else state
+            # Likewise the line's position history
+            self.history = self.root_history.Copy() if self.root_history is not None else PositionHistory(state.hash)
+            self.Emit("iteration_start", depth=depth)
+
+            try:
+                score, move = self.SearchIteration(search_state, depth, strategy, player)
+            except SearchTimeout:
+                self.search_aborted = True
+                if self.root_partial is not None:
+                    best_score, best_move = self.root_partial
+                self.Emit("iteration_aborted", depth=depth, kept=self.root_partial is not None, score=best_score)
+                break
             
             if move is not None:
                 best_move = move
                 best_score = score
-                print(f"Depth {depth} completed: score = {score}")
+                self.previous_best_move = move
+                nodes = self.nodes_expanded - nodes_before
+                self.depth_statistics.append({"depth": depth, "score": score, "move": move, "nodes": nodes,
+                                              "elapsed": time.time() - self.start_time})
+                self.Emit("iteration", depth=depth, score=score, move=move, nodes=nodes,
+                          total_nodes=self.nodes_expanded, cutoffs=self.pruning_count,
+                          tt_hits=self.transposition_table.hits, elapsed=time.time() - self.start_time,
+                          pv=list(self.principal_variation))
+
+        if best_move is None:
+            # Not even depth 1 finished: fall back to the first legal move
+            moves = state.GetAllPossibleMoves(player)
+            if moves:
+                best_move = moves[0]
+                best_score = self.EvaluateMove(state, best_move)
         
         return best_move, best_score
 
-    def MinimaxSearch(self, state, depth, maximizing_player):
+    def Emit(self, event, **fields):
+        """Sends a search event to the telemetry sink, unless it is disabled."""
+        if self.telemetry.enabled:
+            fields["event"] = event
+            self.telemetry.Emit(fields)
+
+    def SearchIteration(self, state, depth, strategy, player=-1):
+        """Runs one depth of the selected strategy from the root, player to move."""
+        maximizing_player = player == -1
+        if strategy == "minimax":
+            return self.MinimaxSearch(state, depth, maximizing_player)
+        elif strategy == "alphabeta":
+            return self.AlphaBetaSearch(state, depth, -sys.maxsize, sys.maxsize, maximizing_player)
+        elif strategy == "alphabeta_ordering":
+            # Scores alternate between odd and even depths, so centre the
+            # window on the last iteration of the same parity when there is one
+            completed = {entry["depth"]: entry["score"] for entry in self.depth_statistics}
+            previous_score = completed.get(depth - 2, completed.get(depth - 1))
+            score, move = self.AspirationSearch(state, depth, previous_score, maximizing_player)
+            if self.reuse_pv:
+                self.pv_hints = dict(self.pv_table[0])
+            self.principal_variation = [pv_move for _, pv_move in self.pv_table[0]]
+            return score, move
+        raise ValueError(f"Unknown search strategy: {strategy}")
+
+    def AspirationSearch(self, state, depth, previous_score, maximizing_player=True):
+        """
+        Root search inside an aspiration window around a previous score.
+
+        The window is previous_score +/- ASPIRATION_WINDOW; when the result
+        falls outside it the failing side is opened up and the depth is
+        searched again. Without a previous score the full window is used.
+        """
+        alpha, beta = -sys.maxsize, sys.maxsize
+        if self.use_aspiration and previous_score is not None and abs(previous_score) < sys.maxsize:
+            alpha, beta = previous_score - ASPIRATION_WINDOW, previous_score + ASPIRATION_WINDOW
+        while True:
+            score, move = self.AlphaBetaOrderingSearch(state, depth, alpha, beta, maximizing_player)
+            if score <= alpha and alpha > -sys.maxsize:
+                alpha = -sys.maxsize  # Failed low: the true score is below the window
+            elif score >= beta and beta < sys.maxsize:
+                beta = sys.maxsize  # Failed high: the true score is above the window
+            else:
+                return score, move
+            self.aspiration_researches += 1
+
+    def MinimaxSearch(self, state, depth, maximizing_player, ply=0):
         """
         Classic minimax algorithm implementation.
         
@@ -82,8 +470,16 @@ class SearchToolBox:
         
         Complexity: O(b^d) where b is branching factor, d is depth
         """
-        if depth == 0 or state.IsGoalState() or self.TimeExceeded():
-            return state.EvaluateBoard(), None
+        self.CheckTime()
+        if state.IsGoalState():
+            return self.GameOverValue(state, ply), None
+        if ply > 0 and self.IsDrawnLine():
+            return DRAW_SCORE, None
+        tablebase_score = self.ProbeTableBase(state, maximizing_player, ply)
+        if tablebase_score is not None:
+            return tablebase_score, None
+        if depth == 0:
+            return self.HorizonValue(state, -sys.maxsize, sys.maxsize, maximizing_player, ply), None
         
         best_move = None
         self.nodes_expanded += 1
@@ -91,25 +487,39 @@ class SearchToolBox:
         if maximizing_player:
             max_eval = -sys.maxsize
             moves = state.GetAllPossibleMoves(-1)  # bot (black)
+            if not moves:
+                return self.LossValue(-1, ply), None
+            if ply == 0:
+                moves = self.PreviousBestFirst(moves)
             for move in moves:
-                next_state = state.ApplyMove(move)
-                eval_score, _ = self.MinimaxSearch(next_state, depth - 1, False)
+                next_state, undo = self.PlayMove(state, move)
+                eval_score, _ = self.MinimaxSearch(next_state, depth - 1, False, ply + 1)
+                self.TakeBackMove(next_state, undo)
                 if eval_score > max_eval:
                     max_eval = eval_score
                     best_move = move
+                    if ply == 0:
+                        self.root_partial = (max_eval, best_move)
             return max_eval, best_move
         else:
             min_eval = sys.maxsize
             moves = state.GetAllPossibleMoves(1)  # human (white)
+            if not moves:
+                return self.LossValue(1, ply), None
+            if ply == 0:
+                moves = self.PreviousBestFirst(moves)
             for move in moves:
-                next_state = state.ApplyMove(move)
-                eval_score, _ = self.MinimaxSearch(next_state, depth - 1, True)
+                next_state, undo = self.PlayMove(state, move)
+                eval_score, _ = self.MinimaxSearch(next_state, depth - 1, True, ply + 1)
+                self.TakeBackMove(next_state, undo)
                 if eval_score < min_eval:
                     min_eval = eval_score
                     best_move = move
+                    if ply == 0:
+                        self.root_partial = (min_eval, best_move)
             return min_eval, best_move
 
-    def AlphaBetaSearch(self, state, depth, alpha, beta, maximizing_player):
+    def AlphaBetaSearch(self, state, depth, alpha, beta, maximizing_player, ply=0):
         """
         Alpha-Beta pruning implementation for performance optimization.
         
@@ -118,97 +528,616 @@ class SearchToolBox:
         - Significant performance improvement over minimax
         - Maintains optimality while reducing search space
         
+        Optional selective search (off by default, see SelectiveStaticValue,
+        IsFutileMove and LateMoveReduction): razoring and futility pruning
+        near the leaves, late move reductions with a full-depth re-search
+        when a reduced move beats alpha.
+
         Complexity: O(b^(d/2)) in best case, O(b^d) in worst case
         """
-        if depth == 0 or state.IsGoalState() or self.TimeExceeded():
-            return state.EvaluateBoard(), None
+        self.CheckTime()
+        if state.IsGoalState():
+            return self.GameOverValue(state, ply), None
+        if ply > 0 and self.IsDrawnLine():
+            return DRAW_SCORE, None
+        tablebase_score = self.ProbeTableBase(state, maximizing_player, ply)
+        if tablebase_score is not None:
+            return tablebase_score, None
+        if depth == 0:
+            return self.HorizonValue(state, alpha, beta, maximizing_player, ply), None
+
+        key = self.PositionKey(state, maximizing_player)
+        result, alpha, beta, _ = self.ProbeTransposition(key, depth, alpha, beta, ply)
+        if result is not None:
+            return result
+        alpha_orig, beta_orig = alpha, beta
         
         best_move = None
         self.nodes_expanded += 1
+        if depth == 1 and ply > 0 and self.UseBatchEvaluation():
+            value, best_move = self.FrontierSearch(state, alpha, beta, maximizing_player, ply)
+            self.StoreTransposition(key, depth, value, alpha_orig, beta_orig, best_move, ply)
+            return value, best_move
+        static = self.SelectiveStaticValue(state, depth, ply)
+        razor_value = self.RazorValue(state, static, depth, alpha, beta, maximizing_player, ply)
+        if razor_value is not None:
+            return razor_value, None
         
         if maximizing_player:
             value = -sys.maxsize
             moves = state.GetAllPossibleMoves(-1)
-            for move in moves:
-                next_state = state.ApplyMove(move)
-                eval_score, _ = self.AlphaBetaSearch(next_state, depth - 1, alpha, beta, False)
+            if not moves:
+                return self.LossValue(-1, ply), None
+            if ply == 0:
+                moves = self.PreviousBestFirst(moves)
+            for move_index, move in enumerate(moves):
+                if self.IsFutileMove(move, move_index, static, depth, alpha, beta, -1):
+                    value = max(value, static + FUTILITY_MARGINS[depth])
+                    continue
+                next_state, undo = self.PlayMove(state, move)
+                eval_score = self.ReducedSearchValue(self.AlphaBetaSearch, next_state, move, move_index, depth,
+                                                     alpha, beta, True, ply)
+                if eval_score is None:
+                    eval_score, _ = self.AlphaBetaSearch(next_state, depth - 1, alpha, beta, False, ply + 1)
+                self.TakeBackMove(next_state, undo)
                 if eval_score > value:
                     value = eval_score
                     best_move = move
+                    if ply == 0 and value > alpha_orig:
+                        self.root_partial = (value, best_move)
                 alpha = max(alpha, value)
                 if beta <= alpha:
                     self.pruning_count += 1
                     break  # Beta cutoff
+            self.StoreTransposition(key, depth, value, alpha_orig, beta_orig, best_move, ply)
             return value, best_move
         else:
             value = sys.maxsize
             moves = state.GetAllPossibleMoves(1)
-            for move in moves:
-                next_state = state.ApplyMove(move)
-                eval_score, _ = self.AlphaBetaSearch(next_state, depth - 1, alpha, beta, True)
+            if not moves:
+                return self.LossValue(1, ply), None
+            if ply == 0:
+                moves = self.PreviousBestFirst(moves)
+            for move_index, move in enumerate(moves):
+                if self.IsFutileMove(move, move_index, static, depth, alpha, beta, 1):
+                    value = min(value, static - FUTILITY_MARGINS[depth])
+                    continue
+                next_state, undo = self.PlayMove(state, move)
+                eval_score = self.ReducedSearchValue(self.AlphaBetaSearch, next_state, move, move_index, depth,
+                                                     alpha, beta, False, ply)
+                if eval_score is None:
+                    eval_score, _ = self.AlphaBetaSearch(next_state, depth - 1, alpha, beta, True, ply + 1)
+                self.TakeBackMove(next_state, undo)
                 if eval_score < value:
                     value = eval_score
                     best_move = move
+                    if ply == 0 and value < beta_orig:
+                        self.root_partial = (value, best_move)
                 beta = min(beta, value)
                 if beta <= alpha:
                     self.pruning_count += 1
                     break  # Alpha cutoff
+            self.StoreTransposition(key, depth, value, alpha_orig, beta_orig, best_move, ply)
             return value, best_move
 
-    def AlphaBetaOrderingSearch(self, state, depth, alpha, beta, maximizing_player):
+    def PreviousBestFirst(self, moves):
+        """
+        Root moves of minimax and plain alpha-beta: generation order with
+        the previous iteration's best move first. An interrupted iteration
+        keeps its best fully searched root move (IterativeDeepeningSearch),
+        which is then never worse than the move it replaces.
+        """
+        best = self.previous_best_move
+        if best is None or best not in moves or moves[0] == best:
+            return moves
+        return [best] + [move for move in moves if move != best]
+
+    def SelectiveStaticValue(self, state, depth, ply):
+        """
+        Static evaluation of a node for razoring and futility pruning, or
+        None when neither applies (root, or too far from the leaves).
+        """
+        selective_depths = max(len(RAZOR_MARGINS), len(FUTILITY_MARGINS))
+        if ply == 0 or depth >= selective_depths or not (self.use_razoring or self.use_futility_pruning):
+            return None
+        return self.Evaluate(state)
+
+    def RazorValue(self, state, static, depth, alpha, beta, maximizing_player, ply):
+        """
+        Razoring: a node whose static value is more than RAZOR_MARGINS[depth]
+        below alpha (above beta for white) is answered by a quiescence
+        search. Its value is returned if it confirms the fail-low, otherwise
+        None and the node is searched as usual. Quiescence searches any
+        pending captures, so tactics are not razored away.
+        """
+        if static is None or not self.use_razoring or depth >= len(RAZOR_MARGINS):
+            return None
+        margin = RAZOR_MARGINS[depth]
+        if maximizing_player and static + margin <= alpha:
+            value = self.QuiescenceSearch(state, alpha, beta, True, ply)
+            if value <= alpha:
+                self.razor_cutoffs += 1
+                return value
+        elif not maximizing_player and static - margin >= beta:
+            value = self.QuiescenceSearch(state, alpha, beta, False, ply)
+            if value >= beta:
+                self.razor_cutoffs += 1
+                return value
+        return None
+
+    def IsQuietMove(self, move, player):
+        """
+        Moves selective search may prune or reduce: no capture and no
+        arrival on the promotion row. Checkers has no checks; these are
+        the forcing moves that must always be searched in full.
+        """
+        return not move >> MOVE_CAPTURE_SHIFT and SQUARE_ROWS[move >> MOVE_TARGET_SHIFT & SQUARE_INDEX_MASK] != PROMOTION_ROWS[player]
+
+    def IsFutileMove(self, move, move_index, static, depth, alpha, beta, player):
+        """
+        Futility pruning: near the leaves, a quiet move (after the first)
+        is skipped when the static value plus FUTILITY_MARGINS[depth]
+        cannot reach alpha (beta for white). The caller then bounds the
+        node's value by that optimistic estimate.
+        """
+        if static is None or move_index == 0 or not self.use_futility_pruning or not self.IsQuietMove(move, player):
+            return False
+        margin = FUTILITY_MARGINS[depth]
+        if static + margin <= alpha if player == -1 else static - margin >= beta:
+            self.futility_pruned += 1
+            return True
+        return False
+
+    def LateMoveReduction(self, move, move_index, depth, ply, player):
+        """
+        Plies to reduce a late quiet move by: 1 after the first
+        LMR_FULL_DEPTH_MOVES moves of a node LMR_MIN_DEPTH plies or more
+        from the leaves, 2 after LMR_DEEP_MOVES moves with LMR_DEEP_DEPTH
+        plies left. Killer moves are never reduced.
+        """
+        if (not self.use_late_move_reductions or ply == 0 or depth < LMR_MIN_DEPTH
+                or move_index < LMR_FULL_DEPTH_MOVES or not self.IsQuietMove(move, player)
+                or (ply < MAX_PLY and move in self.killer_moves[ply])):
+            return 0
+        return 2 if depth >= LMR_DEEP_DEPTH and move_index >= LMR_DEEP_MOVES else 1
+
+    def ReducedSearchValue(self, search, next_state, move, move_index, depth, alpha, beta, maximizing_player, ply):
+        """
+        Searches a late move at reduced depth with a null window at alpha
+        (beta for white). Returns its value if that confirms the move is no
+        better than the best so far, or None when the move is not reduced
+        or beat the window: the caller then searches it at full depth.
+        """
+        player = -1 if maximizing_player else 1
+        if (alpha <= -sys.maxsize if maximizing_player else beta >= sys.maxsize):
+            return None
+        reduction = self.LateMoveReduction(move, move_index, depth, ply, player)
+        if not reduction:
+            return None
+        self.lmr_reductions += 1
+        if maximizing_player:
+            eval_score, _ = search(next_state, depth - 1 - reduction, alpha, alpha + NULL_WINDOW, False, ply + 1)
+            if eval_score <= alpha:
+                return eval_score
+        else:
+            eval_score, _ = search(next_state, depth - 1 - reduction, beta - NULL_WINDOW, beta, True, ply + 1)
+            if eval_score >= beta:
+                return eval_score
+        self.lmr_researches += 1
+        return None
+
+    def UseBatchEvaluation(self):
+        """True when depth 1 nodes should score their children in one batch."""
+        return self.evaluation == "batch" and NUMPY_AVAILABLE
+
+    def FrontierSearch(self, state, alpha, beta, maximizing_player, ply):
+        """
+        Searches a depth 1 node with one batch evaluation of its children.
+
+        Children that are decided (game over, draw, tablebase) or in the middle
+        of a capture sequence (quiescence) get their usual scalar value;
+        quiet children not in the evaluation cache are scored together by
+        EvaluatePositions (and cached). Every
+        child is scored, since the batch is computed before any cutoff
+        could be taken. The best move is the one the sequential search picks;
+        after a cutoff the value is the exact maximum (minimum) rather than
+        the first score past the window, which is on the same side of it.
+        Returns (value, best_move).
+        """
+        player = -1 if maximizing_player else 1
+        moves = state.GetAllPossibleMoves(player)
+        if not moves:
+            return self.LossValue(player, ply), None
+        values = [None] * len(moves)
+        squares, mobility, batched, keys = [], [], [], []
+        for index, move in enumerate(moves):
+            child, undo = self.PlayMove(state, move)
+            values[index] = self.FrontierChildValue(child, alpha, beta, not maximizing_player, ply + 1)
+            if values[index] is None and self.use_evaluation_cache:
+                values[index] = self.evaluation_cache.Probe(child.hash)
+            if values[index] is None:
+                keys.append(child.hash)
+                squares.append(child.SquareVector())
+                mobility.append(child.CountMobility(-1) - child.CountMobility(1))
+                batched.append(index)
+            self.TakeBackMove(child, undo)
+        if batched:
+            self.batch_evaluations += len(batched)
+            for index, key, score in zip(batched, keys, EvaluatePositions(squares, mobility, self.weights).tolist()):
+                values[index] = score
+                if self.use_evaluation_cache:
+                    self.evaluation_cache.Store(key, score)
+
+        value = -sys.maxsize if maximizing_player else sys.maxsize
+        best_move = None
+        for move, score in zip(moves, values):
+            if score > value if maximizing_player else score < value:
+                value, best_move = score, move
+        if (value >= beta) if maximizing_player else (value <= alpha):
+            self.pruning_count += 1
+        return value, best_move
+
+    def FrontierChildValue(self, child, alpha, beta, maximizing_player, ply):
+        """Scalar value of a child of a frontier node, or None if it is a quiet leaf for the batch."""
+        self.CheckTime()
+        if child.IsGoalState():
+            return self.GameOverValue(child, ply)
+        if self.IsDrawnLine():
+            return DRAW_SCORE
+        tablebase_score = self.ProbeTableBase(child, maximizing_player, ply)
+        if tablebase_score is not None:
+            return tablebase_score
+        if self.use_quiescence:
+            player = -1 if maximizing_player else 1
+            moves = child.GetAllPossibleMoves(player)
+            if not moves:
+                return self.LossValue(player, ply)
+            if moves[0] >> MOVE_CAPTURE_SHIFT:
+                return self.QuiescenceSearch(child, alpha, beta, maximizing_player, ply)
+        return None
+
+    def ProbeTableBase(self, state, maximizing_player, ply):
+        """
+        Exact score of a position covered by the tablebase, or None.
+
+        Wins score TABLEBASE_WIN_SCORE minus the plies to the end of the
+        game counted from the root, so faster wins (and slower losses) are
+        preferred; draws score 0. The root is never probed since it needs
+        a move, but all of its children are. tablebase_hits counts the
+        probes that found a record (a win or loss).
+        """
+        if self.tablebase is None or ply == 0 or state.PieceCount() > self.tablebase.max_pieces:
+            return None
+        result, distance = self.tablebase.Probe(self.PositionKey(state, maximizing_player))
+        if result == DRAW:
+            return 0.0  # Draws have no record in the tablebase
+        self.tablebase_hits += 1
+        score = TABLEBASE_WIN_SCORE - ply - distance
+        # Scores are from black's (the maximizing side's) point of view
+        return score if (result == WIN) == maximizing_player else -score
+
+    def HorizonValue(self, state, alpha, beta, maximizing_player, ply):
+        """Value of a depth 0 node: quiescence search or static evaluation."""
+        if self.use_quiescence:
+            return self.QuiescenceSearch(state, alpha, beta, maximizing_player, ply)
+        return self.Evaluate(state)
+
+    def GameOverValue(self, state, ply):
+        """Value of a position where a side has no pieces left: that side lost."""
+        return self.LossValue(1 if not state.HasPieces(1) else -1, ply)
+
+    def LossValue(self, loser, ply):
+        """Score of a game lost by loser (1 white, -1 black) ply plies below the root."""
+        score = WIN_SCORE - ply
+        return score if loser == 1 else -score
+
+    def IsDrawnLine(self):
+        """
+        True if the position just reached repeats one earlier in the game or
+        the searched line, or ends a no-progress run: it is scored as a draw.
+        """
+        if self.use_draw_detection and self.history.IsDraw(repetitions=1):
+            self.draws_detected += 1
+            return True
+        return False
+
+    def QuiescenceSearch(self, state, alpha, beta, maximizing_player, ply, extension=0):
+        """
+        Extends a horizon node until the side to move has no capture.
+
+        Captures are mandatory, so there is no "stand pat" option: while
+        the side to move can capture, every capture is searched (most pieces
+        taken first, with alpha-beta pruning) and the position is only
+        evaluated once it is quiet. Capture sequences always remove pieces,
+        so the extension ends without a depth limit.
+        """
+        self.CheckTime()
+        if state.IsGoalState():
+            return self.GameOverValue(state, ply + extension)
+        player = -1 if maximizing_player else 1
+        if self.use_staged_moves:
+            # A quiet position only needs to know that a quiet move exists
+            moves = state.GetCaptureMoves(player)
+            self.moves_generated += len(moves)
+            if not moves:
+                return self.Evaluate(state) if state.HasQuietMove(player) else self.LossValue(player, ply + extension)
+        else:
+            moves = state.GetAllPossibleMoves(player)
+            self.moves_generated += len(moves)
+            if not moves:
+                return self.LossValue(player, ply + extension)
+            if not moves[0] >> MOVE_CAPTURE_SHIFT:
+                return self.Evaluate(state)
+
+        self.quiescence_nodes += 1
+        self.quiescence_depth = max(self.quiescence_depth, extension + 1)
+        moves.sort(key=CaptureCount, reverse=True)
+        value = -sys.maxsize if maximizing_player else sys.maxsize
+        for move in moves:
+            next_state, undo = self.PlayMove(state, move)
+            eval_score = self.QuiescenceSearch(next_state, alpha, beta, not maximizing_player, ply, extension + 1)
+            self.TakeBackMove(next_state, undo)
+            if maximizing_player:
+                value = max(value, eval_score)
+                alpha = max(alpha, value)
+            else:
+                value = min(value, eval_score)
+                beta = min(beta, value)
+            if beta <= alpha:
+                self.quiescence_cutoffs += 1
+                break
+        return value
+
+    def OrderMoves(self, moves, ply, hash_move, player, pv_move=None):
+        """
+        Orders moves cheaply, without playing or evaluating any of them.
+
+        At the root the ranking of the previous iteration is reused as is.
+        Elsewhere:
+        1. The previous iteration's PV move, then the hash move (best move
+           stored for this position) go first.
+        2. Captures (all moves are captures when one exists, the rule being
+           mandatory) are ordered by the number of pieces taken.
+        3. Quiet moves: the two killer moves of this ply first, then the
+           rest by history score.
+        """
+        if ply == 0 and self.root_ranking:
+            ranked = [m for m in self.root_ranking if m in moves]
+            return ranked + [m for m in moves if m not in ranked]
+        if moves[0] >> MOVE_CAPTURE_SHIFT:
+            ordered = sorted(moves, key=CaptureCount, reverse=True)
+        else:
+            killers = self.killer_moves[ply] if ply < MAX_PLY else ()
+            history = self.history_table[player]
+            def QuietScore(m):
+                if m in killers:
+                    return sys.maxsize
+                return history[m & MOVE_SQUARES_MASK]
+            ordered = sorted(moves, key=QuietScore, reverse=True)
+        for first in (hash_move, pv_move):
+            if first is not None and first in ordered:
+                ordered.remove(first)
+                ordered.insert(0, first)
+        return ordered
+
+    def NodeMoves(self, state, player, ply, hash_move, pv_move):
+        """
+        Moves of an AlphaBetaOrderingSearch node in search order: generated
+        lazily by StagedMoves below the root, or as a list ordered by
+        OrderMoves at the root (and with use_staged_moves off). Returns
+        None if the list shows that player has no legal move; a staged
+        node finds out when StagedMoves yields nothing.
+        """
+        if ply > 0 and self.use_staged_moves:
+            return self.StagedMoves(state, player, ply, hash_move, pv_move)
+        moves = state.GetAllPossibleMoves(player)
+        self.moves_generated += len(moves)
+        if not moves:
+            return None
+        if ply == 0 and self.root_moves is not None:
+            moves = [m for m in moves if m in self.root_moves]
+        if moves:
+            moves = self.OrderMoves(moves, ply, hash_move, player, pv_move)
+        return moves
+
+    def StagedMoves(self, state, player, ply, hash_move, pv_move):
+        """
+        Yields the moves of a node in OrderMoves order, generating them in
+        stages so that a cutoff skips the stages not reached yet:
+        1. The PV and hash moves if they are captures, checked by
+           generating the captures of their own piece only
+        2. All captures, most pieces taken first (captures are mandatory,
+           so when there is one, nothing else is legal)
+        3. The PV and hash moves, then this ply's killer moves, each checked
+           for legality without generating moves
+        4. The remaining quiet moves, generated and sorted by history score
+        A move is never yielded twice, and nothing is yielded when player
+        has no legal move.
+        """
+        tried = []
+        for move in (pv_move, hash_move):
+            if move is not None and move >> MOVE_CAPTURE_SHIFT and move not in tried and state.IsLegalCapture(move, player):
+                tried.append(move)
+                yield move
+        captures = state.GetCaptureMoves(player)
+        self.moves_generated += len(captures)
+        if captures:
+            captures.sort(key=CaptureCount, reverse=True)
+            for move in captures:
+                if move not in tried:
+                    yield move
+            return
+
+        killers = self.killer_moves[ply] if ply < MAX_PLY else ()
+        for move in (pv_move, hash_move, *killers):
+            if move is not None and move not in tried and state.IsLegalQuietMove(move, player):
+                tried.append(move)
+                yield move
+        quiet = state.GetQuietMoves(player)
+        self.moves_generated += len(quiet)
+        history = self.history_table[player]
+        quiet.sort(key=lambda m: history[m & MOVE_SQUARES_MASK], reverse=True)
+        for move in quiet:
+            if move not in tried:
+                yield move
+
+    def RecordCutoff(self, move, move_index, depth, ply, player):
+        """Updates the ordering statistics, killer moves and history on a cutoff."""
+        self.ordering_cutoffs += 1
+        if move_index == 0:
+            self.first_move_cutoffs += 1
+        if move >> MOVE_CAPTURE_SHIFT:
+            return  # Captures are already ordered first; killers/history are for quiet moves
+        if ply < MAX_PLY:
+            killers = self.killer_moves[ply]
+            if killers[0] != move:
+                killers[1] = killers[0]
+                killers[0] = move
+        self.history_table[player][move & MOVE_SQUARES_MASK] += depth * depth
+
+    def AlphaBetaOrderingSearch(self, state, depth, alpha, beta, maximizing_player, ply=0):
         """
         Alpha-Beta with move ordering for maximum pruning efficiency.
         
         This demonstrates cutting-edge AI optimization:
-        - Move ordering to maximize pruning
-        - Heuristic-based move prioritization
-        - Significant performance improvement over basic alpha-beta
-        - Real-world AI technique used in professional game engines
+        - Move ordering to maximize pruning (see OrderMoves)
+        - Killer moves and history heuristic learned from cutoffs
+        - Principal variation search: after the first move, siblings are
+          searched with a null window and only re-searched if they beat it
+        - Principal variation recorded in a triangular PV table
+        - root_moves, when set, limits the root to a subset of the legal
+          moves (one worker's share of the parallel search)
+        - The optional selective search of AlphaBetaSearch; a reduced move
+          that beats alpha goes on to the usual PVS searches
         
         Complexity: O(b^(d/2)) with optimal move ordering
         """
-        if depth == 0 or state.IsGoalState() or self.TimeExceeded():
-            return state.EvaluateBoard(), None
+        if ply < MAX_PLY:
+            self.pv_table[ply] = []
+        self.CheckTime()
+        if state.IsGoalState():
+            return self.GameOverValue(state, ply), None
+        if ply > 0 and self.IsDrawnLine():
+            return DRAW_SCORE, None
+        tablebase_score = self.ProbeTableBase(state, maximizing_player, ply)
+        if tablebase_score is not None:
+            return tablebase_score, None
+        if depth == 0:
+            return self.HorizonValue(state, alpha, beta, maximizing_player, ply), None
+
+        key = self.PositionKey(state, maximizing_player)
+        result, alpha, beta, hash_move = self.ProbeTransposition(key, depth, alpha, beta, ply)
+        if result is not None:
+            return result
+        alpha_orig, beta_orig = alpha, beta
+        pv_move = self.pv_hints.get(key)
+        root_results = []
         
         best_move = None
         self.nodes_expanded += 1
+        if depth == 1 and ply > 0 and self.UseBatchEvaluation():
+            value, best_move = self.FrontierSearch(state, alpha, beta, maximizing_player, ply)
+            if best_move is not None:
+                self.pv_table[ply + 1] = []
+                self.UpdatePrincipalVariation(ply, key, best_move)
+            self.StoreTransposition(key, depth, value, alpha_orig, beta_orig, best_move, ply)
+            return value, best_move
+        static = self.SelectiveStaticValue(state, depth, ply)
+        razor_value = self.RazorValue(state, static, depth, alpha, beta, maximizing_player, ply)
+        if razor_value is not None:
+            return razor_value, None
         
         if maximizing_player:
-            moves = state.GetAllPossibleMoves(-1)
-            # Sort moves by evaluation to maximize pruning
-            moves = sorted(moves, key=lambda m: state.ApplyMove(m).EvaluateBoard(), reverse=True)
+            moves = self.NodeMoves(state, -1, ply, hash_move, pv_move)
+            if moves is None:
+                return self.LossValue(-1, ply), None
             value = -sys.maxsize
-            for move in moves:
-                next_state = state.ApplyMove(move)
-                eval_score, _ = self.AlphaBetaOrderingSearch(next_state, depth - 1, alpha, beta, False)
+            move_index = -1
+            for move_index, move in enumerate(moves):
+                if self.IsFutileMove(move, move_index, static, depth, alpha, beta, -1):
+                    value = max(value, static + FUTILITY_MARGINS[depth])
+                    continue
+                next_state, undo = self.PlayMove(state, move)
+                eval_score = self.ReducedSearchValue(self.AlphaBetaOrderingSearch, next_state, move, move_index,
+                                                     depth, alpha, beta, True, ply)
+                if eval_score is not None:
+                    pass
+                elif move_index > 0 and self.use_pvs and alpha > -sys.maxsize:
+                    eval_score, _ = self.AlphaBetaOrderingSearch(next_state, depth - 1, alpha, alpha + NULL_WINDOW, False, ply + 1)
+                    if alpha < eval_score < beta:
+                        self.pvs_researches += 1
+                        eval_score, _ = self.AlphaBetaOrderingSearch(next_state, depth - 1, alpha, beta, False, ply + 1)
+                else:
+                    eval_score, _ = self.AlphaBetaOrderingSearch(next_state, depth - 1, alpha, beta, False, ply + 1)
+                self.TakeBackMove(next_state, undo)
+                if ply == 0:
+                    root_results.append((eval_score, move))
                 if eval_score > value:
                     value = eval_score
                     best_move = move
+                    if ply == 0 and value > alpha_orig:
+                        self.root_partial = (value, best_move)
+                    self.UpdatePrincipalVariation(ply, key, move)
                 alpha = max(alpha, value)
                 if beta <= alpha:
                     self.pruning_count += 1
-                    self.ordering_gain += 1  # Track ordering benefits
+                    self.RecordCutoff(move, move_index, depth, ply, -1)
                     break
-            return value, best_move
+            if move_index < 0 and ply > 0:
+                return self.LossValue(-1, ply), None
         else:
-            moves = state.GetAllPossibleMoves(1)
-            # Sort moves by evaluation (ascending for minimizing player)
-            moves = sorted(moves, key=lambda m: state.ApplyMove(m).EvaluateBoard())
+            moves = self.NodeMoves(state, 1, ply, hash_move, pv_move)
+            if moves is None:
+                return self.LossValue(1, ply), None
             value = sys.maxsize
-            for move in moves:
-                next_state = state.ApplyMove(move)
-                eval_score, _ = self.AlphaBetaOrderingSearch(next_state, depth - 1, alpha, beta, True)
+            move_index = -1
+            for move_index, move in enumerate(moves):
+                if self.IsFutileMove(move, move_index, static, depth, alpha, beta, 1):
+                    value = min(value, static - FUTILITY_MARGINS[depth])
+                    continue
+                next_state, undo = self.PlayMove(state, move)
+                eval_score = self.ReducedSearchValue(self.AlphaBetaOrderingSearch, next_state, move, move_index,
+                                                     depth, alpha, beta, False, ply)
+                if eval_score is not None:
+                    pass
+                elif move_index > 0 and self.use_pvs and beta < sys.maxsize:
+                    eval_score, _ = self.AlphaBetaOrderingSearch(next_state, depth - 1, beta - NULL_WINDOW, beta, True, ply + 1)
+                    if alpha < eval_score < beta:
+                        self.pvs_researches += 1
+                        eval_score, _ = self.AlphaBetaOrderingSearch(next_state, depth - 1, alpha, beta, True, ply + 1)
+                else:
+                    eval_score, _ = self.AlphaBetaOrderingSearch(next_state, depth - 1, alpha, beta, True, ply + 1)
+                self.TakeBackMove(next_state, undo)
+                if ply == 0:
+                    root_results.append((eval_score, move))
                 if eval_score < value:
                     value = eval_score
                     best_move = move
+                    if ply == 0 and value < beta_orig:
+                        self.root_partial = (value, best_move)
+                    self.UpdatePrincipalVariation(ply, key, move)
                 beta = min(beta, value)
                 if beta <= alpha:
                     self.pruning_count += 1
-                    self.ordering_gain += 1  # Track ordering benefits
+                    self.RecordCutoff(move, move_index, depth, ply, 1)
                     break
-            return value, best_move
+            if move_index < 0 and ply > 0:
+                return self.LossValue(1, ply), None
 
-    def ChooseMove(self, state, strategy):
+        if ply == 0:
+            root_results.sort(key=lambda result: result[0], reverse=maximizing_player)
+            self.root_ranking = [move for _, move in root_results]
+        # A root searched over a subset of its moves has no true value to store
+        if ply > 0 or self.root_moves is None:
+            self.StoreTransposition(key, depth, value, alpha_orig, beta_orig, best_move, ply)
+        return value, best_move
+
+    def UpdatePrincipalVariation(self, ply, key, move):
+        """Makes move followed by the child's PV the principal variation at ply."""
+        if ply < MAX_PLY:
+            self.pv_table[ply] = [(key, move)] + self.pv_table[ply + 1]
+
+    def ChooseMove(self, state, strategy, player=-1, history=None):
         """
         Advanced move selection with comprehensive analytics.
         
@@ -217,24 +1146,460 @@ class SearchToolBox:
         - Performance monitoring and analytics
         - Time management for real-time play
         - Error handling and robustness
+
+        player is the side to move: -1 (black) by default, as the bot plays
+        black against the human, or 1 (white) for self-play. Scores are
+        always from black's point of view.
+
+        history is the game's PositionHistory, ending with state; lines
+        that repeat a game position are then scored as draws. Without it
+        the search only sees repetitions within its own lines.
+
+        Returns the move as a packed int (see MoveEncoding.UnpackMove for
+        the row/column form).
         """
-        # Reset performance metrics and record the start time
+        self.ResetSearchState()
+        self.root_history = history
+
+        # The bitboard returns the same packed moves, so callers are unaffected
+        if self.use_bitboard:
+            state = BitBoard.FromGameBoard(state)
+
+        # Use iterative deepening for better time management
+        if strategy == "parallel":
+            move, score = self.ParallelRootSearch(state, player)
+        elif strategy == "mcts":
+            move, score = self.MonteCarloSearch(state, player)
+        else:
+            move, score = self.IterativeDeepeningSearch(state, strategy, player)
+
+        if strategy != "parallel":
+            self.evaluation_cache_hits = self.evaluation_cache.hits
+            self.evaluation_cache_misses = self.evaluation_cache.misses
+
+        # Share of cutoffs produced by the first move searched (ordering quality)
+        if self.ordering_cutoffs > 0:
+            self.ordering_gain = 100.0 * self.first_move_cutoffs / self.ordering_cutoffs
+
+        # Summary of the whole search
+        if self.telemetry.enabled:
+            tt = self.transposition_table
+            tt_statistics = None
+            if self.use_transposition_table and strategy not in ("minimax", "parallel", "mcts"):
+                tt_statistics = {"hits": tt.hits, "misses": tt.misses, "collisions": tt.collisions,
+                                 "filled": tt.filled, "size": tt.size}
+            self.Emit("search", strategy=strategy, move=move, score=score,
+                      depth=self.depth_statistics[-1]["depth"] if self.depth_statistics else 0,
+                      elapsed=time.time() - self.start_time, time_limit=self.time_limit,
+                      nodes=self.nodes_expanded, pruning=self.pruning_count,
+                      iterations=self.iteration_count, aborted=self.search_aborted,
+                      moves_generated=self.moves_generated,
+                      lmr_reductions=self.lmr_reductions, lmr_researches=self.lmr_researches,
+                      futility_pruned=self.futility_pruned, razor_cutoffs=self.razor_cutoffs,
+                      quiescence_nodes=self.quiescence_nodes, quiescence_cutoffs=self.quiescence_cutoffs,
+                      quiescence_depth=self.quiescence_depth, tablebase_hits=self.tablebase_hits,
+                      draws_detected=self.draws_detected, playouts=self.playouts,
+                      evaluation_cache_hits=self.evaluation_cache_hits,
+                      evaluation_cache_misses=self.evaluation_cache_misses,
+                      evaluation_cache_filled=len(self.evaluation_cache) if strategy != "parallel" else None,
+                      playouts_per_second=self.playouts_per_second, tree_reused_visits=self.tree_reused_visits,
+                      ordering_gain=self.ordering_gain, ordering_cutoffs=self.ordering_cutoffs,
+                      transposition_table=tt_statistics)
+    
+        return move, score
+
+    def ResetSearchState(self):
+        """Resets the per-move counters and search state and starts the clock."""
         self.nodes_expanded = 0
         self.pruning_count = 0
         self.ordering_gain = 0
+        self.ordering_cutoffs = 0
+        self.first_move_cutoffs = 0
         self.iteration_count = 0
         self.start_time = time.time()
+        self.time_check_countdown = TIME_CHECK_INTERVAL
+        self.search_aborted = False
+        self.current_depth = 0
+        self.killer_moves = [[None, None] for _ in range(MAX_PLY)]
+        self.pv_hints = {}
+        self.root_ranking = []
+        self.previous_best_move = None
+        self.principal_variation = []
+        self.pvs_researches = 0
+        self.aspiration_researches = 0
+        self.depth_statistics = []
+        self.moves_generated = 0
+        self.lmr_reductions = 0
+        self.lmr_researches = 0
+        self.futility_pruned = 0
+        self.razor_cutoffs = 0
+        self.quiescence_nodes = 0
+        self.quiescence_cutoffs = 0
+        self.quiescence_depth = 0
+        self.tablebase_hits = 0
+        self.batch_evaluations = 0
+        self.draws_detected = 0
+        self.playouts = 0
+        self.playouts_per_second = 0.0
+        self.tree_reused_visits = 0
+        self.evaluation_cache_hits = 0
+        self.evaluation_cache_misses = 0
+        self.PrepareEvaluationCache()
+        for table in self.history_table.values():
+            for index in range(len(table)):
+                table[index] >>= 1  # Age history so older positions weigh less
+        self.transposition_table.ResetStatistics()
+        self.transposition_table.NewSearch()
 
-        # Use iterative deepening for better time management
-        move, score = self.IterativeDeepeningSearch(state, strategy)
+    def ParallelRootSearch(self, state, player=-1):
+        """
+        Root-parallel iterative deepening over a pool of worker processes.
+
+        - The root moves are dealt round-robin, best static evaluation
+          first, into one share per worker
+        - Each worker runs the alpha-beta with ordering search on its share
+          with its own transposition table, kept between moves
+        - All workers share this toolbox's start time, so the soft and hard
+          time limits apply to the whole search
+        - Results are combined at the deepest depth every worker completed,
+          so all compared scores come from searches of the same depth
+        """
+        moves = state.GetAllPossibleMoves(player)
+        if not moves:
+            return None, -sys.maxsize if player == -1 else sys.maxsize
+        moves.sort(key=lambda move: self.EvaluateMove(state, move), reverse=player == -1)
+        share_count = min(self.workers, len(moves))
+        settings = {name: getattr(self, name) for name in PARALLEL_SETTINGS}
+        tablebase_path = self.tablebase.path if self.tablebase is not None else None
+        tasks = [(state, player, moves[index::share_count], self.start_time, settings, tablebase_path,
+                  self.root_history) for index in range(share_count)]
+        results = self.GetProcessPool().map(_SearchRootShare, tasks)
+
+        for result in results:
+            self.nodes_expanded += result["nodes"]
+            self.pruning_count += result["pruning"]
+            self.ordering_cutoffs += result["ordering_cutoffs"]
+            self.first_move_cutoffs += result["first_move_cutoffs"]
+            self.moves_generated += result["moves_generated"]
+            for name in ("lmr_reductions", "lmr_researches", "futility_pruned", "razor_cutoffs",
+                         "evaluation_cache_hits", "evaluation_cache_misses"):
+                setattr(self, name, getattr(self, name) + result[name])
+            self.quiescence_nodes += result["quiescence_nodes"]
+            self.quiescence_cutoffs += result["quiescence_cutoffs"]
+            self.quiescence_depth = max(self.quiescence_depth, result["quiescence_depth"])
+            self.tablebase_hits += result["tablebase_hits"]
+            self.draws_detected += result["draws_detected"]
+            self.search_aborted = self.search_aborted or result["aborted"]
+
+        common_depth = min(len(result["depth_statistics"]) for result in results)
+        self.iteration_count = common_depth
+        for depth_index in range(common_depth):
+            entries = [result["depth_statistics"][depth_index] for result in results]
+            best = (max if player == -1 else min)(entries, key=lambda entry: entry["score"])
+            self.depth_statistics.append({"depth": best["depth"], "score": best["score"], "move": best["move"],
+                                          "nodes": sum(entry["nodes"] for entry in entries),
+                                          "elapsed": max(entry["elapsed"] for entry in entries)})
+            self.Emit("iteration", depth=best["depth"], score=best["score"], move=best["move"],
+                      nodes=self.depth_statistics[-1]["nodes"], total_nodes=self.nodes_expanded,
+                      cutoffs=self.pruning_count, tt_hits=0, elapsed=best["elapsed"],
+                      pv=[best["move"]], workers=share_count)
+
+        if common_depth == 0:
+            # Some worker did not finish depth 1: fall back to the best static move
+            return moves[0], self.EvaluateMove(state, moves[0])
+        best = self.depth_statistics[-1]
+        return best["move"], best["score"]
+
+    def MonteCarloSearch(self, state, player=-1):
+        """
+        Monte Carlo tree search (UCT) until the time limit or StopSearch.
+
+        - Each iteration selects a new leaf by UCT (MonteCarloTree.Select),
+          plays it out (Playout) and backs the result up the path
+        - With workers > 1 the playouts run in the process pool, up to
+          PLAYOUTS_IN_FLIGHT_PER_WORKER per worker at once; the paths of
+          pending playouts carry a virtual loss, so the next selections
+          explore other lines instead of waiting on the same one
+        - The tree is kept for the next search and re-rooted on the
+          position reached (reuse_tree); tree_reused_visits counts the
+          playouts it brings along
+        - The move played is the most visited root child. The score is its
+          win rate from black's point of view, mapped back to evaluation
+          units (EvaluationFromScore)
+
+        nodes_expanded counts tree nodes added plus playout plies, so its
+        rate compares with the alpha-beta searches; playouts_per_second is
+        reported separately.
+        """
+        tree = self.mcts_tree if self.reuse_tree else None
+        if tree is None or not tree.Reroot(state, player):
+            tree = MonteCarloTree(state, player, self.uct_exploration)
+        tree.exploration = self.uct_exploration
+        self.mcts_tree = tree
+        self.tree_reused_visits = tree.root.visits
+        if tree.root.terminal is not None:
+            return None, -sys.maxsize if player == -1 else sys.maxsize
+
+        task = (self.playout_plies, self.playout_policy)
+        if self.workers > 1:
+            pool = self.GetProcessPool()
+            results = queue.Queue()
+            in_flight = 0
+            while True:
+                while in_flight < self.workers * PLAYOUTS_IN_FLIGHT_PER_WORKER and not self.MonteCarloStopped():
+                    leaf, leaf_state = tree.Select()
+                    self.nodes_expanded += 1
+                    if leaf.terminal is not None:
+                        tree.Backpropagate(leaf, leaf.terminal)
+                        continue
+                    pool.apply_async(PlayoutTask, ((leaf_state, leaf.player) + task,),
+                                     callback=lambda result, leaf=leaf: results.put((leaf, result)),
+                                     error_callback=lambda error, leaf=leaf: results.put((leaf, error)))
+                    in_flight += 1
+                if in_flight == 0:
+                    break
+                leaf, result = results.get()  # Pending playouts are collected even after the time is up
+                in_flight -= 1
+                if isinstance(result, BaseException):
+                    raise result
+                self.BackpropagatePlayout(tree, leaf, result)
+        else:
+            while not self.MonteCarloStopped():
+                leaf, leaf_state = tree.Select()
+                self.nodes_expanded += 1
+                if leaf.terminal is not None:
+                    tree.Backpropagate(leaf, leaf.terminal)
+                else:
+                    self.BackpropagatePlayout(tree, leaf, Playout(leaf_state, leaf.player, *task))
 
-        # Calculate elapsed time for the move computation
         elapsed = time.time() - self.start_time
-        print(f"Bot computed move in {elapsed:.3f} seconds (limit was {self.time_limit} seconds)")
-        print(f"Search statistics: {self.nodes_expanded:,} nodes, {self.pruning_count:,} pruned")
-        print(f"Iterative deepening completed {self.iteration_count} iterations")
-        if self.ordering_gain > 0:
-            print(f"Ordering provided {self.ordering_gain:,} additional pruning opportunities")
-    
-        return move, score
+        self.playouts_per_second = self.playouts / elapsed if elapsed > 0 else 0.0
+        best = tree.BestChild()
+        if best is None:
+            # Stopped before the first selection: fall back to the first legal move
+            move = state.GetAllPossibleMoves(player)[0]
+            self.principal_variation = [move]
+            return move, self.EvaluateMove(state, move)
+        win_rate = best.score / best.visits if best.visits else 0.5
+        score = EvaluationFromScore(win_rate if player == -1 else 1.0 - win_rate)
+        self.principal_variation = tree.PrincipalVariation()
+        self.iteration_count = 1
+        self.depth_statistics.append({"depth": tree.depth, "score": score, "move": best.move,
+                                      "nodes": self.nodes_expanded, "elapsed": elapsed})
+        return best.move, score
+
+    def MonteCarloStopped(self):
+        """Tests if the Monte Carlo search must stop starting playouts (time limit or StopSearch)."""
+        return self.stop_event.is_set() or self.TimeExceeded()
+
+    def BackpropagatePlayout(self, tree, leaf, result):
+        """Backs up one playout's (result, plies) and counts it."""
+        tree.Backpropagate(leaf, result[0])
+        self.playouts += 1
+        self.nodes_expanded += result[1]
+
+    def GetProcessPool(self):
+        """Returns the worker pool, creating it with self.workers processes on first use."""
+        if self.process_pool is None:
+            self.pool_stop_event = multiprocessing.Event()
+            self.process_pool = multiprocessing.Pool(self.workers, initializer=_InitializeWorker,
+                                                     initargs=(self.tt_memory_mb, self.pool_stop_event))
+        return self.process_pool
+
+    def Close(self):
+        """Shuts down the worker pool of the parallel search, if one was started."""
+        if self.process_pool is not None:
+            self.process_pool.terminate()
+            self.process_pool.join()
+            self.process_pool = None
+            self.pool_stop_event = None
+
+    def StopSearch(self):
+        """
+        Asks the running search (in another thread) to stop now.
+
+        The search returns the best move of its last completed depth, as
+        when the hard time limit passes; the workers of the parallel search
+        stop as well. Call ClearStop once the search has returned.
+        """
+        self.stop_event.set()
+        if self.pool_stop_event is not None:
+            self.pool_stop_event.set()
+
+    def ClearStop(self):
+        """Clears a StopSearch request so the next search runs normally."""
+        self.stop_event.clear()
+        if self.pool_stop_event is not None:
+            self.pool_stop_event.clear()
+
+    def PredictReply(self, state, bot_move):
+        """
+        Opponent's expected reply in state, the position after bot_move.
+
+        This is the second move of the principal variation when the search
+        produced one starting with bot_move, otherwise the best move the
+        transposition table holds for state. Returns None if neither is a
+        legal reply.
+        """
+        reply = None
+        if len(self.principal_variation) >= 2 and self.principal_variation[0] == bot_move:
+            reply = self.principal_variation[1]
+        elif self.use_transposition_table:
+            entry = self.transposition_table.Probe(ZobristKey(state.hash, 1))
+            reply = entry[3] if entry is not None else None
+        return reply if reply is not None and reply in state.GetAllPossibleMoves(1) else None
+
+    def StartPondering(self, state, bot_move, strategy, history=None):
+        """
+        Starts searching the position after the predicted reply in a thread.
+
+        state is the position after bot_move, with the opponent to move.
+        The thread searches on this toolbox, so nothing else may use it
+        until StopPondering or TakePonderResult. history is the game's
+        PositionHistory ending with state. Returns the predicted reply, or
+        None when there is nothing to ponder.
+        """
+        self.StopPondering()
+        reply = self.PredictReply(state, bot_move)
+        if reply is None:
+            return None
+        ponder_state = state.ApplyMove(reply)
+        if ponder_state.IsGoalState():
+            return None
+        if self.use_bitboard and not isinstance(ponder_state, BitBoard):
+            ponder_state = BitBoard.FromGameBoard(ponder_state)
+        ponder_history = None
+        if history is not None:
+            ponder_history = history.Copy()
+            ponder_history.Push(ponder_state.hash, state.IsReversibleMove(reply))
+        self.ponder_key = ZobristKey(ponder_state.hash, -1)
+        self.ponder_result = None
+        self.ponder_thread = threading.Thread(target=self.Ponder, args=(ponder_state, strategy, ponder_history),
+                                              daemon=True)
+        self.ponder_thread.start()
+        return reply
+
+    def Ponder(self, state, strategy, history=None):
+        """
+        Thread body: silent iterative deepening on state until max_depth is
+        done or StopPondering sets stop_event. The parallel strategy ponders
+        with the single-process alpha-beta with ordering search. The Monte
+        Carlo search grows its tree instead and leaves no result: after a
+        ponder hit the next search re-roots on the pondered position.
+        """
+        if strategy == "parallel":
+            strategy = "alphabeta_ordering"
+        time_limit, soft_time_fraction = self.time_limit, self.soft_time_fraction
+        self.time_limit, self.soft_time_fraction = PONDER_TIME_LIMIT, 1.0
+        telemetry, self.telemetry = self.telemetry, NullSink()
+        try:
+            self.ResetSearchState()
+            self.root_history = history
+            if strategy == "mcts":
+                self.MonteCarloSearch(state)
+                return
+            move, score = self.IterativeDeepeningSearch(state, strategy)
+            depth = self.depth_statistics[-1]["depth"] if self.depth_statistics else 0
+            self.ponder_result = (move, score, depth)
+        finally:
+            self.time_limit, self.soft_time_fraction = time_limit, soft_time_fraction
+            self.telemetry = telemetry
+
+    def StopPondering(self):
+        """Aborts the ponder search, if any, and waits for its thread to finish."""
+        if self.ponder_thread is not None:
+            self.stop_event.set()
+            self.ponder_thread.join()
+            self.ponder_thread = None
+            self.stop_event.clear()
+
+    def TakePonderResult(self, state):
+        """
+        Stops pondering and returns its (move, score) for state, or None.
+
+        The result is only used when the opponent played the predicted
+        reply (ponder hit) and the ponder search completed max_depth.
+        Otherwise the transposition table and history it filled still
+        speed up the regular search of the position.
+        """
+        self.StopPondering()
+        result, self.ponder_result = self.ponder_result, None
+        if self.ponder_key is None:
+            return None
+        hit = self.ponder_key == ZobristKey(state.hash, -1)
+        self.ponder_key = None
+        if not hit:
+            self.ponder_misses += 1
+            return None
+        self.ponder_hits += 1
+        if result is not None and result[0] is not None and result[2] >= self.max_depth:
+            return result[0], result[1]
+        return None
+
+
+# Toolbox of the current worker process, kept between moves so that its
+# transposition table and history table carry over
+_worker_toolbox = None
+
+
+def ScoreToTable(score, ply):
+    """A search score (finished games counted from the root) as the transposition table stores it."""
+    if score >= WIN_SCORE_THRESHOLD:
+        return score + ply
+    if score <= -WIN_SCORE_THRESHOLD:
+        return score - ply
+    return score
+
+
+def ScoreFromTable(score, ply):
+    """Inverse of ScoreToTable for a node ply plies below the root."""
+    if score >= WIN_SCORE_THRESHOLD:
+        return score - ply
+    if score <= -WIN_SCORE_THRESHOLD:
+        return score + ply
+    return score
+
+
+def _InitializeWorker(tt_memory_mb, stop_event):
+    """Pool initializer: gives the worker process its own toolbox, stopped by the pool's event."""
+    global _worker_toolbox
+    _worker_toolbox = SearchToolBox(tt_memory_mb=tt_memory_mb)
+    _worker_toolbox.stop_event = stop_event
+    _worker_toolbox.telemetry = NullSink()  # Progress is reported by the parent
+
 
+def _SearchRootShare(task):
+    """Searches one share of the root moves in a worker process."""
+    state, player, root_moves, start_time, settings, tablebase_path, root_history = task
+    toolbox = _worker_toolbox
+    for name, value in settings.items():
+        setattr(toolbox, name, value)
+    toolbox.ResetSearchState()
+    toolbox.start_time = start_time
+    toolbox.root_moves = root_moves
+    toolbox.root_history = root_history
+    if tablebase_path is None:
+        toolbox.tablebase = None
+    elif toolbox.tablebase is None or toolbox.tablebase.path != tablebase_path:
+        toolbox.tablebase = TableBase(tablebase_path)  # Each worker maps the file itself
+    toolbox.IterativeDeepeningSearch(state, "alphabeta_ordering", player)
+    return {
+        "depth_statistics": toolbox.depth_statistics,
+        "nodes": toolbox.nodes_expanded,
+        "pruning": toolbox.pruning_count,
+        "ordering_cutoffs": toolbox.ordering_cutoffs,
+        "first_move_cutoffs": toolbox.first_move_cutoffs,
+        "moves_generated": toolbox.moves_generated,
+        "lmr_reductions": toolbox.lmr_reductions,
+        "lmr_researches": toolbox.lmr_researches,
+        "futility_pruned": toolbox.futility_pruned,
+        "razor_cutoffs": toolbox.razor_cutoffs,
+        "evaluation_cache_hits": toolbox.evaluation_cache.hits,
+        "evaluation_cache_misses": toolbox.evaluation_cache.misses,
+        "quiescence_nodes": toolbox.quiescence_nodes,
+        "quiescence_cutoffs": toolbox.quiescence_cutoffs,
+        "quiescence_depth": toolbox.quiescence_depth,
+        "tablebase_hits": toolbox.tablebase_hits,
+        "draws_detected": toolbox.draws_detected,
+        "aborted": toolbox.search_aborted,
+    }
@@ -0,0 +1,198 @@
+import argparse
+import array
+import bisect
+import itertools
+import os
+import time
+
+from BitBoard import *
+from RecordFile import *
+
+# Game-theoretic results, from the point of view of the side to move
+DRAW = 0
+WIN = 1
+LOSS = 2
+
+# Score of a won position in the search, before subtracting the number of
+# plies to the end of the game. Larger than any static evaluation.
+TABLEBASE_WIN_SCORE = 1000
+
+TABLEBASE_MAGIC = b"CKRTB001"
+TABLEBASE_RECORD = "<QH"  # position key, distance << 2 | result
+
+DEFAULT_TABLEBASE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tablebase.bin")
+
+
+class TableBase:
+    """
+    Read-only endgame tablebase built by TableBaseGenerator.
+
+    Every position with at most max_pieces pieces is covered. The file
+    only stores decisive positions (win or loss with the number of plies
+    to the end of the game), so a covered position that is not found is a
+    draw. Probing is a binary search over the memory-mapped file.
+    """
+    def __init__(self, path=DEFAULT_TABLEBASE_PATH):
+        self.path = path
+        self.file = SortedRecordFile(path, TABLEBASE_MAGIC, TABLEBASE_RECORD)
+        self.max_pieces = self.file.metadata
+
+    def Probe(self, key):
+        """Returns (result, distance) for a covered position key."""
+        record = self.file.Lookup(key)
+        if record is None:
+            return DRAW, 0
+        return record[1] & 3, record[1] >> 2
+
+    def Close(self):
+        """Unmaps the tablebase file."""
+        self.file.Close()
+
+
+class TableBaseGenerator:
+    """
+    Offline retrograde analysis of all positions with few pieces.
+
+    1. Every legal placement of 2..max_pieces pieces (both colours present,
+       no man on its promotion row) is enumerated for both sides to move.
+    2. Each position's moves are generated once and stored as edges to
+       the child positions; captures and promotions lead to positions
+       that are also in the set.
+    3. Positions whose side to move has no legal move are lost, and a
+       capture of the last enemy piece wins. Results then propagate
+       backwards level by level: a child lost in d plies makes its parent
+       won in d + 1, and a parent all of whose children are won is lost in
+       1 + the longest of them. Positions never resolved are draws.
+
+    Distances count plies to the end of the game with the winner taking
+    the fastest and the loser the slowest way.
+    """
+    def __init__(self, max_pieces=3):
+        self.max_pieces = max_pieces
+
+    def EnumeratePlacements(self):
+        """Yields the (white, black, kings) masks of every covered placement."""
+        for count in range(2, self.max_pieces + 1):
+            for squares in itertools.combinations(range(32), count):
+                for pieces in itertools.product((1, 2, -1, -2), repeat=count):
+                    white = black = kings = 0
+                    for sq, piece in zip(squares, pieces):
+                        if (piece == 1 and sq < 4) or (piece == -1 and sq >= 28):
+                            break  # A man on its promotion row would have been crowned
+                        if piece > 0:
+                            white |= 1 << sq
+                        else:
+                            black |= 1 << sq
+                        if piece == 2 or piece == -2:
+                            kings |= 1 << sq
+                    else:
+                        if white and black:
+                            yield white, black, kings
+
+    def Generate(self):
+        """Runs the analysis and returns the sorted keys and their values."""
+        started = time.time()
+        positions = []
+        for white, black, kings in self.EnumeratePlacements():
+            zobrist_hash = BitBoard(white, black, kings).hash
+            for player in (1, -1):
+                positions.append((ZobristKey(zobrist_hash, player), white, black, kings, player))
+        positions.sort()
+        keys = array.array("Q", (position[0] for position in positions))
+        count = len(keys)
+        print(f"{count:,} positions with up to {self.max_pieces} pieces ({time.time() - started:.1f}s)")
+
+        # Forward pass: child edges (CSR), terminal results
+        results = array.array("B", [0]) * count
+        distances = array.array("H", [0]) * count
+        remaining = array.array("H", [0]) * count  # Unresolved children per position
+        longest = array.array("H", [0]) * count  # Longest win among resolved children
+        edge_start = array.array("I", [0])
+        edges = array.array("I")
+        levels = [[], []]  # Resolved positions by distance, processed in increasing order
+        for index, (key, white, black, kings, player) in enumerate(positions):
+            board = BitBoard(white, black, kings, key ^ (ZOBRIST_BLACK_TO_MOVE if player == -1 else 0))
+            moves = board.GetAllPossibleMoves(player)
+            for move in moves:
+                child_white, child_black, child_kings = board.MovedMasks(move)
+                child_enemy, child_own = (child_black, child_white) if player == 1 else (child_white, child_black)
+                if not child_enemy:
+                    results[index], distances[index] = WIN, 1
+                    continue
+                if not child_own:
+                    continue  # The mover vanished (circular king capture): a lost line of length 0
+                child_key = ZobristKey(board.HashAfter(child_white, child_black, child_kings), -player)
+                edges.append(bisect.bisect_left(keys, child_key))
+                remaining[index] += 1
+            edge_start.append(len(edges))
+            if results[index] == WIN:
+                levels[1].append(index)
+            elif remaining[index] == 0:
+                # No move, or every move loses on the spot
+                results[index], distances[index] = LOSS, 1 if moves else 0
+                levels[distances[index]].append(index)
+        del positions
+        print(f"{len(edges):,} moves generated ({time.time() - started:.1f}s)")
+
+        # Reverse edges: parents of every position
+        parent_start = array.array("I", [0]) * (count + 1)
+        for child in edges:
+            parent_start[child + 1] += 1
+        for index in range(count):
+            parent_start[index + 1] += parent_start[index]
+        parents = array.array("I", [0]) * len(edges)
+        fill = array.array("I", parent_start)
+        for parent in range(count):
+            for edge in range(edge_start[parent], edge_start[parent + 1]):
+                child = edges[edge]
+                parents[fill[child]] = parent
+                fill[child] += 1
+        del edges, edge_start, fill
+
+        # Backward passes in order of distance. Every position resolved while
+        # processing level d is at distance d + 1.
+        distance = 0
+        while distance < len(levels):
+            if distance + 1 == len(levels):
+                levels.append([])
+            next_level = levels[distance + 1]
+            for child in levels[distance]:
+                for edge in range(parent_start[child], parent_start[child + 1]):
+                    parent = parents[edge]
+                    if results[parent] != DRAW:
+                        continue
+                    if results[child] == LOSS:
+                        results[parent], distances[parent] = WIN, distance + 1
+                        next_level.append(parent)
+                    else:
+                        remaining[parent] -= 1
+                        longest[parent] = max(longest[parent], distance)
+                        if remaining[parent] == 0:
+                            results[parent], distances[parent] = LOSS, longest[parent] + 1
+                            next_level.append(parent)
+            if not next_level:
+                break
+            distance += 1
+        print(f"Retrograde analysis done ({time.time() - started:.1f}s)")
+        return keys, results, distances
+
+    def Build(self, path=DEFAULT_TABLEBASE_PATH):
+        """Generates the tablebase and writes its decisive positions to path."""
+        keys, results, distances = self.Generate()
+        records = [(keys[index], distances[index] << 2 | results[index])
+                   for index in range(len(keys)) if results[index] != DRAW]
+        SortedRecordFile.Write(path, TABLEBASE_MAGIC, TABLEBASE_RECORD, records, self.max_pieces)
+        wins = sum(1 for result in results if result == WIN)
+        losses = sum(1 for result in results if result == LOSS)
+        print(f"{wins:,} wins, {losses:,} losses, {len(keys) - wins - losses:,} draws, "
+              f"longest win {max(distances)} plies")
+        print(f"Wrote {len(records):,} records ({os.path.getsize(path):,} bytes) to {path}")
+        return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Builds the endgame tablebase")
+    parser.add_argument("--pieces", type=int, default=3, help="largest number of pieces covered")
+    parser.add_argument("--output", default=DEFAULT_TABLEBASE_PATH)
+    args = parser.parse_args()
+    TableBaseGenerator(args.pieces).Build(args.output)
@@ -0,0 +1,132 @@
+import collections
+import json
+
+# Events emitted by SearchToolBox (every event is a dict with an "event" key):
+# - "iteration_start": depth
+# - "iteration": depth, score, move, nodes (this depth), total_nodes, cutoffs,
+#   tt_hits, elapsed, pv; the parallel search adds workers
+# - "iteration_aborted": depth, kept (a fully searched root move was kept), score
+# - "search": one per ChooseMove with the move, score, depth reached and the
+#   totals of the whole search
+
+
+class NullSink:
+    """
+    Discards every event. The search checks `enabled` before building an
+    event, so a toolbox with this sink does no telemetry work at all.
+    """
+    enabled = False
+
+    def Emit(self, event):
+        pass
+
+    def Close(self):
+        pass
+
+
+class ConsoleSink:
+    """Prints events as human-readable progress lines (the default sink)."""
+    enabled = True
+
+    def Emit(self, event):
+        kind = event["event"]
+        if kind == "iteration_start":
+            print(f"Searching at depth {event['depth']}...")
+        elif kind == "iteration":
+            if "workers" in event:
+                print(f"Depth {event['depth']} completed by all {event['workers']} workers: score = {event['score']}")
+            else:
+                print(f"Depth {event['depth']} completed: score = {event['score']}, nodes = {event['nodes']:,}")
+        elif kind == "iteration_aborted":
+            if event["kept"]:
+                print(f"Depth {event['depth']} interrupted: keeping best fully searched root move "
+                      f"(score = {event['score']})")
+            else:
+                print(f"Depth {event['depth']} interrupted before its first root move finished: discarded")
+        elif kind == "search":
+            self.PrintSearch(event)
+
+    def PrintSearch(self, event):
+        """Summary printed after every move computation."""
+        print(f"Bot computed move in {event['elapsed']:.3f} seconds (limit was {event['time_limit']} seconds)")
+        print(f"Search statistics: {event['nodes']:,} nodes, {event['pruning']:,} pruned")
+        print(f"Iterative deepening completed {event['iterations']} iterations")
+        if event["quiescence_nodes"] > 0:
+            print(f"Quiescence: {event['quiescence_nodes']:,} capture nodes past the horizon, "
+                  f"{event['quiescence_cutoffs']:,} cutoffs, longest extension {event['quiescence_depth']} plies")
+        if event["playouts"] > 0:
+            print(f"Monte Carlo: {event['playouts']:,} playouts ({event['playouts_per_second']:,.0f}/s), "
+                  f"{event['tree_reused_visits']:,} carried over from the previous move")
+        if event["tablebase_hits"] > 0:
+            print(f"Endgame tablebase: {event['tablebase_hits']:,} won or lost positions found")
+        if event["draws_detected"] > 0:
+            print(f"Draw detection: {event['draws_detected']:,} lines cut as repetitions or no-progress draws")
+        if event["lmr_reductions"] or event["futility_pruned"] or event["razor_cutoffs"]:
+            print(f"Selective search: {event['lmr_reductions']:,} late moves reduced "
+                  f"({event['lmr_researches']:,} searched again), {event['futility_pruned']:,} futile moves skipped, "
+                  f"{event['razor_cutoffs']:,} nodes razored")
+        if event["ordering_cutoffs"] > 0:
+            print(f"Move ordering: {event['ordering_gain']:.1f}% of {event['ordering_cutoffs']:,} cutoffs on the first move")
+        probes = event["evaluation_cache_hits"] + event["evaluation_cache_misses"]
+        if probes > 0:
+            filled = event["evaluation_cache_filled"]
+            print(f"Evaluation cache: {event['evaluation_cache_hits']:,} hits, {event['evaluation_cache_misses']:,} misses "
+                  f"({100.0 * event['evaluation_cache_hits'] / probes:.1f}% hits"
+                  + (f", {filled:,} positions cached)" if filled is not None else ")"))
+        tt = event["transposition_table"]
+        if tt is not None:
+            print(f"Transposition table: {tt['hits']:,} hits, {tt['misses']:,} misses, "
+                  f"{tt['collisions']:,} collisions ({tt['filled']:,}/{tt['size']:,} slots used)")
+
+    def Close(self):
+        pass
+
+
+class RingBufferSink:
+    """Keeps the last `capacity` events in memory (oldest dropped first)."""
+    enabled = True
+
+    def __init__(self, capacity=1024):
+        self.events = collections.deque(maxlen=capacity)
+
+    def Emit(self, event):
+        self.events.append(event)
+
+    def Events(self, kind=None):
+        """The buffered events, optionally only those of one kind."""
+        return [event for event in self.events if kind is None or event["event"] == kind]
+
+    def Close(self):
+        pass
+
+
+class JsonLinesSink:
+    """Appends every event as one JSON object per line to a file."""
+    enabled = True
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "a")
+
+    def Emit(self, event):
+        self.file.write(json.dumps(event) + "\n")
+
+    def Close(self):
+        self.file.close()
+
+
+class TelemetryFanout:
+    """Forwards every event to several sinks."""
+    enabled = True
+
+    def __init__(self, sinks):
+        self.sinks = [sink for sink in sinks if sink.enabled]
+        self.enabled = bool(self.sinks)
+
+    def Emit(self, event):
+        for sink in self.sinks:
+            sink.Emit(event)
+
+    def Close(self):
+        for sink in self.sinks:
+            sink.Close()
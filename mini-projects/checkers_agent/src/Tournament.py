@@ -0,0 +1,256 @@
+import argparse
+import ast
+import json
+import math
+import multiprocessing
+import random
+import time
+
+from SearchToolBox import *
+
+# Engine used for any setting a configuration leaves out
+DEFAULT_ENGINE = {"strategy": "alphabeta_ordering", "max_depth": 5, "time_limit": 1}
+
+# A game still running after this many plies is adjudicated a draw (the
+# repetition and no-progress rules of PositionHistory usually end it first)
+MAX_GAME_PLIES = 200
+
+
+def ParseEngine(text, defaults=DEFAULT_ENGINE):
+    """
+    Parses "strategy=alphabeta,max_depth=6,evaluation=incremental" into an
+    engine configuration. Values are Python literals where possible
+    (numbers, True/False), otherwise strings; any SearchToolBox attribute
+    can be set this way. Settings left out are taken from defaults.
+    """
+    engine = dict(defaults)
+    # "weights" names a JSON file written by SaveEvaluationWeights (see Tuner.py)
+    for item in filter(None, text.split(",")):
+        name, _, value = item.partition("=")
+        try:
+            engine[name.strip()] = ast.literal_eval(value.strip())
+        except (ValueError, SyntaxError):
+            engine[name.strip()] = value.strip()
+    return engine
+
+
+def CreateEngine(engine):
+    """Returns a SearchToolBox set up from an engine configuration."""
+    toolbox = SearchToolBox(engine["time_limit"], engine["max_depth"])
+    toolbox.telemetry = NullSink()
+    for name, value in engine.items():
+        if name == "weights":
+            toolbox.weights = LoadEvaluationWeights(value) if isinstance(value, str) else CheckEvaluationWeights(value)
+        elif name not in ("strategy", "time_limit", "max_depth"):
+            setattr(toolbox, name, value)
+    return toolbox
+
+
+def UsesProcessPool(engine):
+    """Tests if an engine searches with its own process pool (pool workers cannot start one)."""
+    workers = engine.get("workers", multiprocessing.cpu_count())
+    return engine["strategy"] == "parallel" or (engine["strategy"] == "mcts" and workers > 1)
+
+
+def RandomOpening(seed, plies):
+    """Plays `plies` random legal moves from the start position (white first)."""
+    rng = random.Random(seed)
+    board = GameBoard()
+    player = 1
+    for _ in range(plies):
+        moves = board.GetAllPossibleMoves(player)
+        if not moves or board.IsGoalState():
+            break
+        board = board.ApplyMove(rng.choice(moves))
+        player = -player
+    return board, player
+
+
+def PlayGame(board, player, toolboxes, strategies, max_plies, positions=None):
+    """
+    Plays a game from board with player to move until it ends.
+
+    toolboxes and strategies map each side (1 white, -1 black) to its
+    engine. The side to move loses when it has no piece or no legal move
+    left. The game is drawn on the REPETITION_LIMIT-th occurrence of a
+    position, after NO_PROGRESS_PLIES plies without a capture or man move,
+    or at max_plies. Both engines see the position history, so they know
+    which moves repeat. If positions is a list, every position searched
+    is appended to it as (board, player to move).
+
+    Returns (winner, reason, plies, nodes, seconds), winner being None for
+    a draw and nodes and seconds totals per side.
+    """
+    nodes = {1: 0, -1: 0}
+    seconds = {1: 0.0, -1: 0.0}
+    history = PositionHistory(board.hash)
+    winner = None
+    reason = "move limit"
+    plies = 0
+    while plies < max_plies:
+        if not board.HasPieces(player) or not board.GetAllPossibleMoves(player):
+            winner, reason = -player, "no moves" if board.HasPieces(player) else "no pieces"
+            break
+        if history.Repetitions() >= REPETITION_LIMIT - 1:
+            reason = "repetition"
+            break
+        if history.NoProgressPlies() >= NO_PROGRESS_PLIES:
+            reason = "no progress"
+            break
+        if positions is not None:
+            positions.append((board, player))
+        toolbox = toolboxes[player]
+        start = time.perf_counter()
+        move, _ = toolbox.ChooseMove(board, strategies[player], player, history)
+        seconds[player] += time.perf_counter() - start
+        nodes[player] += toolbox.nodes_expanded
+        reversible = board.IsReversibleMove(move)
+        board = board.ApplyMove(move)
+        history.Push(board.hash, reversible)
+        player = -player
+        plies += 1
+    return winner, reason, plies, nodes, seconds
+
+
+def PlayTournamentGame(task):
+    """
+    Plays one game between two engines (see PlayGame) and returns its
+    record. Runs in a pool worker, so the engines emit no search
+    telemetry.
+    """
+    game_index, engines, white_engine, opening_seed, opening_plies, max_plies = task
+    board, player = RandomOpening(opening_seed, opening_plies)
+    sides = {1: white_engine, -1: 1 - white_engine}
+    toolboxes = {side: CreateEngine(engines[index]) for side, index in sides.items()}
+    strategies = {side: engines[index]["strategy"] for side, index in sides.items()}
+    winner, reason, plies, nodes, seconds = PlayGame(board, player, toolboxes, strategies, max_plies)
+    for toolbox in toolboxes.values():
+        toolbox.Close()
+    return {
+        "game": game_index,
+        "white": sides[1],
+        "winner": sides[winner] if winner is not None else None,
+        "reason": reason,
+        "plies": plies,
+        "nodes": {sides[side]: nodes[side] for side in (1, -1)},
+        "seconds": {sides[side]: seconds[side] for side in (1, -1)},
+    }
+
+
+def EloDifference(score):
+    """Elo difference implied by an expected score in (0, 1)."""
+    score = min(max(score, 1e-6), 1 - 1e-6)
+    return -400 * math.log10(1 / score - 1)
+
+
+class Tournament:
+    """
+    Headless self-play match between two engine configurations.
+
+    Games start from random openings of a few plies; each opening is
+    played twice with colours swapped, so neither engine profits from a
+    lucky opening. Games run in parallel over a process pool. The result
+    is reported from engine A's point of view: wins, draws, losses, score,
+    Elo difference with a 95% interval, and the average nodes/second of
+    both engines.
+    """
+    def __init__(self, engine_a, engine_b, games=20, processes=None, opening_plies=4,
+                 max_plies=MAX_GAME_PLIES, seed=2024):
+        self.engines = [engine_a, engine_b]
+        self.games = games
+        self.processes = processes or multiprocessing.cpu_count()
+        self.opening_plies = opening_plies
+        self.max_plies = max_plies
+        self.seed = seed
+        if self.processes > 1 and any(UsesProcessPool(engine) for engine in self.engines):
+            raise ValueError("The parallel strategy, and mcts with workers > 1, start their own processes; "
+                             "run them with processes=1")
+
+    def Tasks(self):
+        """One task per game: pairs of games share an opening with colours swapped."""
+        return [(index, self.engines, index % 2, self.seed + index // 2, self.opening_plies, self.max_plies)
+                for index in range(self.games)]
+
+    def Run(self):
+        """Plays all games and returns the summary (also printed)."""
+        started = time.time()
+        records = []
+        if self.processes > 1:
+            with multiprocessing.Pool(self.processes) as pool:
+                for record in pool.imap_unordered(PlayTournamentGame, self.Tasks()):
+                    records.append(record)
+                    self.PrintGame(record)
+        else:
+            for task in self.Tasks():
+                records.append(PlayTournamentGame(task))
+                self.PrintGame(records[-1])
+        records.sort(key=lambda record: record["game"])
+        summary = self.Summarize(records)
+        summary["elapsed"] = time.time() - started
+        self.PrintSummary(summary)
+        return summary
+
+    def PrintGame(self, record):
+        """One line per finished game."""
+        result = "draw" if record["winner"] is None else "AB"[record["winner"]] + " wins"
+        print(f"  game {record['game'] + 1:>3}: {'AB'[record['white']]} white, {result} "
+              f"({record['reason']}, {record['plies']} plies)")
+
+    def Summarize(self, records):
+        """Win/draw/loss, score, Elo estimate and nodes/second from the game records."""
+        wins = sum(1 for record in records if record["winner"] == 0)
+        losses = sum(1 for record in records if record["winner"] == 1)
+        draws = len(records) - wins - losses
+        games = len(records)
+        score = (wins + 0.5 * draws) / games if games else 0.0
+        # 95% interval from the spread of the per-game scores
+        variance = (wins + 0.25 * draws) / games - score ** 2 if games else 0.0
+        margin = 1.96 * math.sqrt(max(variance, 0.0) / games) if games else 0.0
+        nodes_per_second = []
+        for engine in (0, 1):
+            nodes = sum(record["nodes"][engine] for record in records)
+            seconds = sum(record["seconds"][engine] for record in records)
+            nodes_per_second.append(nodes / seconds if seconds > 0 else 0.0)
+        return {
+            "engines": self.engines,
+            "games": games,
+            "wins": wins,
+            "draws": draws,
+            "losses": losses,
+            "score": score,
+            "elo": EloDifference(score),
+            "elo_interval": [EloDifference(score - margin), EloDifference(score + margin)],
+            "nodes_per_second": nodes_per_second,
+            "records": records,
+        }
+
+    def PrintSummary(self, summary):
+        """Prints the match result."""
+        low, high = summary["elo_interval"]
+        print(f"A: {summary['engines'][0]}")
+        print(f"B: {summary['engines'][1]}")
+        print(f"A vs B: +{summary['wins']} ={summary['draws']} -{summary['losses']} "
+              f"({summary['games']} games, score {summary['score']:.3f})")
+        print(f"Elo difference: {summary['elo']:+.0f} (95%: {low:+.0f} to {high:+.0f})")
+        print(f"Nodes/second: A {summary['nodes_per_second'][0]:,.0f}, B {summary['nodes_per_second'][1]:,.0f}")
+        print(f"Elapsed: {summary['elapsed']:.1f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Self-play match between two engine configurations")
+    parser.add_argument("--a", default="", help='engine A, e.g. "strategy=alphabeta_ordering,max_depth=6,weights=tuned.json"')
+    parser.add_argument("--b", default="", help="engine B, same format")
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--processes", type=int)
+    parser.add_argument("--opening-plies", type=int, default=4)
+    parser.add_argument("--max-plies", type=int, default=MAX_GAME_PLIES)
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--json", help="also write the summary and game records to this file")
+    args = parser.parse_args()
+
+    tournament = Tournament(ParseEngine(args.a), ParseEngine(args.b), args.games, args.processes,
+                            args.opening_plies, args.max_plies, args.seed)
+    result = tournament.Run()
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump(result, output, indent=2)
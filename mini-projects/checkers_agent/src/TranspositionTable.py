@@ -0,0 +1,85 @@
+# Bound types stored with each score
+EXACT = 0        # score is the true minimax value
+LOWER_BOUND = 1  # search failed high: true value >= score
+UPPER_BOUND = 2  # search failed low: true value <= score
+
+# Rough CPython footprint of one stored entry (tuple plus its fields),
+# used to turn the memory cap into a number of slots.
+ENTRY_BYTES = 120
+
+
+class TranspositionTable:
+    """
+    Fixed-size hash table of search results keyed by Zobrist hash.
+
+    Each slot holds one entry (key, depth, score, bound, best_move,
+    generation). The table never grows past the number of slots that fit
+    in memory_mb, and a new entry replaces the resident one when:
+    - the slot is empty or holds the same position
+    - the resident entry is from an older search (generation)
+    - the new entry was searched at least as deep
+
+    Probe statistics:
+    - hits: the position was found
+    - misses: the slot was empty
+    - collisions: the slot held a different position
+    """
+    def __init__(self, memory_mb=16):
+        self.memory_mb = memory_mb
+        self.size = max(1, int(memory_mb * 1024 * 1024) // ENTRY_BYTES)
+        self.slots = [None] * self.size
+        self.generation = 0
+        self.filled = 0
+        self.ResetStatistics()
+
+    def ResetStatistics(self):
+        """Clears the probe counters."""
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+        self.stores = 0
+
+    def NewSearch(self):
+        """Ages existing entries so the next search can replace them first."""
+        self.generation += 1
+
+    def Clear(self):
+        """Removes every entry."""
+        self.slots = [None] * self.size
+        self.filled = 0
+
+    def Probe(self, key):
+        """Returns (depth, score, bound, best_move) stored for key, or None."""
+        entry = self.slots[key % self.size]
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry[0] != key:
+            self.collisions += 1
+            return None
+        self.hits += 1
+        return entry[1:5]
+
+    def Store(self, key, depth, score, bound, best_move):
+        """Stores a search result, applying the replacement policy."""
+        index = key % self.size
+        resident = self.slots[index]
+        if (resident is None or resident[0] == key or resident[5] != self.generation
+                or depth >= resident[1]):
+            if resident is None:
+                self.filled += 1
+            self.slots[index] = (key, depth, score, bound, best_move, self.generation)
+            self.stores += 1
+
+    def Statistics(self):
+        """Returns the probe counters and fill level as a dictionary."""
+        probes = self.hits + self.misses + self.collisions
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "collisions": self.collisions,
+            "stores": self.stores,
+            "hit_rate": self.hits / probes if probes else 0.0,
+            "filled": self.filled,
+            "size": self.size,
+        }
@@ -0,0 +1,195 @@
+import argparse
+import math
+import multiprocessing
+import time
+
+from Tournament import *
+
+# The tuner needs NumPy; the engine itself runs without it
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+# Engine playing the self-play games (weights may name a tuned weights file)
+DEFAULT_SELF_PLAY_ENGINE = {"strategy": "alphabeta_ordering", "max_depth": 3, "time_limit": 1,
+                            "evaluation": "incremental"}
+
+# Every VALIDATION_EVERY-th game is held out to check the fit
+VALIDATION_EVERY = 10
+
+
+def PlaySelfPlayGame(task):
+    """
+    Plays one self-play game (see PlayGame) and returns its quiet positions.
+
+    Positions where the side to move has a capture are left out: their
+    static evaluation is about to change, so they say little about the
+    weights. Returns (game_index, squares, mobility, result) with result
+    from black's point of view (1 win, 0.5 draw, 0 loss).
+    """
+    game_index, engine, opening_seed, opening_plies, max_plies = task
+    board, player = RandomOpening(opening_seed, opening_plies)
+    toolbox = CreateEngine(engine)
+    positions = []
+    winner, _, _, _, _ = PlayGame(board, player, {1: toolbox, -1: toolbox},
+                                  {1: engine["strategy"], -1: engine["strategy"]}, max_plies, positions)
+    toolbox.Close()
+    squares, mobility = [], []
+    for position, to_move in positions:
+        if not position.GetAllPossibleMoves(to_move)[0] >> MOVE_CAPTURE_SHIFT:
+            squares.append(position.SquareVector())
+            mobility.append(position.CountMobility(-1) - position.CountMobility(1))
+    result = 0.5 if winner is None else (1.0 if winner == -1 else 0.0)
+    return game_index, squares, mobility, result
+
+
+def GenerateDataset(path, games=100, engine=DEFAULT_SELF_PLAY_ENGINE, processes=None, opening_plies=6,
+                    max_plies=MAX_GAME_PLIES, seed=7):
+    """
+    Plays self-play games over a process pool and saves their quiet
+    positions, labelled with the game results, to path (.npz):
+    - squares: (N, 64) int8 piece codes
+    - mobility: N values of CountMobility(-1) - CountMobility(1)
+    - results: N game results from black's point of view
+    - games: N game indexes (the validation split is by game)
+    """
+    started = time.time()
+    tasks = [(index, engine, seed + index, opening_plies, max_plies) for index in range(games)]
+    squares, mobility, results, game_indexes = [], [], [], []
+    scores = []
+    with multiprocessing.Pool(processes or multiprocessing.cpu_count()) as pool:
+        for game_index, game_squares, game_mobility, result in pool.imap_unordered(PlaySelfPlayGame, tasks):
+            squares.extend(game_squares)
+            mobility.extend(game_mobility)
+            results.extend([result] * len(game_squares))
+            game_indexes.extend([game_index] * len(game_squares))
+            scores.append(result)
+            print(f"  game {len(scores):>4}/{games}: {len(game_squares):>3} positions, result {result}")
+    np.savez_compressed(path, squares=SquareTensor(squares), mobility=np.array(mobility, dtype=np.int16),
+                        results=np.array(results, dtype=np.float32), games=np.array(game_indexes, dtype=np.int32))
+    print(f"Wrote {len(results):,} positions from {games} games to {path} "
+          f"(black scored {sum(scores) / len(scores):.3f}) in {time.time() - started:.1f}s")
+    return path
+
+
+class TexelTuner:
+    """
+    Fits the evaluation weights to game results (Texel's method).
+
+    The evaluation of a position is mapped to an expected score with the
+    logistic function 1 / (1 + exp(-scale * evaluation)), and the weights
+    minimise the mean squared difference between expected score and game
+    result over the dataset.
+
+    - The features of all positions are computed once (EvaluationFeatures),
+      so the error and its gradient for the whole dataset are a few
+      matrix operations
+    - scale is fitted first, with the starting weights, and the material
+      weight is then kept fixed: scale and weights could otherwise trade
+      off, and the anchor keeps the evaluation on its usual scale (a man
+      is worth 10), which the tablebase scores and the search's windows
+      rely on
+    - Weights are optimised as multiples of their starting values with
+      Adam, so parameters of very different size (material 10, centre
+      0.05) move at the same relative rate
+    - Positions of every VALIDATION_EVERY-th game are held out; the
+      weights with the lowest validation error are returned (early stop)
+    """
+    def __init__(self, path):
+        data = np.load(path)
+        features, endgame = EvaluationFeatures(data["squares"], data["mobility"].astype(np.int64))
+        validation = data["games"] % VALIDATION_EVERY == 0
+        self.train = (features[~validation].astype(np.float64), endgame[~validation], data["results"][~validation])
+        self.validation = (features[validation].astype(np.float64), endgame[validation], data["results"][validation])
+        self.scale = 1.0
+
+    def Predict(self, weights, rows):
+        """Evaluations (before the logistic function) of a (features, endgame, results) split."""
+        features, endgame, _ = rows
+        linear = features @ np.asarray(weights[:5])
+        return linear, np.where(endgame, weights[5], 1.0)
+
+    def Error(self, weights, rows, scale=None):
+        """Mean squared error of the expected scores against the results."""
+        linear, factor = self.Predict(weights, rows)
+        expected = 1 / (1 + np.exp(-(self.scale if scale is None else scale) * linear * factor))
+        return float(np.mean((expected - rows[2]) ** 2))
+
+    def Gradient(self, weights, rows):
+        """Gradient of Error over the weight vector."""
+        features, endgame, results = rows
+        linear, factor = self.Predict(weights, rows)
+        expected = 1 / (1 + np.exp(-self.scale * linear * factor))
+        slope = 2 * (expected - results) * self.scale * expected * (1 - expected) / len(results)
+        gradient = np.empty(6)
+        gradient[:5] = features.T @ (slope * factor)
+        gradient[5] = np.sum(slope * linear * endgame)
+        return gradient
+
+    def FitScale(self, weights, low=1e-3, high=10.0, steps=60):
+        """Golden-section search of the logistic scale (on a log axis) for the given weights."""
+        ratio = (math.sqrt(5) - 1) / 2
+        low, high = math.log(low), math.log(high)
+        for _ in range(steps):
+            left = high - ratio * (high - low)
+            right = low + ratio * (high - low)
+            if self.Error(weights, self.train, math.exp(left)) < self.Error(weights, self.train, math.exp(right)):
+                high = right
+            else:
+                low = left
+        self.scale = math.exp((low + high) / 2)
+        return self.scale
+
+    def Tune(self, weights=DEFAULT_EVALUATION_WEIGHTS, iterations=2000, learning_rate=0.01, check_every=50):
+        """Returns the tuned weight vector, starting from weights."""
+        start = np.array(CheckEvaluationWeights(weights))
+        if not np.all(start):
+            raise ValueError("Every starting weight must be non-zero (weights are tuned as multiples of them)")
+        self.FitScale(start)
+        multiples = np.ones(6)
+        first_moment = np.zeros(6)
+        second_moment = np.zeros(6)
+        best = (self.Error(start, self.validation), start)
+        print(f"Logistic scale {self.scale:.4f}: train error {self.Error(start, self.train):.6f}, "
+              f"validation error {best[0]:.6f} ({len(self.train[2]):,} / {len(self.validation[2]):,} positions)")
+        for iteration in range(1, iterations + 1):
+            gradient = self.Gradient(start * multiples, self.train) * start
+            gradient[0] = 0.0  # Material is the anchor
+            first_moment = 0.9 * first_moment + 0.1 * gradient
+            second_moment = 0.999 * second_moment + 0.001 * gradient ** 2
+            step = (first_moment / (1 - 0.9 ** iteration)) / (np.sqrt(second_moment / (1 - 0.999 ** iteration)) + 1e-12)
+            multiples -= learning_rate * step
+            if iteration % check_every == 0 or iteration == iterations:
+                error = self.Error(start * multiples, self.validation)
+                if error < best[0]:
+                    best = (error, start * multiples)
+        tuned = tuple(float(weight) for weight in best[1])
+        print(f"Tuned: train error {self.Error(tuned, self.train):.6f}, validation error {best[0]:.6f}")
+        for name, old, new in zip(EVALUATION_WEIGHT_NAMES, start, tuned):
+            print(f"  {name:<12} {old:>9.4f} -> {new:>9.4f}")
+        return tuned
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Self-play dataset generation and Texel tuning of the evaluation weights")
+    parser.add_argument("command", choices=["generate", "tune"])
+    parser.add_argument("--data", default="selfplay.npz", help="dataset written by generate and read by tune")
+    parser.add_argument("--games", type=int, default=100, help="generate: self-play games")
+    parser.add_argument("--engine", default="", help='generate: engine, e.g. "max_depth=4,weights=tuned.json"')
+    parser.add_argument("--processes", type=int)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--weights", help="tune: starting weights file (default: the hand-picked weights)")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--learning-rate", type=float, default=0.01)
+    parser.add_argument("--output", default=DEFAULT_WEIGHTS_PATH, help="tune: weights file to write")
+    args = parser.parse_args()
+    if not NUMPY_AVAILABLE:
+        parser.error("the tuner needs NumPy")
+
+    if args.command == "generate":
+        engine = ParseEngine(args.engine, DEFAULT_SELF_PLAY_ENGINE)
+        GenerateDataset(args.data, args.games, engine, args.processes, seed=args.seed)
+    else:
+        start = LoadEvaluationWeights(args.weights) if args.weights else DEFAULT_EVALUATION_WEIGHTS
+        tuned = TexelTuner(args.data).Tune(start, args.iterations, args.learning_rate)
+        SaveEvaluationWeights(args.output, tuned)
+        print(f"Wrote {args.output}")
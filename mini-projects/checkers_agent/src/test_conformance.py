@@ -0,0 +1,18 @@
+from ConformanceCheck import *
+from Benchmarks import Perft
+
+# Move sequences from the initial position, depth 1..6 (see README)
+PERFT_COUNTS = (7, 49, 302, 1469, 7361, 36768)
+
+
+def test_bitboard_conforms_to_gameboard():
+    """BitBoard matches GameBoard on the seeded corpus used by ConformanceCheck.py."""
+    check = ConformanceCheck()
+    assert check.Run(), check.mismatches[:10]
+
+
+def test_perft_counts():
+    """Both boards generate, make and unmake moves to the known perft counts."""
+    for board_class in (GameBoard, BitBoard):
+        counts = tuple(Perft(board_class(), depth) for depth in range(1, len(PERFT_COUNTS) + 1))
+        assert counts == PERFT_COUNTS, board_class.__name__
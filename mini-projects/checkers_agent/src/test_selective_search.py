@@ -0,0 +1,14 @@
+from Benchmarks import *
+
+# Largest root score change selective search may cause (half a man)
+MAX_SCORE_CHANGE = 5.0
+
+
+def test_razoring_keeps_root_score():
+    """Razoring does not move the root score of the benchmark positions at depths 5 and 7."""
+    benchmarks = Benchmarks()
+    for name, rows in benchmarks.positions.items():
+        for depth in (5, 7):
+            off = benchmarks.RunSearch(ParsePosition(rows), "alphabeta_ordering", depth)
+            on = benchmarks.RunSearch(ParsePosition(rows), "alphabeta_ordering", depth, use_razoring=True)
+            assert abs(on["score"] - off["score"]) <= MAX_SCORE_CHANGE, (name, depth, off["score"], on["score"])